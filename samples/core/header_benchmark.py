@@ -0,0 +1,70 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+Header blocks composed per second by the previous per-request User-Agent composition
+and by the static header block cached on the client.
+
+    python -m samples.core.header_benchmark [seconds]
+"""
+
+import sys
+import time
+
+import webull.core.headers as hd
+from webull.core.client import ApiClient
+from webull.core.request import ApiRequest
+
+
+def _rate(compose, seconds):
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            compose()
+        count += 100
+    return count / seconds
+
+
+def _compose_per_request(api_client, request):
+    ua = ApiClient.user_agent_header()
+    merged = api_client.merge_user_agent(ApiClient.default_user_agent(), api_client.handle_extra_agent(request))
+    for k, v in merged.items():
+        ua += ' %s/%s' % (k, v)
+    return {'User-Agent': ua, hd.CLIENT_SOURCE: api_client._get_client_source()}
+
+
+def _compose_static(api_client, request):
+    headers = {}
+    headers.update(api_client._get_static_headers())
+    if request.has_user_agent():
+        headers['User-Agent'] = api_client._build_ua(request)
+    return headers
+
+
+def run(seconds):
+    api_client = ApiClient("app_key", "app_secret", "us")
+    api_client.append_user_agent("strategy", "1.0")
+    request = ApiRequest("/openapi/market-data/stock/snapshot", method="GET", body_params=None)
+    before = _rate(lambda: _compose_per_request(api_client, request), seconds)
+    after = _rate(lambda: _compose_static(api_client, request), seconds)
+    print("%14s %14s %8s" % ("per request/s", "static/s", "speedup"))
+    print("%14.0f %14.0f %7.2fx" % (before, after, after / before))
+    api_client.close()
+
+
+if __name__ == '__main__':
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else 2.0)
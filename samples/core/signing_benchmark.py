@@ -0,0 +1,65 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+Requests signed per second by default_signature_composer.calc_signature
+and by the SigningEngine of a client, on a query request and on an order body.
+
+    python -m samples.core.signing_benchmark [seconds]
+"""
+
+import sys
+import time
+
+from webull.core.auth.algorithm import sha_hmac1
+from webull.core.auth.composer import default_signature_composer as sc
+from webull.core.auth.composer.signing_engine import SigningEngine
+
+APP_KEY = "app_key"
+APP_SECRET = "app_secret"
+
+CASES = [
+    ("snapshot", "api.webull.com", "/openapi/market-data/stock/snapshot",
+     {"symbols": "AAPL,TSLA,MSFT", "category": "US_STOCK", "extend_hour_required": "true"}, None),
+    ("place order", "api.webull.com", "/openapi/trade/order/place", None,
+     {"account_id": "ACCOUNT", "new_orders": [{"client_order_id": "c1", "symbol": "AAPL", "instrument_type": "EQUITY",
+                                               "market": "US", "order_type": "LIMIT", "limit_price": "189.71",
+                                               "quantity": "100", "side": "BUY", "time_in_force": "DAY"}]}),
+]
+
+
+def _rate(sign, seconds):
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            sign()
+        count += 100
+    return count / seconds
+
+
+def run(seconds):
+    engine = SigningEngine(APP_KEY, APP_SECRET)
+    print("%-12s %14s %14s %8s" % ("request", "composer/s", "engine/s", "speedup"))
+    for name, host, uri, queries, body in CASES:
+        before = _rate(lambda: sc.calc_signature({}, host, uri, queries, body, APP_KEY, APP_SECRET, sha_hmac1),
+                       seconds)
+        after = _rate(lambda: engine.sign({}, host, uri, queries, body), seconds)
+        print("%-12s %14.0f %14.0f %7.2fx" % (name, before, after, after / before))
+
+
+if __name__ == '__main__':
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else 2.0)
@@ -0,0 +1,102 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+Decode cost per pushed message of the streaming decoders, for every numeric mode,
+eager and lazy results. Runs offline on synthetic protobuf payloads.
+
+    python -m samples.data.streaming_decode_benchmark [messages]
+"""
+
+import sys
+import timeit
+
+from webull.data.quotes.subscribe import message_pb2
+from webull.data.quotes.subscribe.numeric_mode import NUMERIC_MODE_DECIMAL, NUMERIC_MODE_FLOAT, NUMERIC_MODE_RAW_STR
+from webull.data.quotes.subscribe.quote_decoder import QuoteDecoder
+from webull.data.quotes.subscribe.snapshot_decoder import SnapshotDecoder
+from webull.data.quotes.subscribe.tick_decoder import TickDecoder
+
+
+def _basic(pb):
+    pb.basic.symbol = "AAPL"
+    pb.basic.instrument_id = "913256135"
+    pb.basic.timestamp = "1700000000000"
+    pb.basic.trading_session = "CORE"
+
+
+def snapshot_payload():
+    pb = message_pb2.Snapshot()
+    _basic(pb)
+    pb.trade_time = "1700000000000"
+    for i, name in enumerate(["price", "open", "high", "low", "pre_close", "volume", "change", "change_ratio",
+                              "ext_price", "ext_high", "ext_low", "ext_volume", "ext_change", "ext_change_ratio"]):
+        setattr(pb, name, "%d.%02d" % (180 + i, i))
+    return pb.SerializeToString()
+
+
+def quote_payload(depth=10):
+    pb = message_pb2.Quote()
+    _basic(pb)
+    for i in range(depth):
+        pb.asks.add(price="189.%02d" % (72 + i), size=str(100 * (i + 1)))
+        pb.bids.add(price="189.%02d" % (70 - i), size=str(100 * (i + 1)))
+    return pb.SerializeToString()
+
+
+def tick_payload():
+    pb = message_pb2.Tick()
+    _basic(pb)
+    pb.time = "1700000000001"
+    pb.price = "189.71"
+    pb.volume = "10"
+    pb.side = "B"
+    return pb.SerializeToString()
+
+
+_GETTERS = {}
+
+
+def _touch(result):
+    # read every value, so the lazy results pay their conversions too
+    getters = _GETTERS.get(type(result))
+    if getters is None:
+        getters = [getattr(type(result), name) for name in dir(result) if name.startswith("get_")]
+        _GETTERS[type(result)] = getters
+    for getter in getters:
+        value = getter(result)
+        if isinstance(value, list):
+            for item in value:
+                _touch(item)
+
+
+def run(number):
+    cases = [("snapshot", SnapshotDecoder, snapshot_payload()),
+             ("quote", QuoteDecoder, quote_payload()),
+             ("tick", TickDecoder, tick_payload())]
+    print("%-9s %-8s %-6s %12s %12s" % ("payload", "mode", "lazy", "parse us", "parse+read"))
+    for payload_name, decoder_class, payload in cases:
+        for numeric_mode in (NUMERIC_MODE_DECIMAL, NUMERIC_MODE_FLOAT, NUMERIC_MODE_RAW_STR):
+            for lazy in (False, True):
+                decoder = decoder_class(lazy=lazy, numeric_mode=numeric_mode)
+                parse = timeit.timeit(lambda: decoder.parse(payload), number=number)
+                parse_read = timeit.timeit(lambda: _touch(decoder.parse(payload)), number=number)
+                print("%-9s %-8s %-6s %12.2f %12.2f" % (payload_name, numeric_mode, lazy,
+                                                         parse / number * 1e6, parse_read / number * 1e6))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
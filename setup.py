@@ -38,7 +38,14 @@ requires = [
 extras_require = {
     "dev": [
         "grpcio-tools>=1.60,<1.70",
-    ]
+    ],
+    "numpy": [
+        "numpy",
+    ],
+    "pandas": [
+        "numpy",
+        "pandas",
+    ],
 }
 
 setup_args = {
@@ -54,7 +61,8 @@ setup_args = {
     'package_data': {'webull.core': ['data/*.json', '*.pem', "vendored/*.pem"],
                      'webull.core.vendored.requests.packages.certifi': ['cacert.pem']},
     'platforms': 'any',
-    'install_requires': requires 
+    'install_requires': requires,
+    'extras_require': extras_require
 }
 
 setup(name='webull-openapi-python-sdk', **setup_args)
\ No newline at end of file
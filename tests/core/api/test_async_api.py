@@ -0,0 +1,87 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import time
+import unittest
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.async_client import AsyncApiClient
+from webull.core.exception.exceptions import ServerException
+from webull.data.async_data_client import AsyncDataClient
+from webull.data.common.category import Category
+from webull.data.data_client import DataClient
+from webull.trade.async_trade_client import AsyncTradeClient
+from webull.trade.trade_client import TradeClient
+
+
+def _handler(method, path, query, body):
+    if path.endswith("/snapshot"):
+        return 200, [{"symbol": s} for s in query["symbols"].split(",")], 0.2
+    if path.endswith("/quotes"):
+        return 500, {"error_code": "INTERNAL_ERROR", "message": "boom"}
+    return 200, {"token_check_enabled": False}
+
+
+class TestAsyncApiClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(_handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def _new_client(self, **kwargs):
+        api_client = AsyncApiClient("app_key", "app_secret", "us", port=self.server.port, **kwargs)
+        api_client.add_endpoint("us", LOCAL_ENDPOINT)
+        api_client.set_stream_logger()
+        return api_client
+
+    def test_concurrent_requests(self):
+        api_client = self._new_client(max_concurrency=20)
+        data_client = AsyncDataClient(api_client)
+
+        async def run():
+            return await asyncio.gather(*[
+                data_client.market_data.get_snapshot(["S%d" % i], Category.US_STOCK.name) for i in range(20)])
+
+        start = time.monotonic()
+        responses = asyncio.run(run())
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual([r.json()[0]["symbol"] for r in responses], ["S%d" % i for i in range(20)])
+        api_client.close()
+
+    def test_retry_with_async_backoff(self):
+        api_client = self._new_client(auto_retry=True, max_retry_num=2)
+        data_client = AsyncDataClient(api_client)
+
+        async def run():
+            with self.assertRaises(ServerException):
+                await data_client.market_data.get_quotes("AAPL", Category.US_STOCK.name)
+
+        before = len([r for r in self.server.requests if r[1].endswith("/quotes")])
+        asyncio.run(run())
+        after = len([r for r in self.server.requests if r[1].endswith("/quotes")])
+        self.assertEqual(after - before, 3)
+        api_client.close()
+
+    def test_facades_match_the_blocking_clients(self):
+        api_client = self._new_client()
+        blocking_client = api_client.blocking_client()
+        data_client = AsyncDataClient(api_client)
+        self.assertEqual(sorted(vars(data_client)), sorted(vars(DataClient(blocking_client))))
+        self.assertIsNone(data_client.bar_backfill)
+        self.assertEqual(sorted(vars(AsyncTradeClient(api_client))), sorted(vars(TradeClient(blocking_client))))
+        api_client.close()
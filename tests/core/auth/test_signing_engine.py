@@ -0,0 +1,60 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from unittest.mock import patch
+
+import webull.core.headers as hd
+from webull.core.auth.composer import default_signature_composer as sc
+from webull.core.auth.composer.signing_engine import SigningEngine
+from webull.core.auth.algorithm import sha_hmac1
+
+TIMESTAMP = "2022-01-04T03:55:31Z"
+NONCE = "5b3c9b0e-7d6e-4f49-9b0a-1b2c3d4e5f60"
+
+CASES = [
+    ("api.webull.com", "/openapi/market-data/stock/snapshot", {"symbols": "AAPL,TSLA", "category": "US_STOCK"}, None),
+    ("api.webull.com", "/openapi/account/list", {}, None),
+    ("us-openapi-alb.example.com", "/openapi/trade/order/place", None,
+     {"account_id": "A1", "new_orders": [{"symbol": "AAPL", "qty": "1", "side": "BUY", "memo": "é"}]}),
+    ("us-openapi-alb.example.com", "", {"b": 2, "a": "1"}, {"k": "v"}),
+    # a query named as a sign header is merged into it
+    ("api.webull.com", "/openapi/x", {"x-app-key": "dup", "z": "1"}, None),
+]
+
+
+class TestSigningEngine(unittest.TestCase):
+
+    @patch("webull.core.auth.composer.signing_engine.new_nonce", return_value=NONCE)
+    @patch("webull.core.utils.common.get_uuid", return_value=NONCE)
+    @patch("webull.core.utils.common.get_iso_8601_date", return_value=TIMESTAMP)
+    def test_same_signature_as_composer(self, *_):
+        engine = SigningEngine("app_key", "app_secret")
+        engine._get_timestamp = lambda: TIMESTAMP
+        for host, uri, queries, body in CASES:
+            expected_headers = {}
+            expected = sc.calc_signature(expected_headers, host, uri, queries, body, "app_key", "app_secret",
+                                         sha_hmac1)
+            headers = {}
+            for _ in range(2):
+                self.assertEqual(engine.sign(headers, host, uri, queries, body), expected, uri)
+            self.assertEqual(headers, expected_headers)
+
+    def test_nonce_and_timestamp(self):
+        engine = SigningEngine("app_key", "app_secret")
+        first, second = {}, {}
+        engine.sign(first, "api.webull.com", "/a", None, None)
+        engine.sign(second, "api.webull.com", "/a", None, None)
+        self.assertNotEqual(first[hd.NONCE], second[hd.NONCE])
+        self.assertEqual(len(first[hd.NONCE]), 36)
+        self.assertRegex(first[hd.TIMESTAMP], r"^\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ$")
@@ -0,0 +1,141 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import unittest
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.cache.response_cache import ResponseCache
+from webull.core.client import ApiClient
+from webull.core.exception.exceptions import ClientException, ServerException
+from webull.core.http.api_response import ApiResponse
+from webull.core.request import ApiRequest
+from webull.core.utils import json_backend
+from webull.trade.request.get_trade_calendar_request import TradeCalendarRequest
+
+
+class _FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _handler(method, path, query, body):
+    if query.get("market") == "BAD":
+        return 400, {"error_code": "INVALID_PARAMETER", "message": "bad market"}
+    return 200, {"path": path, "query": query}
+
+
+def _response(body):
+    return ApiResponse.from_content(200, {}, json.dumps(body).encode("utf-8"), json_backend.get_json_backend())
+
+
+def _calendar_request(market="US"):
+    request = TradeCalendarRequest()
+    request.set_market(market)
+    request.set_start("2024-01-01")
+    request.set_end("2024-01-31")
+    request.set_endpoint(LOCAL_ENDPOINT)
+    return request
+
+
+class TestResponseCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(_handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def _sent(self, path):
+        return len([r for r in self.server.requests if r[1] == path])
+
+    def test_reference_responses_cached(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, response_cache=True)
+        before = self._sent("/trade/calendar")
+        first = api_client.get_response(_calendar_request())
+        second = api_client.get_response(_calendar_request())
+        self.assertIsNot(first, second)
+        self.assertEqual(first.json(), second.json())
+        api_client.get_response(_calendar_request("HK"))
+        self.assertEqual(self._sent("/trade/calendar") - before, 2)
+
+        before = self._sent("/snapshot")
+        for _ in range(2):
+            request = ApiRequest("/snapshot", method="GET", body_params=None)
+            request.set_endpoint(LOCAL_ENDPOINT)
+            api_client.get_response(request)
+        self.assertEqual(self._sent("/snapshot") - before, 2)
+
+        stats = api_client.get_response_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']), (1, 2, 2))
+        self.assertEqual(stats['paths']['/trade/calendar']['hits'], 1)
+        api_client.close()
+
+    def test_hits_do_not_share_the_body(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, response_cache=True)
+        api_client.get_response(_calendar_request()).json()["query"]["market"] = "CHANGED"
+        hit = api_client.get_response(_calendar_request())
+        hit.json()["path"] = "/changed"
+        hit.json().clear()
+        self.assertEqual(api_client.get_response(_calendar_request()).json()["query"]["market"], "US")
+        self.assertEqual(api_client.get_response(_calendar_request()).json()["path"], "/trade/calendar")
+        api_client.close()
+
+    def test_errors_not_cached(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, response_cache=True)
+        before = self._sent("/trade/calendar")
+        for _ in range(2):
+            with self.assertRaises(ServerException):
+                api_client.get_response(_calendar_request("BAD"))
+        self.assertEqual(self._sent("/trade/calendar") - before, 2)
+        api_client.close()
+
+    def test_invalidate(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, response_cache=True)
+        api_client.get_response(_calendar_request())
+        api_client.get_response(_calendar_request("HK"))
+        self.assertEqual(api_client.invalidate_response_cache("/trade/instrument"), 0)
+        self.assertEqual(api_client.invalidate_response_cache("/trade/calendar"), 2)
+        before = self._sent("/trade/calendar")
+        api_client.get_response(_calendar_request())
+        self.assertEqual(self._sent("/trade/calendar") - before, 1)
+        self.assertEqual(api_client.invalidate_response_cache(), 1)
+        api_client.close()
+
+    def test_ttl_and_lru(self):
+        timer = _FakeTimer()
+        cache = ResponseCache({"/a": 10, "/b": 100}, maxsize=2, timer=timer)
+        cache.put((None, "/a", None, ()), _response("a"))
+        cache.put((None, "/b", None, ()), _response("b"))
+        timer.now = 11
+        self.assertIsNone(cache.get((None, "/a", None, ())))
+        self.assertEqual(cache.get((None, "/b", None, ())).json(), "b")
+
+        cache.put((None, "/b", None, (("k", "1"),)), _response("b1"))
+        cache.get((None, "/b", None, ()))
+        cache.put((None, "/b", None, (("k", "2"),)), _response("b2"))
+        self.assertEqual(cache.get((None, "/b", None, ())).json(), "b")
+        self.assertIsNone(cache.get((None, "/b", None, (("k", "1"),))))
+        self.assertEqual(cache.get_stats()['evictions'], 1)
+
+        cache.put((None, "/c", None, ()), _response("c"))
+        self.assertIsNone(cache.get((None, "/c", None, ())))
+        cache.set_ttl("/a", None)
+        self.assertNotIn("/a", cache.get_ttls())
+        with self.assertRaises(ClientException):
+            cache.set_ttl("/a", 0)
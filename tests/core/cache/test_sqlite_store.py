@@ -0,0 +1,152 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.async_client import AsyncApiClient
+from webull.core.cache.response_cache import ResponseCache
+from webull.core.cache.sqlite_store import SqliteResponseStore
+from webull.core.client import ApiClient
+from webull.trade.request.get_trade_calendar_request import TradeCalendarRequest
+
+_KEY = ("us", "/trade/calendar", "v2", (("market", "US"),))
+
+
+class _FakeTimer:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _calendar_request():
+    request = TradeCalendarRequest()
+    request.set_market("US")
+    request.set_start("2024-01-01")
+    request.set_end("2024-01-31")
+    request.set_endpoint(LOCAL_ENDPOINT)
+    return request
+
+
+class TestSqliteResponseStore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.version = 0
+
+        def handler(method, path, query, body):
+            return 200, {"version": cls.version}
+
+        cls.server = LocalServer(handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "cache", "reference.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _sent(self):
+        return len([r for r in self.server.requests if r[1] == "/trade/calendar"])
+
+    def test_store_validity_window(self):
+        timer = _FakeTimer(1000.0)
+        store = SqliteResponseStore(self.path, validity_seconds=60, timer=timer)
+        store.save(_KEY, 200, {"Content-Type": "application/json"}, b'{"a": 1}')
+        stored = store.load(_KEY)
+        self.assertEqual((stored.status, stored.headers["Content-Type"], stored.body), (200, "application/json",
+                                                                                         b'{"a": 1}'))
+        timer.now = 1060.0
+        self.assertIsNone(store.load(_KEY))
+        self.assertEqual(store.purge(), 1)
+        self.assertEqual(store.get_size(), 0)
+        store.close()
+
+    def test_warm_start_from_disk(self):
+        TestSqliteResponseStore.version = 1
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        api_client.enable_reference_cache(self.path)
+        before = self._sent()
+        self.assertEqual(api_client.get_response(_calendar_request()).json(), {"version": 1})
+        api_client.get_response_cache().get_store().close()
+
+        restarted = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        restarted.enable_reference_cache(self.path)
+        response = restarted.get_response(_calendar_request())
+        self.assertEqual(response.json(), {"version": 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._sent() - before, 1)
+        stats = restarted.get_response_cache_stats()
+        self.assertEqual((stats['disk_hits'], stats['hits']), (1, 1))
+        restarted.get_response(_calendar_request())
+        self.assertEqual(restarted.get_response_cache_stats()['disk_hits'], 1)
+        restarted.get_response_cache().get_store().close()
+
+    def test_async_client_store_off_the_loop(self):
+        TestSqliteResponseStore.version = 3
+        api_client = AsyncApiClient("app_key", "app_secret", "us", port=self.server.port)
+        store = api_client.enable_reference_cache(self.path).get_store()
+        threads = []
+        load, save = store.load, store.save
+
+        def recorded(func):
+            def call(*args):
+                threads.append(threading.current_thread())
+                return func(*args)
+            return call
+
+        store.load, store.save = recorded(load), recorded(save)
+
+        async def run():
+            first = await api_client.get_response(_calendar_request())
+            second = await api_client.get_response(_calendar_request())
+            return threading.current_thread(), first.json(), second.json()
+
+        loop_thread, first, second = asyncio.run(run())
+        self.assertEqual((first, second), ({"version": 3}, {"version": 3}))
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(loop_thread, threads)
+        store.close()
+        api_client.close()
+
+    def test_stale_response_refreshed_in_background(self):
+        timer = _FakeTimer(time.time() - 100)
+        store = SqliteResponseStore(self.path, timer=timer)
+        response_cache = ResponseCache({"/trade/calendar": 10})
+        store.save(response_cache.get_key(_calendar_request()), 200, {}, b'{"version": 0}')
+        store.close()
+        TestSqliteResponseStore.version = 2
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, response_cache=response_cache)
+        api_client.enable_reference_cache(self.path)
+        before = self._sent()
+        self.assertEqual(api_client.get_response(_calendar_request()).json(), {"version": 0})
+        deadline = time.monotonic() + 5
+        while api_client.get_response_cache_stats()['size'] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(api_client.get_response(_calendar_request()).json(), {"version": 2})
+        self.assertEqual(self._sent() - before, 1)
+        stats = api_client.get_response_cache_stats()
+        self.assertEqual((stats['stale_hits'], stats['refreshes']), (1, 1))
+        api_client.get_response_cache().get_store().close()
@@ -0,0 +1,80 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import unittest
+from unittest.mock import patch
+
+from requests import Response
+from requests.exceptions import JSONDecodeError
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.client import ApiClient
+from webull.core.http.api_response import ApiResponse
+from webull.core.exception.exceptions import ServerException
+from webull.core.request import ApiRequest
+from webull.core.utils import json_backend
+
+
+def _handler(method, path, query, body):
+    if path == "/error":
+        return 417, {"error_code": "INVALID_SYMBOL", "message": "bad symbol"}
+    return 200, [{"symbol": "S%d" % i, "price": "1.%d" % i} for i in range(1000)]
+
+
+class TestApiResponse(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(_handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def _get(self, api_client, path):
+        request = ApiRequest(path, method="GET", body_params=None)
+        request.set_endpoint(LOCAL_ENDPOINT)
+        return api_client.get_response(request)
+
+    def test_body_parsed_once(self):
+        backends = [None] + ([json_backend.JSON_BACKEND_ORJSON] if json_backend.orjson is not None else [])
+        for backend_name in backends:
+            api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, json_backend=backend_name)
+            backend = api_client.get_json_backend()
+            with patch.object(backend, "loads", wraps=backend.loads) as loads:
+                response = self._get(api_client, "/instruments")
+                rows = response.json()
+                self.assertIs(response.json(), rows)
+            self.assertEqual(loads.call_count, 1)
+            self.assertIsInstance(response, Response)
+            self.assertEqual(len(rows), 1000)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(json.loads(response.get_raw_bytes()), rows)
+            api_client.close()
+
+    def test_error_detection(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        with self.assertRaises(ServerException) as context:
+            self._get(api_client, "/error")
+        self.assertEqual(context.exception.get_error_code(), "INVALID_SYMBOL")
+        api_client.close()
+
+    def test_invalid_body_error_type(self):
+        backends = [json_backend.get_json_backend()]
+        if json_backend.orjson is not None:
+            backends.append(json_backend.get_json_backend(json_backend.JSON_BACKEND_ORJSON))
+        for backend in backends:
+            response = ApiResponse.from_content(200, {}, b"{not json", backend)
+            self.assertRaises(JSONDecodeError, response.json)
+            self.assertRaises(JSONDecodeError, response.json, parse_float=float)
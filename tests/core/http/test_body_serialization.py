@@ -0,0 +1,111 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import dataclasses
+import datetime
+import enum
+import json
+import unittest
+import uuid
+from unittest.mock import patch
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.auth.algorithm import sha_hmac1
+from webull.core.auth.composer import default_signature_composer as sc
+from webull.core.client import ApiClient
+from webull.core.request import ApiRequest
+from webull.core.utils import common, json_backend
+
+PAYLOADS = [
+    {"account_id": "A1", "new_orders": [{"symbol": "AAPL", "qty": "1", "limit_price": "189.71", "memo": "买入 é"}]},
+    {"a": 1, "b": 2.5, "c": True, "d": None, "e": [1e16, 1e-05, 0.1], "f": "1e5", "g": 2 ** 70},
+    {1: "int key", "nested": {"k": [" ", "\x1f", "\"\\/"]}},
+    [],
+]
+
+
+class _Side(enum.Enum):
+    BUY = "BUY"
+
+
+class _Qty(enum.IntEnum):
+    ONE = 1
+
+
+@dataclasses.dataclass
+class _Leg:
+    symbol: str
+
+
+# payloads orjson encodes natively and json does not, or its own way
+TYPED_PAYLOADS = [
+    {"side": _Side.BUY},
+    {"qty": _Qty.ONE, "legs": [(_Qty.ONE, "x")]},
+    {"time": datetime.datetime(2024, 1, 2, 3, 4, 5)},
+    {"date": datetime.date(2024, 1, 2)},
+    {"id": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+    {"legs": [_Leg("AAPL")]},
+]
+
+
+class TestBodySerialization(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_backends_are_byte_identical(self):
+        backends = [json_backend.get_json_backend()]
+        if json_backend.orjson is not None:
+            backends.append(json_backend.get_json_backend(json_backend.JSON_BACKEND_ORJSON))
+        for payload in PAYLOADS:
+            expected = common.json_dumps_compact(payload).encode("utf-8")
+            for backend in backends:
+                self.assertEqual(backend.dumps_compact(payload), expected, backend.name)
+
+    @unittest.skipIf(json_backend.orjson is None, "orjson is not installed")
+    def test_orjson_parity_of_typed_values(self):
+        backend = json_backend.get_json_backend(json_backend.JSON_BACKEND_ORJSON)
+        for payload in TYPED_PAYLOADS:
+            try:
+                expected = common.json_dumps_compact(payload).encode("utf-8")
+            except TypeError:
+                self.assertRaises(TypeError, backend.dumps_compact, payload)
+                continue
+            self.assertEqual(backend.dumps_compact(payload), expected, payload)
+
+    def test_body_serialized_once(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        request = ApiRequest("/openapi/trade/order/place", method="POST", body_params=PAYLOADS[0])
+        request.set_endpoint(LOCAL_ENDPOINT)
+        with patch.object(common, "json_dumps_compact", wraps=common.json_dumps_compact) as dumps:
+            api_client.get_response(request)
+        self.assertEqual(dumps.call_count, 1)
+        method, path, query, body, headers = self.server.requests[-1]
+        self.assertEqual(body, common.json_dumps_compact(PAYLOADS[0]).encode("utf-8"))
+        self.assertEqual(json.loads(body), PAYLOADS[0])
+        self.assertEqual(int(headers["Content-Length"]), len(body))
+        api_client.close()
+
+    def test_signature_of_body_content(self):
+        body = PAYLOADS[0]
+        with patch("webull.core.utils.common.get_uuid", return_value="nonce"), \
+                patch("webull.core.utils.common.get_iso_8601_date", return_value="2022-01-04T03:55:31Z"):
+            expected = sc.calc_signature({}, "api.webull.com", "/p", None, body, "k", "s", sha_hmac1)
+            actual = sc.calc_signature({}, "api.webull.com", "/p", None, body, "k", "s", sha_hmac1,
+                                       common.json_dumps_compact(body).encode("utf-8"))
+        self.assertEqual(actual, expected)
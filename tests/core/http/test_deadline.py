@@ -0,0 +1,109 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+import unittest
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.client import ApiClient
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException, ServerException
+from webull.core.ratelimit.rate_limiter import TokenBucketRateLimiter
+from webull.core.request import ApiRequest
+from webull.core.retry.retry_policy_context import RetryPolicyContext
+
+
+def _handler(method, path, query, body):
+    if path == "/ok":
+        return 200, {"ok": True}
+    if path == "/slow":
+        return 200, {"ok": True}, 1.5
+    return 500, {"error_code": "INTERNAL_ERROR", "message": "boom"}, 0.2
+
+
+def _request(path):
+    request = ApiRequest(path, method="GET", body_params=None)
+    request.set_endpoint(LOCAL_ENDPOINT)
+    return request
+
+
+class TestDeadline(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(_handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def _sent(self, path):
+        return len([r for r in self.server.requests if r[1] == path])
+
+    def test_retries_stop_at_deadline(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, auto_retry=True,
+                               max_retry_num=10, total_timeout=0.8)
+        before = self._sent("/error")
+        start = time.monotonic()
+        with self.assertRaises(ServerException):
+            api_client.get_response(_request("/error"))
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertLess(self._sent("/error") - before, 4)
+        api_client.close()
+
+    def test_attempt_timeout_shrunk(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, timeout=10)
+        request = _request("/slow")
+        request.set_total_timeout(0.3)
+        start = time.monotonic()
+        with self.assertRaises(ClientException) as context:
+            api_client.get_response(request)
+        self.assertEqual(context.exception.get_error_code(), error_code.SDK_HTTP_ERROR)
+        self.assertLess(time.monotonic() - start, 1.0)
+        api_client.close()
+
+    def test_rate_limit_wait_bounded_by_deadline(self):
+        rate_limiter = TokenBucketRateLimiter(rules={"/ok": (0.5, 1)})
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, rate_limiter=rate_limiter)
+        api_client.get_response(_request("/ok"))
+        before = self._sent("/ok")
+        request = _request("/ok")
+        request.set_total_timeout(0.3)
+        start = time.monotonic()
+        with self.assertRaises(ClientException) as context:
+            api_client.get_response(request)
+        self.assertEqual(context.exception.get_error_code(), error_code.SDK_DEADLINE_EXCEEDED)
+        self.assertLess(time.monotonic() - start, 0.2)
+        self.assertEqual(self._sent("/ok"), before)
+        # the reservation was given back, the next request waits for the refill only
+        stats = rate_limiter.get_stats()["/ok"]
+        self.assertEqual((stats["acquired"], stats["cancelled"]), (1, 1))
+        self.assertLessEqual(rate_limiter.reserve(_request("/ok")), 2.0)
+        api_client.close()
+
+    def test_deadline_exceeded_before_attempt(self):
+        self.assertIsNone(ApiClient._get_attempt_timeouts(time.monotonic() - 1, 10, 5))
+        self.assertEqual(ApiClient._get_attempt_timeouts(None, 10, 5), (10, 5))
+        read_timeout, connect_timeout = ApiClient._get_attempt_timeouts(time.monotonic() + 2, 10, 1)
+        self.assertLessEqual(read_timeout, 2)
+        self.assertEqual(connect_timeout, 1)
+        status, headers, body, exception, response = ApiClient._deadline_exceeded(_request("/error"), 2)
+        self.assertEqual(exception.get_error_code(), error_code.SDK_DEADLINE_EXCEEDED)
+
+    def test_context_remaining_budget(self):
+        context = RetryPolicyContext(_request("/error"), None, 0, 500)
+        self.assertIsNone(context.get_remaining_seconds())
+        self.assertTrue(context.has_time_for_retry(60))
+        context = RetryPolicyContext(_request("/error"), None, 0, 500, time.monotonic() + 1)
+        self.assertTrue(context.has_time_for_retry(0.5))
+        self.assertFalse(context.has_time_for_retry(0.95))
@@ -0,0 +1,120 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+import unittest
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.client import ApiClient
+from webull.core.http.hedging import Hedger, LatencyWindow
+from webull.core.ratelimit.rate_limiter import TokenBucketRateLimiter
+from webull.core.request import ApiRequest
+
+_PATH = "/openapi/market-data/stock/snapshot"
+
+
+class _SlowFirstHandler:
+    """Answers every request fast, except the next one after slow_next is set."""
+
+    def __init__(self):
+        self.slow_next = False
+        self._lock = threading.Lock()
+
+    def __call__(self, method, path, query, body):
+        with self._lock:
+            slow, self.slow_next = self.slow_next, False
+        return 200, {"nonce": query.get("n")}, 1.0 if slow else 0.01
+
+
+def _request(path=_PATH):
+    request = ApiRequest(path, method="GET", query_params={"symbols": "AAPL"}, body_params=None)
+    request.set_endpoint(LOCAL_ENDPOINT)
+    return request
+
+
+class TestHedging(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.handler = _SlowFirstHandler()
+        cls.server = LocalServer(cls.handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def _sent(self, path=_PATH):
+        return len([r for r in self.server.requests if r[1] == path])
+
+    def _warm_up(self, api_client, count=5):
+        for _ in range(count):
+            api_client.get_response(_request())
+
+    def test_latency_percentile(self):
+        window = LatencyWindow(window_size=100)
+        for i in range(1, 101):
+            window.record(i / 1000.0)
+        self.assertAlmostEqual(window.get_percentile(95), 0.096)
+        self.assertAlmostEqual(window.get_percentile(50), 0.051)
+
+    def test_latency_percentile_cached(self):
+        window = LatencyWindow(window_size=100, recompute_every=10)
+        for i in range(1, 101):
+            window.record(i / 1000.0)
+        self.assertAlmostEqual(window.get_percentile(95), 0.096)
+        for _ in range(9):
+            window.record(1.0)
+        self.assertAlmostEqual(window.get_percentile(95), 0.096)
+        window.record(1.0)
+        self.assertAlmostEqual(window.get_percentile(95), 1.0)
+
+    def test_slow_request_hedged(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port,
+                               hedger=Hedger(percentile=90, min_samples=5))
+        self._warm_up(api_client)
+        self.assertEqual(api_client.get_hedging_stats()['hedged'], 0)
+        before = self._sent()
+        self.handler.slow_next = True
+        start = time.monotonic()
+        response = api_client.get_response(_request())
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._sent() - before, 2)
+        stats = api_client.get_hedging_stats()
+        self.assertEqual((stats['requests'], stats['hedged'], stats['hedge_wins']), (6, 1, 1))
+        self.assertIsNotNone(stats['hedge_delay_ms'][_PATH])
+        # each copy is signed on its own
+        nonces = [r[4].get("x-signature-nonce") for r in self.server.requests[-2:]]
+        self.assertNotEqual(nonces[0], nonces[1])
+        api_client.close()
+
+    def test_hedge_respects_rate_limiter(self):
+        rate_limiter = TokenBucketRateLimiter({_PATH: (1000, 6)})
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port,
+                               hedger=Hedger(percentile=90, min_samples=5), rate_limiter=rate_limiter)
+        self._warm_up(api_client)
+        rate_limiter.set_rule(_PATH, (0.001, 1))
+        before = self._sent()
+        self.handler.slow_next = True
+        api_client.get_response(_request())
+        self.assertEqual(self._sent() - before, 1)
+        self.assertEqual(api_client.get_hedging_stats()['rate_limited'], 1)
+        api_client.close()
+
+    def test_other_paths_not_hedged(self):
+        hedger = Hedger()
+        self.assertTrue(hedger.accepts(_request()))
+        self.assertFalse(hedger.accepts(_request("/openapi/trade/order/place")))
+        post = ApiRequest(_PATH, method="POST", body_params={"symbols": "AAPL"})
+        self.assertFalse(hedger.accepts(post))
@@ -0,0 +1,91 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.client import ApiClient
+from webull.core.http.session_pool import SessionPool
+from webull.core.request import ApiRequest
+
+
+class _FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSessionPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_connection_reused(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        for _ in range(5):
+            request = ApiRequest("/ping", method="GET", body_params=None)
+            request.set_endpoint(LOCAL_ENDPOINT)
+            response = api_client.get_response(request)
+            self.assertEqual(response.status_code, 200)
+        stats = api_client.get_pool_stats()
+        self.assertEqual(stats['requests'], 5)
+        self.assertEqual(stats['new_connections'], 1)
+        self.assertEqual(stats['pool_hits'], 4)
+        self.assertEqual(stats['sessions_created'], 1)
+        api_client.close()
+        self.assertEqual(api_client.get_pool_stats()['sessions_evicted'], 1)
+
+    def test_idle_and_max_age_eviction(self):
+        timer = _FakeTimer()
+        pool = SessionPool(pool_size=2, idle_seconds=10, max_age_seconds=30, timer=timer)
+        session = pool.acquire("host")
+        pool.release("host", session)
+        timer.now = 5
+        self.assertIs(pool.acquire("host"), session)
+        pool.release("host", session)
+        timer.now = 20
+        renewed = pool.acquire("host")
+        self.assertIsNot(renewed, session)
+        pool.release("host", renewed)
+        for now in (25, 35, 45, 51):
+            timer.now = now
+            pool.release("host", pool.acquire("host"))
+        self.assertEqual(pool.get_stats()['sessions_created'], 3)
+        timer.now = 100
+        self.assertEqual(pool.evict_idle(), 1)
+        self.assertEqual(pool.get_stats()['sessions_evicted'], 3)
+
+    def test_close_defers_sessions_in_flight(self):
+        pool = SessionPool()
+        busy = pool.acquire("busy")
+        idle = pool.acquire("idle")
+        pool.release("idle", idle)
+        closed = []
+        busy.close = lambda: closed.append("busy")
+        idle.close = lambda: closed.append("idle")
+        pool.close()
+        self.assertEqual(closed, ["idle"])
+        # the next request gets a new session, the busy one is closed once released
+        renewed = pool.acquire("busy")
+        self.assertIsNot(renewed, busy)
+        pool.release("busy", busy)
+        self.assertEqual(closed, ["idle", "busy"])
+        pool.release("busy", renewed)
+        self.assertEqual(pool.get_stats()['sessions_evicted'], 2)
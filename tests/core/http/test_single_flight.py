@@ -0,0 +1,144 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import threading
+import unittest
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.async_client import AsyncApiClient
+from webull.core.client import ApiClient
+from webull.core.exception.exceptions import ServerException
+from webull.core.http.single_flight import SingleFlight, get_request_key
+from webull.core.request import ApiRequest
+
+
+def _handler(method, path, query, body):
+    if path == "/error":
+        return 500, {"error_code": "INTERNAL_ERROR", "message": "boom"}, 0.2
+    return 200, {"path": path, "query": query}, 0.2
+
+
+def _request(path="/snapshot", query_params=None, method="GET", body_params=None):
+    request = ApiRequest(path, method=method, query_params=query_params, body_params=body_params)
+    request.set_endpoint(LOCAL_ENDPOINT)
+    return request
+
+
+def _run_concurrently(fn, count):
+    results = [None] * count
+    errors = [None] * count
+
+    def run(i):
+        try:
+            results[i] = fn(i)
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(_handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def _sent(self, path):
+        return len([r for r in self.server.requests if r[1] == path])
+
+    def test_request_key(self):
+        first = get_request_key(_request(query_params={"symbols": "AAPL", "category": "US_STOCK"}))
+        second = get_request_key(_request(query_params={"category": "US_STOCK", "symbols": "AAPL"}))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, get_request_key(_request(query_params={"symbols": "TSLA", "category": "US_STOCK"})))
+        self.assertIsNone(get_request_key(_request(method="POST", body_params={"symbols": "AAPL"})))
+
+        with_header = _request(query_params={"symbols": "AAPL", "category": "US_STOCK"})
+        with_header.add_header("category", "US_ETF")
+        self.assertNotEqual(first, get_request_key(with_header))
+        with_agent = _request(query_params={"symbols": "AAPL", "category": "US_STOCK"})
+        with_agent.append_user_agent("strategy", "momentum")
+        self.assertNotEqual(first, get_request_key(with_agent))
+        # headers left by a previous send do not change the key
+        sent = _request(query_params={"symbols": "AAPL", "category": "US_STOCK"})
+        sent.add_header("x-signature-nonce", "n1")
+        sent.add_header("Accept-Encoding", "gzip")
+        self.assertEqual(first, get_request_key(sent))
+
+    def test_identical_gets_share_one_exchange(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, single_flight=True)
+        before = self._sent("/snapshot")
+        results, errors = _run_concurrently(
+            lambda i: api_client.get_response(_request(query_params={"symbols": "AAPL"})), 8)
+        self.assertEqual(errors, [None] * 8)
+        self.assertEqual(self._sent("/snapshot") - before, 1)
+        self.assertTrue(all(r.json()["query"] == {"symbols": "AAPL"} for r in results))
+        stats = api_client.get_single_flight_stats()
+        self.assertEqual((stats['calls'], stats['executed'], stats['coalesced'], stats['in_flight']), (8, 1, 7, 0))
+
+        api_client.get_response(_request(query_params={"symbols": "AAPL"}))
+        self.assertEqual(self._sent("/snapshot") - before, 2)
+        api_client.close()
+
+    def test_distinct_and_body_requests_not_coalesced(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, single_flight=True)
+        before = self._sent("/snapshot")
+        _, errors = _run_concurrently(
+            lambda i: api_client.get_response(_request(query_params={"symbols": "S%d" % (i % 2)})), 4)
+        self.assertEqual(errors, [None] * 4)
+        self.assertEqual(self._sent("/snapshot") - before, 2)
+        before = self._sent("/place")
+        _run_concurrently(lambda i: api_client.get_response(
+            _request("/place", method="POST", body_params={"symbol": "AAPL"})), 3)
+        self.assertEqual(self._sent("/place") - before, 3)
+        api_client.close()
+
+    def test_exception_shared(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, single_flight=True)
+        before = self._sent("/error")
+        _, errors = _run_concurrently(lambda i: api_client.get_response(_request("/error")), 4)
+        self.assertTrue(all(isinstance(e, ServerException) for e in errors))
+        self.assertEqual(self._sent("/error") - before, 1)
+        api_client.close()
+
+    def test_disabled_by_default(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        self.assertIsNone(api_client.get_single_flight())
+        self.assertEqual(api_client.get_single_flight_stats(), {})
+        api_client.set_single_flight(True)
+        self.assertIsInstance(api_client.get_single_flight(), SingleFlight)
+        api_client.close()
+
+    def test_async_client(self):
+        api_client = AsyncApiClient("app_key", "app_secret", "us", port=self.server.port, single_flight=True)
+
+        async def run():
+            return await asyncio.gather(*[
+                api_client.get_response(_request("/quotes", query_params={"symbols": "AAPL"})) for _ in range(5)])
+
+        before = self._sent("/quotes")
+        responses = asyncio.run(run())
+        self.assertEqual(len(responses), 5)
+        self.assertEqual(self._sent("/quotes") - before, 1)
+        self.assertEqual(api_client.get_single_flight_stats()['coalesced'], 4)
+        api_client.close()
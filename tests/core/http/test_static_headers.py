@@ -0,0 +1,75 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import unittest
+from unittest.mock import patch
+
+import webull.core.headers as hd
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.client import ApiClient, CLIENT_SOURCE_ENV
+from webull.core.request import ApiRequest
+
+
+def _reference_ua(api_client, request):
+    # User-Agent as composed before the static header block
+    ua = ApiClient.user_agent_header()
+    merged = api_client.merge_user_agent(ApiClient.default_user_agent(), api_client.handle_extra_agent(request))
+    for k, v in merged.items():
+        ua += ' %s/%s' % (k, v)
+    return ua
+
+
+def _request():
+    request = ApiRequest("/ping", method="GET", body_params=None)
+    request.set_endpoint(LOCAL_ENDPOINT)
+    return request
+
+
+class TestStaticHeaders(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_user_agent_matches_reference(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        self.assertEqual(api_client._compose_ua(_request()), _reference_ua(api_client, _request()))
+        api_client.append_user_agent("strategy", "1.0")
+        self.assertIn("strategy/1.0", api_client._compose_ua(_request()))
+        self.assertEqual(api_client._compose_ua(_request()), _reference_ua(api_client, _request()))
+        request = _request()
+        request.append_user_agent("job", "backfill")
+        self.assertEqual(api_client._compose_ua(request), _reference_ua(api_client, request))
+        api_client.set_user_agent("my-app")
+        self.assertEqual(api_client._compose_ua(_request()), _reference_ua(api_client, _request()))
+        self.assertIn("client/my-app", api_client._compose_ua(_request()))
+
+    def test_static_block_built_once(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        with patch.dict(os.environ, {CLIENT_SOURCE_ENV: "bot"}), \
+                patch.object(ApiClient, "_get_client_source", wraps=ApiClient._get_client_source) as client_source:
+            for _ in range(3):
+                api_client.get_response(_request())
+            self.assertEqual(client_source.call_count, 1)
+            api_client.append_user_agent("strategy", "1.0")
+            api_client.get_response(_request())
+            self.assertEqual(client_source.call_count, 2)
+        headers = self.server.requests[-1][4]
+        self.assertEqual(headers[hd.CLIENT_SOURCE], "bot")
+        self.assertIn("strategy/1.0", headers["User-Agent"])
+        api_client.close()
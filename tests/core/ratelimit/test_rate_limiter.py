@@ -0,0 +1,82 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import unittest
+
+from webull.core.exception.exceptions import ClientException
+from webull.core.ratelimit.rate_limiter import TokenBucket, TokenBucketRateLimiter
+from webull.core.request import ApiRequest
+
+
+class _FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _request(path, category=None):
+    request = ApiRequest(path, method="GET")
+    if category:
+        request.add_header("category", category)
+    return request
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_token_bucket(self):
+        timer = _FakeTimer()
+        bucket = TokenBucket(rate=2, capacity=2, timer=timer)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+        timer.now = 1.0
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertRaises(ClientException, TokenBucket, 0)
+
+    def test_rules_by_path_and_category(self):
+        timer = _FakeTimer()
+        limiter = TokenBucketRateLimiter(rules={
+            "/place": (1, 1),
+            ("/place", "HK_STOCK"): (1, 2),
+        }, timer=timer)
+        self.assertEqual(limiter.reserve(_request("/place")), 0)
+        self.assertAlmostEqual(limiter.reserve(_request("/place")), 1.0)
+        self.assertEqual(limiter.reserve(_request("/place", "HK_STOCK")), 0)
+        self.assertEqual(limiter.reserve(_request("/place", "HK_STOCK")), 0)
+        self.assertAlmostEqual(limiter.reserve(_request("/place", "HK_STOCK")), 1.0)
+        # a category without its own rule shares the path bucket
+        self.assertAlmostEqual(limiter.reserve(_request("/place", "HK_OPTION")), 2.0)
+        # no rule and no default rate: not limited
+        for _ in range(10):
+            self.assertEqual(limiter.reserve(_request("/other")), 0)
+        stats = limiter.get_stats()
+        self.assertEqual(stats["/place"]["acquired"], 3)
+        self.assertEqual(stats["/place"]["delayed"], 2)
+        self.assertAlmostEqual(stats["/place"]["max_wait_seconds"], 2.0)
+        self.assertEqual(stats["/place|HK_STOCK"]["delayed"], 1)
+        self.assertNotIn("/other", stats)
+
+    def test_default_rate_and_async_acquire(self):
+        limiter = TokenBucketRateLimiter(default_rate=50, default_capacity=1)
+
+        async def run():
+            return [await limiter.acquire_async(_request("/snapshot")) for _ in range(3)]
+
+        waits = asyncio.run(run())
+        self.assertEqual(waits[0], 0)
+        self.assertTrue(all(wait > 0 for wait in waits[1:]))
+        self.assertEqual(limiter.get_stats()["/snapshot"]["acquired"], 3)
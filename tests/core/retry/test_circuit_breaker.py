@@ -0,0 +1,148 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.client import ApiClient
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException, ServerException
+from webull.core.ratelimit.rate_limiter import TokenBucketRateLimiter
+from webull.core.request import ApiRequest
+from webull.core.retry.circuit_breaker import CircuitBreaker, CircuitBreakers, RetryBudget, is_failure, \
+    STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN
+
+
+class _FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _handler(method, path, query, body):
+    if path == "/error":
+        return 503, {"error_code": "SERVICE_UNAVAILABLE", "message": "down"}
+    if path == "/bad":
+        return 400, {"error_code": "INVALID_PARAMETER", "message": "bad"}
+    return 200, {"ok": True}
+
+
+def _request(path):
+    request = ApiRequest(path, method="GET", body_params=None)
+    request.set_endpoint(LOCAL_ENDPOINT)
+    return request
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(_handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def _sent(self, path):
+        return len([r for r in self.server.requests if r[1] == path])
+
+    def test_state_transitions(self):
+        timer = _FakeTimer()
+        breaker = CircuitBreaker(failure_threshold=2, open_seconds=10, timer=timer)
+        breaker.on_failure()
+        breaker.on_success()
+        breaker.on_failure()
+        self.assertEqual(breaker.get_state(), STATE_CLOSED)
+        breaker.on_failure()
+        self.assertEqual(breaker.get_state(), STATE_OPEN)
+        self.assertFalse(breaker.allow())
+        timer.now = 10
+        self.assertEqual(breaker.get_state(), STATE_HALF_OPEN)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.on_failure()
+        self.assertEqual(breaker.get_state(), STATE_OPEN)
+        timer.now = 20
+        self.assertTrue(breaker.allow())
+        breaker.on_cancel()
+        self.assertTrue(breaker.allow())
+        breaker.on_success()
+        self.assertEqual(breaker.get_state(), STATE_CLOSED)
+        self.assertEqual(breaker.get_stats()['opened'], 2)
+        self.assertEqual(breaker.get_stats()['rejected'], 2)
+
+    def test_failure_classification(self):
+        self.assertTrue(is_failure(ClientException(error_code.SDK_HTTP_ERROR), None))
+        self.assertFalse(is_failure(ClientException(error_code.SDK_INVALID_PARAMETER), None))
+        self.assertTrue(is_failure(ServerException("INTERNAL_ERROR", "", 500), 500))
+        self.assertFalse(is_failure(ServerException("INVALID_PARAMETER", "", 400), 400))
+        self.assertFalse(is_failure(None, 200))
+
+    def test_retry_budget(self):
+        budget = RetryBudget(max_tokens=4, token_ratio=0.5)
+        self.assertTrue(budget.can_retry())
+        budget.on_failure()
+        budget.on_failure()
+        self.assertFalse(budget.can_retry())
+        budget.on_success()
+        self.assertTrue(budget.can_retry())
+        self.assertEqual(budget.get_stats()['rejected'], 1)
+
+    def test_client_fails_fast_when_open(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port,
+                               circuit_breakers=CircuitBreakers(failure_threshold=2, open_seconds=60))
+        before = self._sent("/error")
+        for _ in range(2):
+            with self.assertRaises(ServerException):
+                api_client.get_response(_request("/error"))
+        with self.assertRaises(ClientException) as context:
+            api_client.get_response(_request("/error"))
+        self.assertEqual(context.exception.get_error_code(), error_code.SDK_CIRCUIT_OPEN)
+        self.assertEqual(self._sent("/error") - before, 2)
+        for _ in range(3):
+            with self.assertRaises(ServerException):
+                api_client.get_response(_request("/bad"))
+        api_client.get_response(_request("/ok"))
+        states = api_client.get_circuit_breaker_states()
+        self.assertEqual(states["%s /error" % LOCAL_ENDPOINT], STATE_OPEN)
+        self.assertEqual(states["%s /bad" % LOCAL_ENDPOINT], STATE_CLOSED)
+        self.assertEqual(states["%s /ok" % LOCAL_ENDPOINT], STATE_CLOSED)
+        api_client.close()
+
+    def test_open_circuit_takes_no_rate_limit_token(self):
+        rate_limiter = TokenBucketRateLimiter(rules={"/error": (1, 2)})
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, rate_limiter=rate_limiter,
+                               circuit_breakers=CircuitBreakers(failure_threshold=2, open_seconds=60))
+        for _ in range(2):
+            with self.assertRaises(ServerException):
+                api_client.get_response(_request("/error"))
+        for _ in range(5):
+            with self.assertRaises(ClientException) as context:
+                api_client.get_response(_request("/error"))
+            self.assertEqual(context.exception.get_error_code(), error_code.SDK_CIRCUIT_OPEN)
+        stats = rate_limiter.get_stats()["/error"]
+        self.assertEqual((stats["acquired"], stats["delayed"]), (2, 0))
+        api_client.close()
+
+    def test_client_retry_budget(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port, auto_retry=True,
+                               max_retry_num=3, retry_budget=RetryBudget(max_tokens=4))
+        before = self._sent("/error")
+        with self.assertRaises(ServerException):
+            api_client.get_response(_request("/error"))
+        # 2 failures leave half of the tokens, the third attempt is not retried
+        self.assertEqual(self._sent("/error") - before, 2)
+        self.assertEqual(api_client.get_retry_budget_stats()['rejected'], 1)
+        api_client.close()
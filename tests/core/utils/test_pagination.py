@@ -0,0 +1,138 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+import unittest
+import warnings
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.async_client import AsyncApiClient
+from webull.core.client import ApiClient
+from webull.core.exception.exceptions import ClientException
+from webull.core.utils.pagination import iter_pages, cursor_from_last_record, get_page_records
+from webull.data.quotes.instrument import Instrument
+from webull.trade.trade.account_info import Account
+
+_INSTRUMENTS = [{"instrument_id": str(i), "symbol": "S%d" % i} for i in range(1, 26)]
+
+
+def _handler(method, path, query, body):
+    page_size = int(query.get("page_size", 10))
+    if path == "/openapi/instrument/stock/list":
+        start = int(query.get("last_instrument_id", 0))
+        return 200, _INSTRUMENTS[start:start + page_size], 0.05
+    if path == "/account/positions":
+        start = int(query.get("last_instrument_id", 0))
+        holdings = _INSTRUMENTS[start:start + page_size]
+        return 200, {"has_next": start + page_size < len(_INSTRUMENTS), "holdings": holdings}
+    return 404, {"error_code": "NOT_FOUND", "message": path}
+
+
+class _FakeResponse:
+    def __init__(self, body):
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class TestPagination(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(_handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def _new_client(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        api_client.add_endpoint("us", LOCAL_ENDPOINT)
+        return api_client
+
+    def test_page_records(self):
+        self.assertEqual(get_page_records([1, 2]), [1, 2])
+        self.assertEqual(get_page_records({"has_next": True, "holdings": [1]}), [1])
+        self.assertEqual(get_page_records({"total": 3, "rows": [1, 2]}), [1, 2])
+        self.assertEqual(get_page_records(None), [])
+
+    def test_iter_instrument(self):
+        api_client = self._new_client()
+        instrument = Instrument(api_client)
+        records = list(instrument.iter_instrument(page_size=10))
+        self.assertEqual([r["instrument_id"] for r in records], [r["instrument_id"] for r in _INSTRUMENTS])
+        queries = [r[2] for r in self.server.requests if r[1] == "/openapi/instrument/stock/list"][-4:]
+        # the last page is the empty one
+        self.assertEqual([q.get("last_instrument_id") for q in queries], [None, "10", "20", "25"])
+        api_client.close()
+
+    def test_iter_account_position_has_next(self):
+        api_client = self._new_client()
+        before = len([r for r in self.server.requests if r[1] == "/account/positions"])
+        records = list(Account(api_client).iter_account_position("ACCOUNT", page_size=5))
+        self.assertEqual(len(records), 25)
+        after = len([r for r in self.server.requests if r[1] == "/account/positions"])
+        self.assertEqual(after - before, 5)
+        api_client.close()
+
+    def test_prefetch_overlaps_processing(self):
+        fetched = []
+        lock = threading.Lock()
+
+        def fetch_page(cursor):
+            start = cursor["last_id"] if cursor else 0
+            time.sleep(0.1)
+            with lock:
+                fetched.append(start)
+            return _FakeResponse([{"id": i} for i in range(start + 1, min(start + 10, 35) + 1)])
+
+        start = time.monotonic()
+        count = 0
+        for records in iter_pages(fetch_page, cursor_from_last_record({"last_id": "id"})):
+            time.sleep(0.1)
+            count += len(records)
+        self.assertEqual(count, 35)
+        self.assertEqual(fetched, [0, 10, 20, 30, 35])
+        # 5 fetches and 4 processings of 0.1s each, overlapped
+        self.assertLess(time.monotonic() - start, 0.8)
+
+    def test_short_page_is_not_the_last(self):
+        # the server caps the page size below the requested one
+        def fetch_page(cursor):
+            start = cursor["last_id"] if cursor else 0
+            return _FakeResponse([{"id": i} for i in range(start + 1, min(start + 7, 20) + 1)])
+
+        pages = list(iter_pages(fetch_page, cursor_from_last_record({"last_id": "id"}), prefetch=False))
+        self.assertEqual([len(records) for records in pages], [7, 7, 6, 0])
+        pages = list(iter_pages(lambda cursor: _FakeResponse({"has_next": False, "items": [{"id": 1}]}),
+                                cursor_from_last_record({"last_id": "id"}), prefetch=False))
+        self.assertEqual(len(pages), 1)
+
+    def test_repeated_cursor_stops(self):
+        pages = list(iter_pages(lambda cursor: _FakeResponse([{"id": 1}]),
+                                cursor_from_last_record({"last_id": "id"}), prefetch=False))
+        self.assertEqual(len(pages), 2)
+
+    def test_async_client_rejected(self):
+        api_client = AsyncApiClient("app_key", "app_secret", "us", port=self.server.port)
+        api_client.add_endpoint("us", LOCAL_ENDPOINT)
+        before = len(self.server.requests)
+        with warnings.catch_warnings():
+            # a coroutine created and never awaited would warn
+            warnings.simplefilter("error")
+            self.assertRaises(ClientException, Instrument(api_client).iter_instrument, page_size=10)
+            self.assertRaises(ClientException, Account(api_client).iter_account_position, "ACCOUNT")
+        self.assertEqual(len(self.server.requests), before)
+        api_client.close()
@@ -0,0 +1,148 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import math
+import unittest
+from datetime import datetime, timezone
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.async_client import AsyncApiClient
+from webull.core.client import ApiClient
+from webull.core.exception.exceptions import ClientException
+from webull.data.common.category import Category
+from webull.data.quotes.bar_backfill import BarBackfill, split_windows, to_millis, MAX_BAR_COUNT
+
+DAY_MS = 24 * 3600 * 1000
+MINUTE_MS = 60 * 1000
+START_MS = 1704067200000  # 2024-01-01T00:00:00Z
+
+
+def _bars(symbol, step_ms, start_ms, end_ms, count):
+    # the server returns the latest count bars of the window
+    times = list(range(start_ms - start_ms % step_ms, end_ms + 1, step_ms))
+    times = [t for t in times if t >= start_ms][-count:]
+    return [{"time": t, "open": "1", "close": str(t // step_ms % 100), "high": "2", "low": "0.5",
+             "volume": "" if symbol == "NOVOL" else "10"} for t in times]
+
+
+def _handler(method, path, query, body):
+    if path == "/openapi/market-data/stock/bars":
+        symbol = query["symbol"]
+        if symbol == "BAD":
+            return 400, {"error_code": "INVALID_SYMBOL", "message": "bad symbol"}
+        step_ms = MINUTE_MS // 2 if symbol == "DENSE" else (MINUTE_MS if query["timespan"] == "M1" else DAY_MS)
+        # overlapping windows, the bar on the start bound is returned twice
+        return 200, _bars(symbol, step_ms, int(query["start_time"]) - step_ms, int(query["end_time"]),
+                          int(query["count"]))
+    if path == "/openapi/market-data/stock/batch-bars":
+        params = json.loads(body)
+        symbols = params["symbols"]
+        symbols = symbols.split(",") if isinstance(symbols, str) else symbols
+        return 200, [{"symbol": s, "result": _bars(s, DAY_MS, int(params["start_time"]), int(params["end_time"]),
+                                                   int(params["count"]))} for s in symbols]
+    if path == "/openapi/market-data/crypto/bars":
+        symbols = query["symbols"].split(",")
+        return 200, [{"symbol": s, "result": _bars(s, DAY_MS, START_MS, START_MS + 9 * DAY_MS, 1200)}
+                     for s in symbols]
+    return 404, {"error_code": "NOT_FOUND"}
+
+
+class TestBarBackfill(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(_handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        self.api_client.add_endpoint("us", LOCAL_ENDPOINT)
+        self.bar_backfill = BarBackfill(self.api_client)
+
+    def _requests(self, before, path):
+        return [r for r in self.server.requests[before:] if r[1] == path]
+
+    def test_to_millis(self):
+        self.assertEqual(to_millis(datetime(2024, 1, 1)), START_MS)
+        self.assertEqual(to_millis(datetime(2024, 1, 1, tzinfo=timezone.utc)), START_MS)
+        self.assertEqual(to_millis("2024-01-01T00:00:00Z"), START_MS)
+        self.assertEqual(to_millis("2024-01-01T08:00:00+0800"), START_MS)
+        self.assertEqual(to_millis(str(START_MS)), START_MS)
+        self.assertEqual(to_millis(START_MS), START_MS)
+
+    def test_split_windows(self):
+        end_ms = START_MS + 3000 * DAY_MS
+        windows = split_windows(START_MS, end_ms, "D")
+        self.assertEqual(len(windows), 3)
+        self.assertEqual(windows[0], (START_MS, START_MS + MAX_BAR_COUNT * DAY_MS - 1))
+        self.assertEqual(windows[-1][1], end_ms)
+        for previous, window in zip(windows, windows[1:]):
+            self.assertEqual(window[0], previous[1] + 1)
+        self.assertEqual(split_windows(START_MS, START_MS, "M1"), [(START_MS, START_MS)])
+        self.assertRaises(ClientException, split_windows, START_MS, START_MS - 1, "D")
+        self.assertRaises(ClientException, split_windows, START_MS, START_MS, "M3")
+
+    def test_backfill(self):
+        end_ms = START_MS + 2999 * DAY_MS
+        before = len(self.server.requests)
+        results = dict((bars.get_symbol(), bars) for bars in self.bar_backfill.backfill(
+            ["AAPL", "NOVOL", "BAD"], Category.US_STOCK.name, "D", datetime(2024, 1, 1), end_ms))
+        self.assertEqual(len(self._requests(before, "/openapi/market-data/stock/bars")), 9)
+
+        bars = results["AAPL"]
+        self.assertFalse(bars.has_errors())
+        self.assertEqual(len(bars), 3000)
+        times = list(bars.get_column("time"))
+        self.assertEqual(times, list(range(START_MS, end_ms + 1, DAY_MS)))
+        self.assertEqual(bars.get_column("close")[1], float((START_MS + DAY_MS) // DAY_MS % 100))
+        self.assertEqual(bars.to_records()[0]["high"], 2.0)
+        self.assertTrue(math.isnan(results["NOVOL"].get_column("volume")[0]))
+
+        self.assertEqual(len(results["BAD"]), 0)
+        self.assertEqual(len(results["BAD"].get_errors()), 3)
+        self.assertRaises(ClientException, bars.get_column, "vwap")
+
+    def test_backfill_truncated_window(self):
+        end_ms = START_MS + 1000 * MINUTE_MS - 1
+        before = len(self.server.requests)
+        bars = next(self.bar_backfill.backfill("DENSE", Category.US_STOCK.name, "M1", START_MS, end_ms))
+        # 2000 bars in the window, the server returns 1200, the window is fetched again in halves
+        self.assertEqual(len(self._requests(before, "/openapi/market-data/stock/bars")), 3)
+        self.assertEqual(len(bars), 2000)
+        self.assertEqual(list(bars.get_column("time")), list(range(START_MS, end_ms + 1, MINUTE_MS // 2)))
+
+    def test_backfill_batch(self):
+        symbols = ["S%d" % i for i in range(25)]
+        end_ms = START_MS + 1499 * DAY_MS
+        before = len(self.server.requests)
+        results = list(self.bar_backfill.backfill_batch(symbols, Category.US_STOCK.name, "D", START_MS, end_ms,
+                                                        chunk_size=10))
+        self.assertEqual(len(self._requests(before, "/openapi/market-data/stock/batch-bars")), 6)
+        self.assertEqual(sorted(bars.get_symbol() for bars in results), sorted(symbols))
+        self.assertEqual(set(len(bars) for bars in results), {1500})
+
+    def test_backfill_crypto(self):
+        results = list(self.bar_backfill.backfill_crypto(["BTCUSD", "ETHUSD"], Category.US_CRYPTO.name, "D",
+                                                         START_MS + 2 * DAY_MS, START_MS + 5 * DAY_MS))
+        self.assertEqual(len(results), 2)
+        for bars in results:
+            self.assertEqual(list(bars.get_column("time")), [START_MS + i * DAY_MS for i in range(2, 6)])
+
+    def test_async_client_not_supported(self):
+        api_client = AsyncApiClient("app_key", "app_secret", "us")
+        self.assertRaises(ClientException, BarBackfill, api_client)
+        self.assertRaises(ClientException, BarBackfill, self.api_client, 0)
@@ -0,0 +1,169 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import mmap
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.client import ApiClient
+from webull.core.exception.exceptions import ClientException
+from webull.data.common.category import Category
+from webull.data.quotes.bar_backfill import HistoryBars
+from webull.data.quotes.bar_store import BarStore
+
+DAY_MS = 24 * 3600 * 1000
+START_MS = 1704067200000  # 2024-01-01T00:00:00Z
+
+_server_state = {"now": START_MS + 99 * DAY_MS, "last_close": "1"}
+
+
+def _handler(method, path, query, body):
+    if query["symbol"] == "BAD":
+        return 400, {"error_code": "INVALID_SYMBOL", "message": "bad symbol"}
+    now = _server_state["now"]
+    start_ms = int(query["start_time"])
+    end_ms = min(int(query["end_time"]), now)
+    first = start_ms + (-start_ms) % DAY_MS
+    bars = [{"time": t, "open": "1", "high": "2", "low": "0.5", "volume": "10",
+             "close": _server_state["last_close"] if t == now else str(t // DAY_MS % 100)}
+            for t in range(first, end_ms + 1, DAY_MS)]
+    return 200, bars[-int(query["count"]):]
+
+
+class TestBarStore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(_handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        _server_state.update(now=START_MS + 99 * DAY_MS, last_close="1")
+        self.root = tempfile.mkdtemp()
+        self.api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        self.api_client.add_endpoint("us", LOCAL_ENDPOINT)
+        self.bar_store = BarStore(self.root, self.api_client, timer=lambda: _server_state["now"] / 1000.0)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _read(self, bar_store=None, symbol="AAPL", **kwargs):
+        return (bar_store or self.bar_store).read(symbol, Category.US_STOCK.name, "D", **kwargs)
+
+    def test_fill_and_read(self):
+        result = self.bar_store.fill(["AAPL", "BAD"], Category.US_STOCK.name, "D", START_MS)
+        self.assertEqual(result.get_data(), {"AAPL": 100})
+        self.assertEqual(result.get_errors()[0].get_symbols(), ["BAD"])
+        self.assertEqual(len(self._read(symbol="BAD")), 0)
+
+        series = self._read()
+        self.assertEqual(list(series.get_times()), list(range(START_MS, START_MS + 100 * DAY_MS, DAY_MS)))
+        close = series.get_column("close")
+        self.assertIsInstance(close.obj, mmap.mmap)
+        self.assertEqual(close[1], float((START_MS + DAY_MS) // DAY_MS % 100))
+
+        part = self._read(start=START_MS + 10 * DAY_MS, end="2024-01-20T00:00:00Z")
+        self.assertEqual(len(part), 10)
+        self.assertIsInstance(part.get_column("close").obj, mmap.mmap)
+        self.assertEqual(part.get_first_time(), START_MS + 10 * DAY_MS)
+
+        # a new store on the same directory reads the same bars
+        self.assertEqual(self._read(BarStore(self.root)).to_records(), series.to_records())
+        self.assertRaises(ClientException, BarStore(self.root).top_up, "AAPL", Category.US_STOCK.name, "D")
+        self.assertRaises(ClientException, self.bar_store.read, "AAPL", Category.US_STOCK.name, "M3")
+
+    def test_top_up(self):
+        self.bar_store.fill("AAPL", Category.US_STOCK.name, "D", START_MS)
+        series = self._read()
+        _server_state.update(now=START_MS + 104 * DAY_MS, last_close="7")
+
+        before = len(self.server.requests)
+        result = self.bar_store.top_up(["AAPL", "MSFT"], Category.US_STOCK.name, "D")
+        self.assertEqual(result.get_data(), {"AAPL": 5})
+        requests = self.server.requests[before:]
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(int(requests[0][2]["start_time"]), START_MS + 99 * DAY_MS)
+
+        topped_up = self._read()
+        self.assertEqual(len(topped_up), 105)
+        self.assertEqual(topped_up.get_last_time(), START_MS + 104 * DAY_MS)
+        self.assertEqual(topped_up.get_column("close")[-1], 7.0)
+        # the last bar stored before the top-up is updated
+        self.assertEqual(topped_up.get_column("close")[99], float((START_MS + 99 * DAY_MS) // DAY_MS % 100))
+        self.assertEqual(len(series), 100)
+
+        result = self.bar_store.top_up("MSFT", Category.US_STOCK.name, "D", start=START_MS + 100 * DAY_MS)
+        self.assertEqual(result.get_data(), {"MSFT": 5})
+
+    def test_merge_older_bars(self):
+        self.bar_store.fill("AAPL", Category.US_STOCK.name, "D", START_MS + 50 * DAY_MS)
+        series = self._read()
+        added = self.bar_store.fill("AAPL", Category.US_STOCK.name, "D", START_MS, START_MS + 59 * DAY_MS)
+        self.assertEqual(added.get_data(), {"AAPL": 50})
+        merged = self._read()
+        self.assertEqual(list(merged.get_times()), list(range(START_MS, START_MS + 100 * DAY_MS, DAY_MS)))
+        # views read before the merge stay valid
+        self.assertEqual(len(series), 50)
+        self.assertEqual(series.get_first_time(), START_MS + 50 * DAY_MS)
+        self.assertEqual(series.get_column("high")[0], 2.0)
+
+    def test_merge_commits_with_the_meta(self):
+        self.bar_store.fill("AAPL", Category.US_STOCK.name, "D", START_MS + 50 * DAY_MS)
+        directory = os.path.join(self.root, "US_STOCK", "D", "default", "AAPL")
+        # files left by a merge that did not complete
+        with open(os.path.join(directory, "close.1.d"), "wb") as column_file:
+            column_file.write(b"\x01" * 12)
+
+        def fail(key, meta):
+            raise OSError("disk full")
+
+        save_meta = self.bar_store._save_meta
+        self.bar_store._save_meta = fail
+        with self.assertRaises(OSError):
+            self.bar_store.fill("AAPL", Category.US_STOCK.name, "D", START_MS, START_MS + 59 * DAY_MS)
+        self.bar_store._save_meta = save_meta
+        # the merge that failed before its meta left the stored bars as they were
+        self.assertEqual(self._read(BarStore(self.root)).to_records(), self._read().to_records())
+        self.assertEqual(len(self._read()), 50)
+
+        self.bar_store.fill("AAPL", Category.US_STOCK.name, "D", START_MS, START_MS + 59 * DAY_MS)
+        self.assertEqual(sorted(f for f in os.listdir(directory) if f.startswith("close")), ["close.1.d"])
+        self.assertEqual(len(self._read(BarStore(self.root))), 100)
+        _server_state.update(now=START_MS + 101 * DAY_MS)
+        self.assertEqual(self.bar_store.top_up("AAPL", Category.US_STOCK.name, "D").get_data(), {"AAPL": 2})
+        self.assertEqual(self._read(BarStore(self.root)).get_last_time(), START_MS + 101 * DAY_MS)
+        self.bar_store.fill("AAPL", Category.US_STOCK.name, "D", START_MS - 5 * DAY_MS, START_MS)
+        self.assertEqual(sorted(f for f in os.listdir(directory) if f.startswith("close")), ["close.2.d"])
+        self.assertEqual(len(self._read()), 107)
+        self.assertTrue(self.bar_store.delete("AAPL", Category.US_STOCK.name, "D"))
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_incomplete_append_is_dropped(self):
+        self.bar_store.fill("AAPL", Category.US_STOCK.name, "D", START_MS, START_MS + 9 * DAY_MS)
+        directory = os.path.join(self.root, "US_STOCK", "D", "default", "AAPL")
+        with open(os.path.join(directory, "close.d"), "ab") as column_file:
+            column_file.write(b"\x01" * 12)
+        bars = HistoryBars.stitch("AAPL", "D", [[{"time": START_MS + 10 * DAY_MS, "close": "3"}]], 0, 2 ** 62)
+        self.assertEqual(self.bar_store.write(bars, Category.US_STOCK.name), 1)
+        series = self._read()
+        self.assertEqual(len(series), 11)
+        self.assertEqual(series.get_column("close")[-1], 3.0)
+        self.assertEqual(os.path.getsize(os.path.join(directory, "close.d")), 11 * 8)
+        self.assertTrue(self.bar_store.delete("AAPL", Category.US_STOCK.name, "D"))
+        self.assertEqual(len(self._read()), 0)
@@ -0,0 +1,85 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import unittest
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.client import ApiClient
+from webull.core.exception.exceptions import ClientException
+from webull.data.common.category import Category
+from webull.data.quotes import frames
+from webull.data.quotes.market_data import MarketData
+
+_BATCH_BARS = [
+    {"symbol": "AAPL", "result": [{"time": "1704067200000", "open": "1.5", "high": "2", "low": "1", "close": "1.75",
+                                   "volume": "100"},
+                                  {"time": "1704153600000", "open": "1.75", "high": "", "low": "1", "close": "2",
+                                   "volume": None}]},
+    {"symbol": "TSLA", "result": [{"time": "2024-01-01T00:00:00.000+0000", "open": 3, "high": 4, "low": 2,
+                                   "close": 3.5, "volume": 7}]},
+]
+
+
+def _handler(method, path, query, body):
+    if path == "/openapi/market-data/stock/snapshot":
+        return 200, [{"symbol": s, "instrument_id": "9%d" % i, "price": "1.%d" % i, "trade_time": "1704067200000"}
+                     for i, s in enumerate(query["symbols"].split(","))]
+    return 200, {"ok": True}
+
+
+class TestFrames(unittest.TestCase):
+
+    def test_dtypes(self):
+        columns = frames.get_dtypes(frames.FRAME_BARS, {"volume": "i8", "vwap": "f8"})
+        self.assertEqual(columns[-2:], [("volume", "i8"), ("vwap", "f8")])
+        self.assertIs(frames.get_dtypes(frames.FRAME_TICK), frames.DTYPES[frames.FRAME_TICK])
+        self.assertRaises(ClientException, frames.get_dtypes, "quotes")
+
+    @unittest.skipIf(frames.np is None, "numpy is not installed")
+    def test_arrays(self):
+        arrays = frames.to_arrays(_BATCH_BARS, frames.FRAME_BARS)
+        self.assertEqual(list(arrays), ["symbol", "time", "open", "high", "low", "close", "volume"])
+        self.assertEqual(arrays["symbol"].tolist(), ["AAPL", "AAPL", "TSLA"])
+        self.assertEqual(arrays["time"].dtype, frames.np.dtype("i8"))
+        self.assertEqual(arrays["time"].tolist(), [1704067200000, 1704153600000, 1704067200000])
+        self.assertEqual(arrays["close"].tolist(), [1.75, 2.0, 3.5])
+        self.assertTrue(math.isnan(arrays["high"][1]))
+        self.assertTrue(math.isnan(arrays["volume"][1]))
+
+        records = frames.to_records(_BATCH_BARS, frames.FRAME_BARS)
+        self.assertEqual(records.shape, (3,))
+        self.assertAlmostEqual(float(records["open"].sum()), 6.25)
+
+        ticks = frames.to_arrays({"result": [{"time": 1, "price": "2", "side": "B"}]}, frames.FRAME_TICK)
+        self.assertEqual(ticks["side"].tolist(), ["B"])
+        self.assertEqual(ticks["trading_session"].tolist(), [""])
+        self.assertEqual(len(frames.to_arrays([], frames.FRAME_FOOTPRINT)["time"]), 0)
+
+    @unittest.skipIf(frames.pd is None, "pandas is not installed")
+    def test_dataframe_from_response(self):
+        server = LocalServer(_handler).start()
+        try:
+            api_client = ApiClient("app_key", "app_secret", "us", port=server.port)
+            api_client.add_endpoint("us", LOCAL_ENDPOINT)
+            market_data = MarketData(api_client)
+            response = market_data.get_snapshot("AAPL,MSFT", Category.US_STOCK.name)
+            self.assertEqual(frames.get_frame_kind(response), frames.FRAME_SNAPSHOT)
+            snapshot = frames.to_dataframe(response)
+            self.assertEqual(snapshot["symbol"].tolist(), ["AAPL", "MSFT"])
+            self.assertEqual(snapshot["price"].tolist(), [1.0, 1.1])
+            self.assertEqual(snapshot["trade_time"].tolist(), [1704067200000] * 2)
+            self.assertTrue(snapshot["ext_price"].isna().all())
+            self.assertRaises(ClientException, frames.to_dataframe, {"ok": True})
+        finally:
+            server.stop()
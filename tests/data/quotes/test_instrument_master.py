@@ -0,0 +1,148 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.async_client import AsyncApiClient
+from webull.core.client import ApiClient
+from webull.core.exception.exceptions import ClientException
+from webull.data.common.category import Category
+from webull.data.quotes.instrument_master import InstrumentMaster, InstrumentIndex
+
+_universe = {
+    "US_STOCK": [{"instrument_id": str(1000 + i), "symbol": "S%03d" % i, "name": "Stock %d" % i,
+                  "exchange_code": "NAS", "currency": "USD"} for i in range(25)],
+    "US_CRYPTO": [{"instrument_id": "9001", "symbol": "BTCUSD"}, {"instrument_id": "9002", "symbol": "ETHUSD"}],
+    "US_FUTURES": [{"instrument_id": "7001", "symbol": "ESZ5"}, {"instrument_id": "7002", "symbol": "ESH6"}],
+}
+
+
+def _handler(method, path, query, body):
+    if path == "/openapi/instrument/futures/list":
+        return 200, _universe["US_FUTURES"]
+    records = _universe["US_CRYPTO" if path == "/openapi/instrument/crypto/list" else "US_STOCK"]
+    last_instrument_id = query.get("last_instrument_id")
+    if last_instrument_id is not None:
+        records = [r for r in records if int(r["instrument_id"]) > int(last_instrument_id)]
+    return 200, records[:int(query["page_size"])]
+
+
+class _FakeTimer:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestInstrumentMaster(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(_handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "instruments.json")
+        self.timer = _FakeTimer()
+        self.api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        self.api_client.add_endpoint("us", LOCAL_ENDPOINT)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _master(self):
+        return InstrumentMaster(self.api_client, [Category.US_STOCK.name, Category.US_CRYPTO.name,
+                                                  Category.US_FUTURES.name],
+                                path=self.path, page_size=10, timer=self.timer)
+
+    def test_lookups(self):
+        master = self._master()
+        before = len(self.server.requests)
+        index = master.load()
+        # 3 stock pages and 1 crypto page, each list ending with an empty page, the futures list
+        self.assertEqual(len(self.server.requests) - before, 7)
+        self.assertEqual(len(index), 29)
+        self.assertEqual(master.get_instrument_id("S007"), "1007")
+        self.assertEqual(master.get_symbol(1007), "S007")
+        self.assertEqual(master.get_instrument_id("BTCUSD", Category.US_CRYPTO.name), "9001")
+        self.assertIsNone(master.get_instrument_id("BTCUSD"))
+        self.assertEqual(master.get_by_instrument_id("7002")["category"], Category.US_FUTURES.name)
+        self.assertEqual(master.get_by_symbol("S001")["name"], "Stock 1")
+        self.assertEqual([r["symbol"] for r in master.search("S01", limit=3)], ["S010", "S011", "S012"])
+        self.assertEqual([r["symbol"] for r in master.search("E")], ["ESH6", "ESZ5", "ETHUSD"])
+        self.assertEqual(master.search("ES", Category.US_CRYPTO.name), [])
+
+    def test_snapshot_and_incremental_refresh(self):
+        self._master().load()
+        before = len(self.server.requests)
+        master = self._master()
+        self.assertEqual(master.load().get_size(), 29)
+        self.assertEqual(len(self.server.requests), before)
+
+        _universe["US_STOCK"].append({"instrument_id": "1100", "symbol": "NEW"})
+        try:
+            self.timer.now += 24 * 3600
+            self.assertTrue(master.refresh_if_stale())
+            requests = self.server.requests[before:]
+            stock_requests = [r for r in requests if r[1] == "/openapi/instrument/stock/list"]
+            self.assertEqual([r[2].get("last_instrument_id") for r in stock_requests], ["1024", "1100"])
+            self.assertEqual(master.get_instrument_id("NEW"), "1100")
+            self.assertEqual(len(master.get_index()), 30)
+            self.assertFalse(master.refresh_if_stale())
+            self.assertEqual(InstrumentIndex.from_snapshot(master.get_index().to_snapshot()).get_symbol("1100"),
+                             "NEW")
+            self.assertEqual(self._master().load().get_instrument_id("NEW"), "1100")
+        finally:
+            _universe["US_STOCK"].pop()
+        master.refresh(full=True)
+        self.assertIsNone(master.get_instrument_id("NEW"))
+
+    def test_concurrent_refresh_if_stale(self):
+        master = self._master()
+        before = len(self.server.requests)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(master.refresh_if_stale())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(results), [False, False, False, True])
+        self.assertEqual(len(self.server.requests) - before, 7)
+
+    def test_index_from_records(self):
+        index = InstrumentIndex.from_records({
+            Category.US_STOCK.name: [{"instrument_id": 1, "symbol": "A"}, {"instrument_id": 2}],
+            Category.US_ETF.name: [{"instrument_id": "3", "symbol": "SPY"}],
+        })
+        index = InstrumentIndex.from_records({Category.US_STOCK.name: [{"instrument_id": "1", "symbol": "B"}]}, index)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.get_symbol(1), "B")
+        self.assertEqual(index.get_instrument_id("SPY", Category.US_ETF.name), "3")
+
+    def test_async_client_rejected(self):
+        api_client = AsyncApiClient("app_key", "app_secret", "us", port=self.server.port)
+        self.assertRaises(ClientException, InstrumentMaster, api_client)
+        master = InstrumentMaster(api_client.blocking_client(), [Category.US_FUTURES.name])
+        api_client.add_endpoint("us", LOCAL_ENDPOINT)
+        self.assertEqual(master.load().get_symbol("7001"), "ESZ5")
+        api_client.close()
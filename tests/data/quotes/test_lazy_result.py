@@ -0,0 +1,125 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+from webull.data.quotes.subscribe import message_pb2
+from webull.data.quotes.subscribe.event_depth_decoder import EventDepthDecoder
+from webull.data.quotes.subscribe.event_snapshot_decoder import EventSnapshotDecoder
+from webull.data.quotes.subscribe.event_tick_decoder import EventTickDecoder
+from webull.data.quotes.subscribe.quote_decoder import QuoteDecoder
+from webull.data.quotes.subscribe.snapshot_decoder import SnapshotDecoder
+from webull.data.quotes.subscribe.tick_decoder import TickDecoder
+
+
+def _basic(pb):
+    pb.basic.symbol = "AAPL"
+    pb.basic.instrument_id = "913256135"
+    pb.basic.timestamp = "1700000000000"
+    pb.basic.trading_session = "CORE"
+
+
+def _snapshot():
+    pb = message_pb2.Snapshot()
+    _basic(pb)
+    pb.trade_time = "1700000000000"
+    pb.price = "189.71"
+    pb.open = "188.01"
+    pb.volume = "51234"
+    pb.ext_price = "190.02"
+    return pb.SerializeToString()
+
+
+def _quote():
+    pb = message_pb2.Quote()
+    _basic(pb)
+    ask = pb.asks.add(price="189.72", size="300")
+    ask.order.add(mpid="NSDQ", size="100")
+    ask.broker.add(bid="8", name="")
+    pb.bids.add(price="189.70", size="200")
+    return pb.SerializeToString()
+
+
+def _tick():
+    pb = message_pb2.Tick()
+    _basic(pb)
+    pb.time = "1700000000001"
+    pb.price = "189.71"
+    pb.volume = "10"
+    return pb.SerializeToString()
+
+
+def _event_snapshot():
+    pb = message_pb2.EventSnapshot()
+    _basic(pb)
+    pb.price = "0.43"
+    pb.last_trade_time = "1700000000000"
+    pb.yes_bid = "0.42"
+    pb.no_ask_size = "12"
+    return pb.SerializeToString()
+
+
+def _event_depth():
+    pb = message_pb2.EventQuote()
+    _basic(pb)
+    pb.yes_bids.add(price="0.42", size="5")
+    pb.no_bids.add(price="0.57", size="7")
+    return pb.SerializeToString()
+
+
+def _event_tick():
+    pb = message_pb2.EventTick()
+    _basic(pb)
+    pb.yes_price = "0.43"
+    pb.volume = "3"
+    pb.side = "BUY"
+    pb.trade_id = "t-1"
+    pb.time = "1700000000002"
+    return pb.SerializeToString()
+
+
+CASES = [
+    (SnapshotDecoder, _snapshot),
+    (QuoteDecoder, _quote),
+    (TickDecoder, _tick),
+    (EventSnapshotDecoder, _event_snapshot),
+    (EventDepthDecoder, _event_depth),
+    (EventTickDecoder, _event_tick),
+]
+
+
+class TestLazyResult(unittest.TestCase):
+
+    def test_lazy_equals_eager(self):
+        for decoder_class, payload_builder in CASES:
+            payload = payload_builder()
+            eager = decoder_class().parse(payload)
+            lazy = decoder_class(lazy=True).parse(payload)
+            self.assertIsNot(type(eager), type(lazy))
+            self.assertEqual(str(eager), str(lazy), decoder_class.__name__)
+            for name in dir(eager):
+                if name.startswith("get_"):
+                    self.assertEqual(str(getattr(eager, name)()), str(getattr(lazy, name)()),
+                                     "%s.%s" % (decoder_class.__name__, name))
+
+    def test_lazy_has_no_instance_dict(self):
+        for decoder_class, payload_builder in CASES:
+            lazy = decoder_class(lazy=True).parse(payload_builder())
+            self.assertFalse(hasattr(lazy, "__dict__"), decoder_class.__name__)
+            self.assertFalse(hasattr(lazy.get_basic(), "__dict__"))
+
+    def test_lazy_nested_lists_are_cached(self):
+        quote = QuoteDecoder(lazy=True).parse(_quote())
+        self.assertIs(quote.get_asks(), quote.get_asks())
+        self.assertEqual(quote.get_asks()[0].get_order()[0].get_mpid(), "NSDQ")
+        self.assertIsNone(quote.get_asks()[0].get_broker()[0].get_name())
@@ -0,0 +1,49 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+from decimal import Decimal
+
+from tests.data.quotes.test_lazy_result import CASES, _quote, _snapshot
+from webull.core.exception.exceptions import ClientException
+from webull.data.quotes.subscribe.numeric_mode import NUMERIC_MODE_FLOAT, NUMERIC_MODE_RAW_STR
+from webull.data.quotes.subscribe.quote_decoder import QuoteDecoder
+from webull.data.quotes.subscribe.snapshot_decoder import SnapshotDecoder
+
+
+class TestNumericMode(unittest.TestCase):
+
+    def test_float_and_raw_str(self):
+        for lazy in (False, True):
+            snapshot = SnapshotDecoder(lazy=lazy).parse(_snapshot())
+            self.assertEqual(snapshot.get_price(), Decimal("189.71"))
+            snapshot = SnapshotDecoder(lazy=lazy, numeric_mode=NUMERIC_MODE_FLOAT).parse(_snapshot())
+            self.assertIsInstance(snapshot.get_price(), float)
+            self.assertEqual(snapshot.get_price(), 189.71)
+            self.assertIsNone(snapshot.get_high())
+            self.assertEqual(snapshot.get_last_trade_time(), 1700000000000)
+            quote = QuoteDecoder(lazy=lazy, numeric_mode=NUMERIC_MODE_RAW_STR).parse(_quote())
+            self.assertEqual(quote.get_asks()[0].get_price(), "189.72")
+            self.assertIsNone(quote.get_asks()[0].get_broker()[0].get_name())
+
+    def test_modes_agree(self):
+        for decoder_class, payload_builder in CASES:
+            payload = payload_builder()
+            for lazy in (False, True):
+                decimal_repr = str(decoder_class(lazy=lazy).parse(payload))
+                raw_repr = str(decoder_class(lazy=lazy, numeric_mode=NUMERIC_MODE_RAW_STR).parse(payload))
+                self.assertEqual(decimal_repr, raw_repr, decoder_class.__name__)
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ClientException):
+            SnapshotDecoder(numeric_mode="double")
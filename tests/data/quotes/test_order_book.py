@@ -0,0 +1,78 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+
+from tests.data.quotes.test_lazy_result import _basic
+from webull.data.quotes.order_book import OrderBooks, SIDE_ASK, SIDE_BID
+from webull.data.quotes.subscribe import message_pb2
+from webull.data.quotes.subscribe.event_depth_decoder import EventDepthDecoder
+from webull.data.quotes.subscribe.numeric_mode import NUMERIC_MODE_FLOAT
+from webull.data.quotes.subscribe.payload_type import PAYLOAD_TYPE_EVENT_DEPTH, PAYLOAD_TYPE_QUOTE, PAYLOAD_TYPE_TICK
+from webull.data.quotes.subscribe.quote_decoder import QuoteDecoder
+
+
+def _quote(bids, asks):
+    pb = message_pb2.Quote()
+    _basic(pb)
+    for price, size in bids:
+        pb.bids.add(price=price, size=size)
+    for price, size in asks:
+        pb.asks.add(price=price, size=size)
+    return pb.SerializeToString()
+
+
+class TestOrderBook(unittest.TestCase):
+
+    def test_queries_and_incremental_update(self):
+        order_books = OrderBooks()
+        decoder = QuoteDecoder()
+        book = order_books.apply(PAYLOAD_TYPE_QUOTE, decoder.parse(_quote(
+            [("10.00", "100"), ("9.99", "200"), ("9.98", "300")], [("10.02", "300"), ("10.03", "100")])))
+        self.assertEqual(book.get_best_bid(), (10.0, 100.0))
+        self.assertEqual(book.get_best_ask(), (10.02, 300.0))
+        self.assertAlmostEqual(book.get_spread(), 0.02)
+        self.assertAlmostEqual(book.get_microprice(), (10.0 * 300 + 10.02 * 100) / 400)
+        self.assertEqual(book.get_depth(SIDE_BID, 2), 300.0)
+        self.assertEqual(book.get_depth(SIDE_BID, 10), 600.0)
+        self.assertEqual(book.get_level_count(SIDE_ASK), 2)
+
+        changed = book.update(decoder.parse(_quote([("10.00", "150"), ("9.99", "200")], [("10.02", "300")])).bids,
+                              decoder.parse(_quote([], [("10.02", "300")])).asks)
+        self.assertEqual(changed, 3)
+        self.assertEqual(book.get_depth(SIDE_BID, 5), 350.0)
+        self.assertIsNone(book.get_level(SIDE_ASK, 1))
+        snapshot = order_books.snapshot("AAPL")
+        self.assertEqual(snapshot.get_bids(), [(10.0, 150.0), (9.99, 200.0)])
+        self.assertEqual(snapshot.get_version(), 2)
+        self.assertIsNone(order_books.apply(PAYLOAD_TYPE_TICK, None))
+
+    def test_numeric_modes_and_empty_side(self):
+        book = OrderBooks().on_quote(QuoteDecoder(lazy=True, numeric_mode=NUMERIC_MODE_FLOAT).parse(
+            _quote([("10.00", "100")], [])))
+        self.assertEqual(book.get_best_bid(), (10.0, 100.0))
+        self.assertIsNone(book.get_spread())
+        self.assertIsNone(book.get_microprice())
+
+    def test_event_depth_implied_asks(self):
+        pb = message_pb2.EventQuote()
+        _basic(pb)
+        pb.yes_bids.add(price="0.42", size="5")
+        pb.no_bids.add(price="0.55", size="7")
+        pb.no_bids.add(price="0.50", size="9")
+        book = OrderBooks().apply(PAYLOAD_TYPE_EVENT_DEPTH, EventDepthDecoder().parse(pb.SerializeToString()))
+        self.assertEqual(book.get_best_bid(), (0.42, 5.0))
+        best_ask = book.get_best_ask()
+        self.assertAlmostEqual(best_ask[0], 0.45)
+        self.assertEqual(best_ask[1], 7.0)
+        self.assertAlmostEqual(book.get_level(SIDE_ASK, 1)[0], 0.50)
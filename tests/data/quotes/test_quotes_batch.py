@@ -0,0 +1,115 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import math
+import threading
+import unittest
+from types import SimpleNamespace
+
+from tests.data.quotes.test_lazy_result import _quote, _snapshot, _tick, _event_tick
+from webull.data.data_streaming_client import DataStreamingClient
+from webull.data.internal.quotes_batcher import QuotesBatcher
+from webull.data.quotes.subscribe import quotes_batch
+from webull.data.quotes.subscribe.payload_type import PAYLOAD_TYPE_EVENT_TICK, PAYLOAD_TYPE_QUOTE, \
+    PAYLOAD_TYPE_SHAPSHOT, PAYLOAD_TYPE_TICK
+
+
+class _FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestQuotesBatch(unittest.TestCase):
+
+    def test_window_by_count_and_delay(self):
+        timer = _FakeTimer()
+        batches = []
+        batcher = QuotesBatcher(lambda payload_type, batch: batches.append((payload_type, batch)),
+                                max_messages=3, max_delay_ms=100, timer=timer)
+        for _ in range(3):
+            batcher.offer(PAYLOAD_TYPE_TICK, _tick())
+        self.assertEqual([(t, len(b)) for t, b in batches], [(PAYLOAD_TYPE_TICK, 3)])
+        batcher.offer(PAYLOAD_TYPE_QUOTE, _quote())
+        batcher.flush(expired_only=True)
+        self.assertEqual(len(batches), 1)
+        timer.now = 0.1
+        batcher.flush(expired_only=True)
+        self.assertEqual([(t, len(b)) for t, b in batches][1], (PAYLOAD_TYPE_QUOTE, 1))
+
+    def test_columns(self):
+        batch = quotes_batch.QuotesBatch.from_pb_messages(
+            PAYLOAD_TYPE_SHAPSHOT, [quotes_batch.Snapshot.FromString(_snapshot())] * 2)
+        self.assertEqual(batch.get_column("symbol"), ["AAPL", "AAPL"])
+        self.assertEqual(batch.get_column("timestamp"), [1700000000000] * 2)
+        self.assertEqual(batch.get_column("price"), [189.71] * 2)
+        self.assertTrue(math.isnan(batch.get_column("high")[0]))
+        quote = quotes_batch.QuotesBatch.from_pb_messages(PAYLOAD_TYPE_QUOTE, [quotes_batch.Quote.FromString(_quote())])
+        self.assertEqual((quote.get_column("ask_price"), quote.get_column("ask_levels")), ([189.72], [1]))
+
+    @unittest.skipIf(quotes_batch.np is None, "numpy is not installed")
+    def test_to_records(self):
+        batch = quotes_batch.QuotesBatch.from_pb_messages(
+            PAYLOAD_TYPE_TICK, [quotes_batch.Tick.FromString(_tick())] * 4)
+        records = batch.to_records()
+        self.assertEqual(records.shape, (4,))
+        self.assertAlmostEqual(float(records["price"].sum()), 189.71 * 4)
+
+    def test_streaming_client_batching(self):
+        client = DataStreamingClient("app_key", "app_secret", "us", "session")
+        received = threading.Event()
+        batches = []
+        messages = []
+
+        def on_batch(_client, payload_type, batch):
+            batches.append((payload_type, len(batch)))
+            received.set()
+
+        client.on_quotes_batch = on_batch
+        client.on_quotes_message = lambda _client, topic, quotes: messages.append(topic)
+        client.enable_batching(max_messages=1000, max_delay_ms=20)
+        for _ in range(5):
+            client._quotes_message(client, None, SimpleNamespace(topic=PAYLOAD_TYPE_TICK, payload=_tick()))
+        client._quotes_message(client, None, SimpleNamespace(topic=PAYLOAD_TYPE_EVENT_TICK, payload=_event_tick()))
+        self.assertTrue(received.wait(2))
+        client.disable_batching()
+        self.assertEqual(batches, [(PAYLOAD_TYPE_TICK, 5)])
+        self.assertEqual(messages, [PAYLOAD_TYPE_EVENT_TICK])
+
+    def test_batch_without_callback_logged_once(self):
+        client = DataStreamingClient("app_key", "app_secret", "us", "session")
+        logged = []
+        client._easy_log = lambda level, fmt, *args: logged.append((level, fmt % args))
+        client.enable_batching(max_messages=1, max_delay_ms=20)
+        for _ in range(3):
+            client._quotes_message(client, None, SimpleNamespace(topic=PAYLOAD_TYPE_TICK, payload=_tick()))
+        client.disable_batching()
+        dropped = [message for _, message in logged if "on_quotes_batch is not set" in message]
+        self.assertEqual(len(dropped), 1)
+        self.assertIn(PAYLOAD_TYPE_TICK, dropped[0])
+
+    def test_custom_decoder_is_not_batched(self):
+        client = DataStreamingClient("app_key", "app_secret", "us", "session")
+        batches = []
+        messages = []
+        client.on_quotes_batch = lambda _client, payload_type, batch: batches.append(payload_type)
+        client.on_quotes_message = lambda _client, topic, quotes: messages.append((topic, quotes))
+        client.register_payload_decoder(PAYLOAD_TYPE_TICK, SimpleNamespace(parse=lambda payload: "custom"))
+        client.enable_batching(max_messages=1, max_delay_ms=20)
+        client._quotes_message(client, None, SimpleNamespace(topic=PAYLOAD_TYPE_TICK, payload=_tick()))
+        client._quotes_message(client, None, SimpleNamespace(topic=PAYLOAD_TYPE_QUOTE, payload=_quote()))
+        client.disable_batching()
+        self.assertEqual(messages, [(PAYLOAD_TYPE_TICK, "custom")])
+        self.assertEqual(batches, [PAYLOAD_TYPE_QUOTE])
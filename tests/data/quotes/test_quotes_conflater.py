@@ -0,0 +1,76 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import unittest
+from types import SimpleNamespace
+
+from tests.data.quotes.test_lazy_result import _snapshot, _tick
+from webull.data.data_streaming_client import DataStreamingClient
+from webull.data.internal.quotes_conflater import QuotesConflater
+from webull.data.quotes.subscribe.payload_type import PAYLOAD_TYPE_QUOTE, PAYLOAD_TYPE_SHAPSHOT, PAYLOAD_TYPE_TICK
+
+
+def _result(symbol, seq):
+    return SimpleNamespace(basic=SimpleNamespace(symbol=symbol), seq=seq)
+
+
+class TestQuotesConflater(unittest.TestCase):
+
+    def test_keeps_latest_per_topic_and_symbol(self):
+        release = threading.Event()
+        started = threading.Event()
+        delivered = []
+
+        def deliver(topic, result):
+            started.set()
+            release.wait(2)
+            delivered.append((topic, result.basic.symbol, result.seq))
+
+        conflater = QuotesConflater(deliver)
+        conflater.start()
+        conflater.offer(PAYLOAD_TYPE_SHAPSHOT, _result("BUSY", 0))
+        self.assertTrue(started.wait(2))
+        for seq in range(1, 101):
+            conflater.offer(PAYLOAD_TYPE_SHAPSHOT, _result("AAPL", seq))
+            conflater.offer(PAYLOAD_TYPE_QUOTE, _result("AAPL", seq))
+        release.set()
+        conflater.stop()
+        self.assertEqual(delivered, [(PAYLOAD_TYPE_SHAPSHOT, "BUSY", 0),
+                                     (PAYLOAD_TYPE_SHAPSHOT, "AAPL", 100), (PAYLOAD_TYPE_QUOTE, "AAPL", 100)])
+        stats = conflater.get_stats()
+        self.assertEqual((stats["received"], stats["delivered"], stats["coalesced"]), (201, 3, 198))
+        self.assertEqual(stats["coalesced_by_topic"], {PAYLOAD_TYPE_SHAPSHOT: 99, PAYLOAD_TYPE_QUOTE: 99})
+
+    def test_cadence(self):
+        delivered = []
+        conflater = QuotesConflater(lambda topic, result: delivered.append(result.seq), cadence_ms=200)
+        conflater.start()
+        conflater.offer(PAYLOAD_TYPE_SHAPSHOT, _result("AAPL", 1))
+        conflater.offer(PAYLOAD_TYPE_SHAPSHOT, _result("AAPL", 2))
+        conflater.stop()
+        self.assertEqual(delivered, [2])
+
+    def test_streaming_client_conflation(self):
+        client = DataStreamingClient("app_key", "app_secret", "us", "session")
+        topics = []
+        client.on_quotes_message = lambda _client, topic, quotes: topics.append(topic)
+        client.enable_conflation(cadence_ms=50)
+        for _ in range(10):
+            client._quotes_message(client, None, SimpleNamespace(topic=PAYLOAD_TYPE_SHAPSHOT, payload=_snapshot()))
+            client._quotes_message(client, None, SimpleNamespace(topic=PAYLOAD_TYPE_TICK, payload=_tick()))
+        stats = client.get_conflation_stats()
+        client.disable_conflation()
+        self.assertEqual(topics.count(PAYLOAD_TYPE_TICK), 10)
+        self.assertLessEqual(topics.count(PAYLOAD_TYPE_SHAPSHOT), 2)
+        self.assertEqual(stats["received"], 10)
@@ -0,0 +1,97 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from tests.data.quotes.test_lazy_result import _tick
+from webull.data.data_streaming_client import DataStreamingClient
+from webull.data.internal.quotes_dispatcher import QuotesDispatcher, OVERFLOW_CONFLATE, OVERFLOW_DROP_OLDEST
+from webull.data.quotes.subscribe.payload_type import PAYLOAD_TYPE_SHAPSHOT, PAYLOAD_TYPE_TICK
+
+
+def _result(symbol, seq):
+    return SimpleNamespace(basic=SimpleNamespace(symbol=symbol), seq=seq)
+
+
+class TestQuotesDispatcher(unittest.TestCase):
+
+    def test_per_symbol_order(self):
+        delivered = {}
+        lock = threading.Lock()
+
+        def deliver(topic, result):
+            with lock:
+                delivered.setdefault(result.basic.symbol, []).append(result.seq)
+
+        dispatcher = QuotesDispatcher(deliver, workers=4, queue_size=64)
+        dispatcher.start()
+        for seq in range(200):
+            for symbol in ("AAPL", "MSFT", "TSLA"):
+                dispatcher.dispatch(PAYLOAD_TYPE_TICK, _result(symbol, seq))
+        dispatcher.stop()
+        for symbol in ("AAPL", "MSFT", "TSLA"):
+            self.assertEqual(delivered[symbol], list(range(200)))
+        stats = dispatcher.get_stats()
+        self.assertEqual(stats["delivered"], 600)
+        self.assertEqual(stats["queue_depth"], 0)
+
+    def _blocked_dispatcher(self, policy):
+        release = threading.Event()
+        delivered = []
+
+        def deliver(topic, result):
+            release.wait(2)
+            delivered.append((topic, result.basic.symbol, result.seq))
+
+        dispatcher = QuotesDispatcher(deliver, workers=1, queue_size=2, overflow_policy=policy)
+        dispatcher.start()
+        dispatcher.dispatch(PAYLOAD_TYPE_TICK, _result("BUSY", 0))
+        while dispatcher.get_queue_depth():
+            time.sleep(0.001)
+        return dispatcher, release, delivered
+
+    def test_drop_oldest(self):
+        dispatcher, release, delivered = self._blocked_dispatcher(OVERFLOW_DROP_OLDEST)
+        for seq in range(1, 5):
+            dispatcher.dispatch(PAYLOAD_TYPE_TICK, _result("AAPL", seq))
+        release.set()
+        dispatcher.stop()
+        self.assertEqual([d[2] for d in delivered], [0, 3, 4])
+        self.assertEqual(dispatcher.get_stats()["dropped"], 2)
+
+    def test_conflate(self):
+        dispatcher, release, delivered = self._blocked_dispatcher(OVERFLOW_CONFLATE)
+        dispatcher.dispatch(PAYLOAD_TYPE_SHAPSHOT, _result("AAPL", 1))
+        dispatcher.dispatch(PAYLOAD_TYPE_SHAPSHOT, _result("MSFT", 2))
+        dispatcher.dispatch(PAYLOAD_TYPE_SHAPSHOT, _result("AAPL", 3))
+        dispatcher.dispatch(PAYLOAD_TYPE_SHAPSHOT, _result("AAPL", 4))
+        release.set()
+        dispatcher.stop()
+        self.assertEqual([d[1:] for d in delivered], [("BUSY", 0), ("AAPL", 4), ("MSFT", 2)])
+        stats = dispatcher.get_stats()
+        self.assertEqual((stats["conflated"], stats["dropped"]), (2, 0))
+        self.assertGreater(stats["max_lag_ms"], 0)
+
+    def test_streaming_client_callback_off_network_thread(self):
+        client = DataStreamingClient("app_key", "app_secret", "us", "session")
+        threads = []
+        client.on_quotes_message = lambda _client, topic, quotes: threads.append(threading.current_thread())
+        client.enable_dispatcher(workers=2)
+        client._quotes_message(client, None, SimpleNamespace(topic=PAYLOAD_TYPE_TICK, payload=_tick()))
+        client.disable_dispatcher()
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+        self.assertIsNone(client.get_dispatcher_stats())
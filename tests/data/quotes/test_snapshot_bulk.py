@@ -0,0 +1,70 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import unittest
+
+from tests.core.http.local_server import LocalServer, LOCAL_ENDPOINT
+from webull.core.async_client import AsyncApiClient
+from webull.core.client import ApiClient
+from webull.data.common.category import Category
+from webull.data.quotes.market_data import MarketData
+
+
+def _handler(method, path, query, body):
+    symbols = query["symbols"].split(",")
+    if "BAD" in symbols:
+        return 400, {"error_code": "INVALID_SYMBOL", "message": "bad symbol"}
+    # the server does not keep the requested order
+    return 200, [{"symbol": s, "price": "1"} for s in reversed(symbols)]
+
+
+class TestSnapshotBulk(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LocalServer(_handler).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def _chunk_sizes(self, before):
+        return [len(r[2]["symbols"].split(",")) for r in self.server.requests[before:]]
+
+    def test_bulk_snapshot(self):
+        api_client = ApiClient("app_key", "app_secret", "us", port=self.server.port)
+        api_client.add_endpoint("us", LOCAL_ENDPOINT)
+        market_data = MarketData(api_client)
+        symbols = ["S%d" % i for i in range(250)]
+        before = len(self.server.requests)
+        result = market_data.get_snapshot_bulk(symbols + ["S0"], Category.US_STOCK.name, max_workers=4)
+        self.assertFalse(result.has_errors())
+        self.assertEqual([s["symbol"] for s in result.get_data()], symbols)
+        self.assertEqual(sorted(self._chunk_sizes(before)), [50, 100, 100])
+
+        before = len(self.server.requests)
+        result = market_data.get_snapshot_bulk(symbols[:45] + ["BAD"], Category.HK_STOCK.name, hk_bmp=True)
+        self.assertEqual(sorted(self._chunk_sizes(before)), [6, 20, 20])
+        self.assertEqual(len(result.get_data()), 40)
+        self.assertEqual(len(result.get_errors()), 1)
+        self.assertEqual(result.get_errors()[0].get_symbols(), symbols[40:45] + ["BAD"])
+
+    def test_bulk_snapshot_async(self):
+        api_client = AsyncApiClient("app_key", "app_secret", "us", port=self.server.port)
+        api_client.add_endpoint("us", LOCAL_ENDPOINT)
+        market_data = MarketData(api_client)
+        symbols = ["S%d" % i for i in range(210)]
+        result = asyncio.run(market_data.get_snapshot_bulk(symbols, Category.US_STOCK.name))
+        self.assertEqual([s["symbol"] for s in result.get_data()], symbols)
+        api_client.close()
@@ -0,0 +1,182 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import asyncio
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from webull.core.client import ApiClient
+from webull.core.exception.exceptions import ClientException
+from webull.core.retry.retry_condition import RetryCondition
+from webull.core.retry.retry_policy_context import RetryPolicyContext
+from webull.core.utils import validation
+
+DEFAULT_MAX_CONCURRENCY = 64
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncApiClient(ApiClient):
+    """
+    ApiClient whose get_response is a coroutine.
+
+    Signing, endpoint resolution and retry policies are shared with ApiClient. The HTTP exchange
+    runs on the pooled keep-alive sessions through a bounded executor, and the backoff between
+    retries is awaited with asyncio.sleep, so the event loop is never blocked.
+
+    All facades (MarketData, Instrument, OrderOperationV3, ...) only build a request and return
+    client.get_response(request), so built on this client their methods return awaitables.
+
+    :param max_concurrency: Max number of HTTP exchanges in flight at the same time.
+    Other parameters are the same as ApiClient.
+    """
+
+    def __init__(self, app_key, app_secret, region_id, max_concurrency=DEFAULT_MAX_CONCURRENCY, **kwargs):
+        validation.assert_integer_positive(max_concurrency, "max_concurrency")
+        kwargs.setdefault('pool_size', max_concurrency)
+        ApiClient.__init__(self, app_key, app_secret, region_id, **kwargs)
+        self._max_concurrency = max_concurrency
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def get_max_concurrency(self):
+        return self._max_concurrency
+
+    def get_response_sync(self, api_request):
+        """
+        Blocking variant, used by the client initialization (token check) which runs before any loop.
+        """
+        return ApiClient.get_response(self, api_request)
+
+    def blocking_client(self):
+        return _BlockingApiClient(self)
+
+    async def get_response(self, api_request):
+        response_cache = self._response_cache
+        cache_key = self._get_response_cache_key(api_request)
+        if cache_key is not None:
+            response = await self._run_cache_call(
+                response_cache, response_cache.get,
+                cache_key, lambda: self._refresh_cached_response(response_cache, cache_key, api_request))
+            if response is not None:
+                return response
+        single_flight = self._single_flight
+        key = self._get_single_flight_key(api_request)
+        if key is not None:
+            status, headers, body, exception, response = await single_flight.do_async(
+                key, lambda: self._implementation_of_do_action_async(api_request))
+        else:
+            status, headers, body, exception, response = await self._implementation_of_do_action_async(api_request)
+        if exception:
+            logger.error("get_response exception. %s", json.dumps(vars(exception), default=str, indent=2))
+            raise exception
+        logger.debug('Response received, status:%s, headers:%s, body:%s' % (status, headers, body))
+        if cache_key is not None:
+            await self._run_cache_call(response_cache, response_cache.put, cache_key, response)
+        return response
+
+    def close(self):
+        with self._executor_lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        ApiClient.close(self)
+
+    async def _implementation_of_do_action_async(self, request, signer=None):
+        endpoint = self._prepare_action(request)
+        return await self._handle_retry_and_timeout_async(endpoint, request, signer)
+
+    async def _handle_retry_and_timeout_async(self, endpoint, request, signer):
+        request_read_timeout = self._get_request_read_timeout(request)
+        request_connect_timeout = self._get_request_connect_timeout(request)
+        loop = asyncio.get_running_loop()
+        deadline = self._get_request_deadline(request)
+        circuit_breaker = self._get_circuit_breaker(endpoint, request)
+        retries = 0
+        while True:
+            # checked first, a call failing fast takes no rate limit token
+            if circuit_breaker is not None and not circuit_breaker.allow():
+                status, headers, body, exception, response = self._circuit_open(endpoint, request)
+                break
+            try:
+                attempt_timeouts = None
+                if await self._rate_limiter.acquire_async(request, deadline) is not None:
+                    attempt_timeouts = self._get_attempt_timeouts(deadline, request_read_timeout,
+                                                                  request_connect_timeout)
+                if attempt_timeouts is None:
+                    status, headers, body, exception, response = self._deadline_exceeded(request, retries)
+                else:
+                    status, headers, body, exception, response = await loop.run_in_executor(
+                        self._get_executor(), self._send_attempt,
+                        endpoint, request, attempt_timeouts[0], attempt_timeouts[1], signer)
+            except BaseException:
+                if circuit_breaker is not None:
+                    circuit_breaker.on_cancel()
+                raise
+            if attempt_timeouts is None:
+                if circuit_breaker is not None:
+                    circuit_breaker.on_cancel()
+                break
+            self._record_attempt(circuit_breaker, exception, status)
+            retry_policy_context = RetryPolicyContext(request, exception, retries, status, deadline)
+            retryable = self._retry_policy.should_retry(retry_policy_context)
+            if retryable & RetryCondition.NO_RETRY:
+                break
+            logger.debug("Retry needed. Request:%s Retries:%d", request.get_action_name(), retries)
+            retry_policy_context.retryable = retryable
+            time_to_sleep = self._retry_policy.compute_delay_before_next_retry(retry_policy_context)
+            if not retry_policy_context.has_time_for_retry(time_to_sleep / 1000.0):
+                logger.debug("Retry skipped, the deadline is too close. Request:%s Retries:%d",
+                             request.get_action_name(), retries)
+                break
+            await asyncio.sleep(time_to_sleep / 1000.0)
+            retries += 1
+
+        if isinstance(exception, ClientException):
+            raise exception
+        return status, headers, body, exception, response
+
+    async def _run_cache_call(self, response_cache, func, *args):
+        """A cache backed by a store reads and writes the disk, it is called on the executor thread."""
+        if response_cache.get_store() is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), func, *args)
+
+    def _get_executor(self):
+        executor = self._executor
+        if executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency,
+                                                        thread_name_prefix="Thread-Async-Api-Client")
+                executor = self._executor
+        return executor
+
+
+class _BlockingApiClient:
+    """Blocking view of an AsyncApiClient, every other attribute is delegated."""
+
+    def __init__(self, async_api_client):
+        self._async_api_client = async_api_client
+
+    def get_response(self, api_request):
+        return self._async_api_client.get_response_sync(api_request)
+
+    def __getattr__(self, name):
+        return getattr(self._async_api_client, name)
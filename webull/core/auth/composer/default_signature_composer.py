@@ -75,9 +75,9 @@ def _refresh_sign_headers(host, headers, app_key_id, signer_spec):
 def _gen_signature(string_to_sign, secret, signer_spec):
     return signer_spec.get_sign_string(string_to_sign, secret + SECRET_TAILER)
 
-def _get_body_string(body_params, signer_spec):
+def _get_body_string(body_params, signer_spec, body_content=None):
     if body_params is not None:
-        raw_str = common.json_dumps_compact(body_params)
+        raw_str = body_content if body_content is not None else common.json_dumps_compact(body_params)
         if signer_spec == sha_hmac256_new:
             hex_digest = common.sha256_hex(raw_str)
         else:
@@ -110,7 +110,7 @@ def _lower_key_dict(od):
         lower_key_dict[k.lower()] = v
     return lower_key_dict
 
-def calc_signature(headers, host, uri, queries, body_params, app_key_id, app_key_secret, signer_spec):
+def calc_signature(headers, host, uri, queries, body_params, app_key_id, app_key_secret, signer_spec, body_content=None):
     sign_headers,signer_spec = _refresh_sign_headers(host, headers, app_key_id, signer_spec)
     logger.debug("sign_headers:%s", sign_headers)
     sign_params = _lower_key_dict(sign_headers)
@@ -124,7 +124,7 @@ def calc_signature(headers, host, uri, queries, body_params, app_key_id, app_key
                 cv = str(v)
             sign_params[k] = cv
     logger.debug("body:%s", body_params)
-    body_string = _get_body_string(body_params, signer_spec)
+    body_string = _get_body_string(body_params, signer_spec, body_content)
     logger.debug("body_string:%s" % body_string)
     string_to_sign = _build_sign_string(sign_params, uri, body_string)
     logger.debug("string_to_sign:%s" % string_to_sign)
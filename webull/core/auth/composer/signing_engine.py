@@ -0,0 +1,163 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+Signing engine of an app key, computes the same signature as
+default_signature_composer.calc_signature but keeps the parts that never
+change between two calls of a client: the algorithm and the static sign
+headers of each host, their pre-sorted sign params, and an HMAC already
+keyed with the app secret that is copied for each call.
+"""
+
+import base64
+import hashlib
+import hmac
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime
+from operator import itemgetter
+
+import webull.core.headers as hd
+from webull.core.auth.algorithm import sha_hmac1
+from webull.core.auth.algorithm import sha_hmac256_new
+from webull.core.auth.composer import default_signature_composer as sc
+from webull.core.compat import ensure_bytes
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+from webull.core.utils import common
+from six.moves.urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+_DIGESTS = {
+    sha_hmac1: hashlib.sha1,
+    sha_hmac256_new: hashlib.sha256,
+}
+
+_param_key = itemgetter(0)
+
+
+def new_nonce():
+    """Random UUID, same format as common.get_uuid without the hostname lookup and the two hashes."""
+    return str(uuid.uuid4())
+
+
+class _HostSigning:
+    __slots__ = ('signer_spec', 'headers', 'sign_params', 'sign_keys', 'hmac_template')
+
+    def __init__(self, host, app_key_id, secret):
+        if common.is_not_upgrade_api_host(host):
+            signer_spec = sha_hmac256_new
+        else:
+            signer_spec = sha_hmac1
+        self.signer_spec = signer_spec
+        self.headers = {
+            hd.APP_KEY: app_key_id,
+            hd.SIGN_VERSION: signer_spec.get_signer_version(),
+            hd.SIGN_ALGORITHM: signer_spec.get_signer_name(),
+        }
+        sign_params = dict((k.lower(), v) for k, v in self.headers.items())
+        sign_params[hd.NATIVE_HOST.lower()] = host
+        self.sign_params = sorted(sign_params.items(), key=_param_key)
+        self.sign_keys = frozenset(sign_params) | {hd.TIMESTAMP, hd.NONCE}
+        self.hmac_template = hmac.new(ensure_bytes(secret + sc.SECRET_TAILER), digestmod=_DIGESTS[signer_spec])
+
+
+class SigningEngine:
+    """
+    :param app_key_id: App key of the client.
+    :param app_key_secret: App secret of the client.
+    """
+
+    def __init__(self, app_key_id, app_key_secret):
+        self._app_key_id = app_key_id
+        self._app_key_secret = app_key_secret
+        self._hosts = {}
+        self._lock = threading.Lock()
+        self._timestamp = (None, None)
+
+    def sign(self, headers, host, uri, queries, body_params, body_content=None):
+        """
+        Adds the sign headers and the signature to headers, returns the signature.
+        body_content are the serialized body bytes when the caller already has them.
+        """
+        host_signing = self._get_host_signing(host)
+        timestamp = self._get_timestamp()
+        nonce = new_nonce()
+        headers.update(host_signing.headers)
+        headers[hd.TIMESTAMP] = timestamp
+        headers[hd.NONCE] = nonce
+
+        if queries and not host_signing.sign_keys.isdisjoint(queries):
+            sign_params = self._merge_conflicting_queries(host_signing, timestamp, nonce, queries)
+        else:
+            # both lists are sorted runs, the sort only merges them
+            sign_params = host_signing.sign_params + [(hd.NONCE, nonce), (hd.TIMESTAMP, timestamp)]
+            if queries:
+                sign_params.extend((k, str(v)) for k, v in queries.items())
+            sign_params.sort(key=_param_key)
+
+        body_string = sc._get_body_string(body_params, host_signing.signer_spec, body_content)
+        string_to_sign = self._build_sign_string(sign_params, uri, body_string)
+        logger.debug("string_to_sign:%s", string_to_sign)
+        h = host_signing.hmac_template.copy()
+        h.update(ensure_bytes(string_to_sign))
+        signature = base64.b64encode(h.digest()).strip().decode('utf-8')
+        headers[hd.SIGNATURE] = signature
+        return signature
+
+    def _get_host_signing(self, host):
+        host_signing = self._hosts.get(host)
+        if host_signing is None:
+            if not host:
+                raise ClientException(error_code.SDK_INVALID_PARAMETER)
+            host_signing = _HostSigning(host, self._app_key_id, self._app_key_secret)
+            with self._lock:
+                self._hosts[host] = host_signing
+        return host_signing
+
+    def _get_timestamp(self):
+        # same value as common.get_iso_8601_date(), formatted once per second
+        second = int(time.time())
+        cached_second, timestamp = self._timestamp
+        if second != cached_second:
+            timestamp = datetime.utcfromtimestamp(second).strftime(common.FORMAT_ISO_8601)
+            self._timestamp = (second, timestamp)
+        return timestamp
+
+    @staticmethod
+    def _merge_conflicting_queries(host_signing, timestamp, nonce, queries):
+        # a query key that is also a sign header key, merged the way calc_signature does it
+        sign_params = dict(host_signing.sign_params)
+        sign_params[hd.TIMESTAMP] = timestamp
+        sign_params[hd.NONCE] = nonce
+        for (k, v) in queries.items():
+            cv = sign_params.get(k)
+            sign_params[k] = str(cv) + sc.PARAMS_JOIN + str(v) if cv is not None else str(v)
+        return sorted(sign_params.items(), key=_param_key)
+
+    @staticmethod
+    def _build_sign_string(sign_params, uri, body_string):
+        joined = [str(k) + sc.PARAM_KV_JOIN + v for (k, v) in sign_params]
+        if uri:
+            string_to_sign = uri + sc.PARAMS_JOIN + sc.PARAMS_JOIN.join(joined)
+        else:
+            string_to_sign = sc.PARAM_KV_JOIN.join(joined)
+        if body_string:
+            string_to_sign = string_to_sign + sc.PARAMS_JOIN + body_string
+        return quote(string_to_sign, safe='')
@@ -57,6 +57,7 @@ which was part of Alibaba Group.
 """
 
 import logging
+from webull.core.auth.composer.signing_engine import SigningEngine
 from webull.core.auth.signers.signer import Signer
 
 logger = logging.getLogger(__name__) 
@@ -64,9 +65,13 @@ logger = logging.getLogger(__name__)
 class AppKeySigner(Signer):
     def __init__(self, app_key_credential):
         self._credential = app_key_credential
+        self._signing_engine = SigningEngine(app_key_credential.app_key_id, app_key_credential.app_key_secret)
+
+    def get_signing_engine(self):
+        return self._signing_engine
 
     def sign(self, request):
         cred = self._credential
         host = request.get_endpoint()
-        header = request.get_signed_header(host, cred.app_key_id, cred.app_key_secret)
-        return header
\ No newline at end of file
+        header = request.get_signed_header(host, cred.app_key_id, cred.app_key_secret, self._signing_engine)
+        return header
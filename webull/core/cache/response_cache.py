@@ -0,0 +1,273 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import logging
+import threading
+import time
+
+from cachetools import TLRUCache
+
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+from webull.core.http.api_response import ApiResponse
+from webull.core.http.single_flight import get_request_key
+from webull.core.utils import json_backend as json_backend_module
+from webull.core.utils import validation
+
+DEFAULT_MAXSIZE = 1024
+
+logger = logging.getLogger(__name__)
+
+_HOUR = 3600
+_DAY = 24 * _HOUR
+
+# reference data changing at most daily, keyed by request path
+DEFAULT_REFERENCE_TTLS = {
+    "/openapi/instrument/stock/list": 6 * _HOUR,
+    "/openapi/instrument/futures/products": 6 * _HOUR,
+    "/openapi/instrument/futures/product-classes": _DAY,
+    "/openapi/instrument/event/series/list": 6 * _HOUR,
+    "/trade/calendar": _DAY,
+    "/trade/instrument": 6 * _HOUR,
+    "/openapi/fundamentals/fund/allocation": _DAY,
+    "/openapi/fundamentals/fund/brief": _DAY,
+    "/openapi/fundamentals/fund/dividends": _DAY,
+    "/openapi/fundamentals/fund/files": _DAY,
+    "/openapi/fundamentals/fund/holdings": _DAY,
+    "/openapi/fundamentals/fund/net-value": _DAY,
+    "/openapi/fundamentals/fund/performance": _DAY,
+    "/openapi/fundamentals/fund/rating": _DAY,
+    "/openapi/fundamentals/fund/splits": _DAY,
+}
+
+
+class _Entry:
+    __slots__ = ('response', 'expires')
+
+    def __init__(self, response, expires):
+        self.response = response
+        self.expires = expires
+
+
+class _ResponseTLRUCache(TLRUCache):
+
+    def __init__(self, maxsize, ttu, timer):
+        TLRUCache.__init__(self, maxsize, ttu, timer)
+        self.evictions = 0
+
+    def popitem(self):
+        item = TLRUCache.popitem(self)
+        self.evictions += 1
+        return item
+
+
+class ResponseCache:
+    """
+    Caches successful responses of GET requests on reference data endpoints.
+    Each endpoint path has its own TTL, the least recently used response is evicted when maxsize is reached.
+    Every hit returns a new response object rebuilt from the cached status, headers and body bytes.
+
+    With a store, responses are also kept on disk: a restarted process serves them while they are
+    younger than their TTL, and until the validity window of the store ends it serves them stale
+    while they are refetched in the background.
+
+    :param ttls: Dict of request path to TTL in seconds, paths not in it are never cached.
+    Defaults to DEFAULT_REFERENCE_TTLS.
+    :param maxsize: Max number of responses kept in memory.
+    :param store: webull.core.cache.sqlite_store.SqliteResponseStore or None.
+    """
+
+    def __init__(self, ttls=None, maxsize=DEFAULT_MAXSIZE, timer=time.monotonic, store=None, json_backend=None):
+        validation.assert_integer_positive(maxsize, "maxsize")
+        self._ttls = {}
+        for path, ttl in (DEFAULT_REFERENCE_TTLS if ttls is None else ttls).items():
+            self.set_ttl(path, ttl)
+        self._lock = threading.Lock()
+        self._timer = timer
+        self._cache = _ResponseTLRUCache(maxsize, self._time_to_use, timer)
+        self._hits = {}
+        self._misses = {}
+        self._store = None
+        self._json_backend = None
+        self._refreshing = set()
+        self._disk_hits = 0
+        self._stale_hits = 0
+        self._refreshes = 0
+        self.set_store(store, json_backend)
+
+    def get_maxsize(self):
+        return self._cache.maxsize
+
+    def get_ttls(self):
+        return dict(self._ttls)
+
+    def get_ttl(self, path):
+        return self._ttls.get(path)
+
+    def set_ttl(self, path, ttl):
+        """
+        :param path: Request path, such as /trade/calendar.
+        :param ttl: Seconds a response is kept, None stops caching the path.
+        """
+        if ttl is None:
+            self._ttls.pop(path, None)
+            return
+        if not isinstance(ttl, (int, float)) or ttl <= 0:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER, "ttl should be a positive number.")
+        self._ttls[path] = ttl
+
+    def set_store(self, store, json_backend=None):
+        """
+        :param store: webull.core.cache.sqlite_store.SqliteResponseStore, None keeps responses in memory only.
+        :param json_backend: JSON backend of the responses loaded from the store.
+        """
+        self._store = store
+        self._json_backend = json_backend if json_backend is not None else json_backend_module.get_json_backend()
+
+    def get_store(self):
+        return self._store
+
+    def get_key(self, request, endpoint=None):
+        """Cache key of the request, None when its responses are not cached."""
+        if request.get_action_name() not in self._ttls:
+            return None
+        return get_request_key(request, endpoint)
+
+    def get(self, key, refresh=None):
+        """
+        :param key: Cache key returned by get_key.
+        :param refresh: Callable without arguments refetching the response, called on a background thread
+        when a stale response is loaded from the store.
+        :return: A copy of the cached response, None on a miss.
+        """
+        path = key[1]
+        with self._lock:
+            entry = self._cache.get(key)
+        response = entry.response if entry is not None else None
+        if response is None and self._store is not None:
+            response = self._load(key, refresh)
+        with self._lock:
+            counters = self._hits if response is not None else self._misses
+            counters[path] = counters.get(path, 0) + 1
+        # each caller parses its own body, changing it does not change the cached response
+        return response.copy() if response is not None else None
+
+    def put(self, key, response, age=0):
+        """
+        :param age: Seconds since the response was received.
+        """
+        ttl = self._ttls.get(key[1])
+        if ttl is None:
+            return
+        with self._lock:
+            self._cache[key] = _Entry(response, self._timer() + ttl - age)
+        if self._store is not None and age == 0:
+            try:
+                self._store.save(key, response.status_code, response.headers, response.content)
+            except Exception as e:
+                logger.warning("Failed to store response. Path:%s Error:%s", key[1], e)
+
+    def _load(self, key, refresh):
+        try:
+            stored = self._store.load(key)
+        except Exception as e:
+            logger.warning("Failed to load stored response. Path:%s Error:%s", key[1], e)
+            return None
+        if stored is None:
+            return None
+        ttl = self._ttls.get(key[1])
+        if ttl is None:
+            return None
+        response = ApiResponse.from_content(stored.status, stored.headers, stored.body, self._json_backend)
+        age = max(self._store.now() - stored.stored_at, 0)
+        if age < ttl:
+            self.put(key, response, age)
+            with self._lock:
+                self._disk_hits += 1
+            return response
+        with self._lock:
+            self._stale_hits += 1
+        if refresh is not None:
+            self._refresh(key, refresh)
+        return response
+
+    def _refresh(self, key, refresh):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self._refreshes += 1
+
+        def run():
+            try:
+                refresh()
+            except Exception as e:
+                logger.warning("Failed to refresh stale response. Path:%s Error:%s", key[1], e)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        thread = threading.Thread(target=run, name="Thread-Response-Cache-Refresh", daemon=True)
+        thread.start()
+
+    def invalidate(self, path=None):
+        """
+        Drops cached responses, of one request path or all of them.
+        :return: Number of responses dropped.
+        """
+        with self._lock:
+            if path is None:
+                dropped = len(self._cache)
+                self._cache.clear()
+            else:
+                keys = [key for key in list(self._cache.keys()) if key[1] == path]
+                for key in keys:
+                    self._cache.pop(key, None)
+                dropped = len(keys)
+        if self._store is not None:
+            dropped = max(dropped, self._store.delete(path))
+        return dropped
+
+    def get_stats(self):
+        """
+        Cache statistics, total and per request path.
+        """
+        with self._lock:
+            paths = {}
+            for path in set(self._hits) | set(self._misses):
+                paths[path] = self._format_stats(self._hits.get(path, 0), self._misses.get(path, 0))
+            stats = self._format_stats(sum(self._hits.values()), sum(self._misses.values()))
+            stats['size'] = len(self._cache)
+            stats['maxsize'] = self._cache.maxsize
+            stats['evictions'] = self._cache.evictions
+            stats['disk_hits'] = self._disk_hits
+            stats['stale_hits'] = self._stale_hits
+            stats['refreshes'] = self._refreshes
+            stats['paths'] = paths
+            return stats
+
+    @staticmethod
+    def _format_stats(hits, misses):
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': float(hits) / lookups if lookups else 0.0,
+        }
+
+    @staticmethod
+    def _time_to_use(key, entry, now):
+        return entry.expires
@@ -0,0 +1,133 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from webull.core.utils import validation
+
+DEFAULT_VALIDITY_SECONDS = 7 * 24 * 3600
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    cache_key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    stored_at REAL NOT NULL
+)
+"""
+
+
+class StoredResponse:
+    __slots__ = ('status', 'headers', 'body', 'stored_at')
+
+    def __init__(self, status, headers, body, stored_at):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+
+class SqliteResponseStore:
+    """
+    Keeps reference data responses in a SQLite file, so a restarted process starts with them.
+    A response older than validity_seconds is never loaded again and is removed by purge.
+
+    :param path: SQLite file path, its directory is created when missing.
+    :param validity_seconds: Max age of a stored response, in seconds.
+    """
+
+    def __init__(self, path, validity_seconds=DEFAULT_VALIDITY_SECONDS, timer=time.time):
+        validation.assert_integer_positive(validity_seconds, "validity_seconds")
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self._path = path
+        self._validity_seconds = validity_seconds
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(_SCHEMA)
+
+    def get_path(self):
+        return self._path
+
+    def get_validity_seconds(self):
+        return self._validity_seconds
+
+    def now(self):
+        return self._timer()
+
+    def load(self, key):
+        """Returns the StoredResponse of key, None when missing or older than the validity window."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, headers, body, stored_at FROM responses WHERE cache_key = ?",
+                (self._encode_key(key),)).fetchone()
+        if row is None or self._timer() - row[3] >= self._validity_seconds:
+            return None
+        return StoredResponse(row[0], json.loads(row[1]), bytes(row[2]), row[3])
+
+    def save(self, key, status, headers, body, stored_at=None):
+        if stored_at is None:
+            stored_at = self._timer()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (cache_key, path, status, headers, body, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self._encode_key(key), key[1], status, json.dumps(dict(headers or {})), sqlite3.Binary(body),
+                 stored_at))
+
+    def delete(self, path=None):
+        """
+        Deletes the stored responses of one request path, or all of them.
+        :return: Number of responses deleted.
+        """
+        with self._lock, self._connection:
+            if path is None:
+                cursor = self._connection.execute("DELETE FROM responses")
+            else:
+                cursor = self._connection.execute("DELETE FROM responses WHERE path = ?", (path,))
+            return cursor.rowcount
+
+    def purge(self):
+        """Deletes the responses older than the validity window, returns their number."""
+        with self._lock, self._connection:
+            cursor = self._connection.execute("DELETE FROM responses WHERE stored_at <= ?",
+                                              (self._timer() - self._validity_seconds,))
+            return cursor.rowcount
+
+    def get_size(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _encode_key(key):
+        return json.dumps(key, default=str)
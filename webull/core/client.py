@@ -49,19 +49,29 @@ from logging.handlers import TimedRotatingFileHandler
 import webull.core
 import webull.core.headers as hd
 import webull.core.retry.retry_policy as retry_policy
+from webull.core.ratelimit.rate_limiter import NO_RATE_LIMITER
 from webull.core import compat
 from webull.core.auth.signers.signer_factory import SignerFactory
+from webull.core.cache.response_cache import ResponseCache
+from webull.core.cache.sqlite_store import SqliteResponseStore, DEFAULT_VALIDITY_SECONDS
 from webull.core.common.api_type import DEFAULT as HTTP_API_TYPE
 from webull.core.endpoint.default_endpoint_resolver import DefaultEndpointResolver
 from webull.core.endpoint.resolver_endpoint_request import ResolveEndpointRequest
 from webull.core.exception import error_code
 from webull.core.exception.exceptions import ClientException, ServerException
 from webull.core.headers import WB_USER_ID
+from webull.core.http.api_response import ApiResponse
+from webull.core.http.hedging import Hedger
 from webull.core.http.response import Response
+from webull.core.http.session_pool import SessionPool, DEFAULT_POOL_SIZE, DEFAULT_POOL_IDLE_SECONDS, \
+    DEFAULT_POOL_MAX_AGE_SECONDS
+from webull.core.http.single_flight import SingleFlight, get_request_key
 from webull.core.request import BaseRequest
+from webull.core.retry.circuit_breaker import CircuitBreakers, RetryBudget, is_failure
 from webull.core.retry.retry_condition import RetryCondition
 from webull.core.retry.retry_policy_context import RetryPolicyContext
 from webull.core.utils import common, validation
+from webull.core.utils import json_backend as json_backend_module
 from requests import codes
 from requests.structures import CaseInsensitiveDict
 from requests.structures import OrderedDict
@@ -75,6 +85,17 @@ CLIENT_SOURCE_ENV = "WEBULL_CLIENT_SOURCE"
 
 logger = logging.getLogger(__name__)
 
+_platform_user_agent = None
+
+
+def _get_platform_user_agent():
+    """(user_agent_header(), default_user_agent()), they do not change while the process runs."""
+    global _platform_user_agent
+    if _platform_user_agent is None:
+        _platform_user_agent = (ApiClient.user_agent_header(), ApiClient.default_user_agent())
+    return _platform_user_agent
+
+
 class ApiClient:
     LOG_FORMAT = '%(thread)d %(threadName)s %(asctime)s %(name)s %(levelname)s %(message)s'
     def __init__(
@@ -92,7 +113,18 @@ class ApiClient:
         max_retry_num=None,
         user_id=None,
         token_check_duration_seconds = 300,
-        token_check_interval_seconds = 5
+        token_check_interval_seconds = 5,
+        pool_size=DEFAULT_POOL_SIZE,
+        pool_idle_seconds=DEFAULT_POOL_IDLE_SECONDS,
+        pool_max_age_seconds=DEFAULT_POOL_MAX_AGE_SECONDS,
+        rate_limiter=None,
+        json_backend=None,
+        single_flight=False,
+        response_cache=None,
+        total_timeout=None,
+        circuit_breakers=None,
+        retry_budget=None,
+        hedger=None
     ):
         self._file_logger_set = None
         self._stream_logger_set = None
@@ -103,6 +135,7 @@ class ApiClient:
         self._port = port
         self._connect_timeout = connect_timeout
         self._read_timeout = timeout
+        self._total_timeout = total_timeout
         self._extra_user_agent = {}
         self._verify = verify
         _credential = {
@@ -119,6 +152,10 @@ class ApiClient:
             self._retry_policy = retry_policy.get_default_retry_policy(self._max_retry_num)
         else:
             self._retry_policy = retry_policy.NO_RETRY_POLICY
+        self._circuit_breakers = CircuitBreakers() if circuit_breakers is True else circuit_breakers or None
+        self._retry_budget = RetryBudget() if retry_budget is True else retry_budget or None
+        if self._retry_budget is not None:
+            self._retry_policy = retry_policy.with_retry_budget(self._retry_policy, self._retry_budget)
         self._token = None
 
         validation.assert_integer_positive(token_check_duration_seconds, "token_check_duration_seconds")
@@ -126,6 +163,16 @@ class ApiClient:
         validation.assert_integer_positive(token_check_interval_seconds, "token_check_interval_seconds")
         self._token_check_interval_seconds = token_check_interval_seconds
         self._token_dir = None
+        self._session_pool = SessionPool(pool_size, pool_idle_seconds, pool_max_age_seconds)
+        self._rate_limiter = rate_limiter if rate_limiter is not None else NO_RATE_LIMITER
+        self._json_backend = json_backend_module.get_json_backend(json_backend)
+        # User-Agent and client source, built on first use and dropped when the user agent changes
+        self._static_headers = None
+        self._single_flight = SingleFlight() if single_flight else None
+        self._response_cache = None
+        self.set_response_cache(response_cache)
+        self._hedger = None
+        self.set_hedger(hedger)
 
     def get_region_id(self):
         return self._region_id
@@ -152,9 +199,11 @@ class ApiClient:
         :return:
         """
         self._user_agent = agent
+        self._static_headers = None
     
     def append_user_agent(self, key, value):
         self._extra_user_agent.update({key: value})
+        self._static_headers = None
 
     def set_token(self, token):
         self._token = token
@@ -168,12 +217,169 @@ class ApiClient:
     def get_token_check_interval_seconds(self):
         return self._token_check_interval_seconds
 
+    def get_total_timeout(self):
+        return self._total_timeout
+
+    def set_total_timeout(self, total_timeout):
+        """
+        Seconds a request may take over all its attempts and the backoff between them, None for no limit.
+        Each attempt's connect and read timeouts are shrunk to the time left, and a retry is skipped
+        when it cannot complete before the deadline.
+        :param total_timeout: Seconds, overridden by ApiRequest.set_total_timeout.
+        """
+        self._total_timeout = total_timeout
+
     def set_token_dir(self, token_dir):
         self._token_dir = token_dir
 
     def get_token_dir(self):
         return self._token_dir
 
+    def get_session_pool(self):
+        return self._session_pool
+
+    def get_pool_stats(self):
+        return self._session_pool.get_stats()
+
+    def set_rate_limiter(self, rate_limiter):
+        """
+        Requests wait for a permit of the rate limiter before each attempt, None disables rate limiting.
+        :param rate_limiter: webull.core.ratelimit.rate_limiter.RateLimiter
+        """
+        self._rate_limiter = rate_limiter if rate_limiter is not None else NO_RATE_LIMITER
+
+    def get_rate_limiter(self):
+        return self._rate_limiter
+
+    def get_json_backend(self):
+        return self._json_backend
+
+    def set_hedger(self, hedger):
+        """
+        Latency-critical GETs not answered within a percentile of their recent latency are sent a second
+        time, the first answer is returned.
+        :param hedger: webull.core.http.hedging.Hedger, True for one with the default market data paths,
+        None or False disables hedging.
+        """
+        if hedger is True:
+            hedger = Hedger()
+        previous = self._hedger
+        self._hedger = hedger or None
+        if previous is not None and previous is not self._hedger:
+            previous.close()
+
+    def get_hedger(self):
+        return self._hedger
+
+    def get_hedging_stats(self):
+        if self._hedger is None:
+            return {}
+        return self._hedger.get_stats()
+
+    def get_circuit_breakers(self):
+        return self._circuit_breakers
+
+    def get_circuit_breaker_states(self):
+        """
+        State of the circuit of each host and request path called so far, for health checks.
+        :return: Dict of 'host path' to CLOSED, OPEN or HALF_OPEN.
+        """
+        if self._circuit_breakers is None:
+            return {}
+        return self._circuit_breakers.get_states()
+
+    def get_retry_budget(self):
+        return self._retry_budget
+
+    def get_retry_budget_stats(self):
+        if self._retry_budget is None:
+            return {}
+        return self._retry_budget.get_stats()
+
+    def set_single_flight(self, enabled):
+        """
+        Concurrent identical GET requests share one HTTP exchange and its response object,
+        requests with a body are always sent on their own.
+        :param enabled: bool
+        """
+        if not enabled:
+            self._single_flight = None
+        elif self._single_flight is None:
+            self._single_flight = SingleFlight()
+
+    def get_single_flight(self):
+        return self._single_flight
+
+    def get_single_flight_stats(self):
+        if self._single_flight is None:
+            return {}
+        return self._single_flight.get_stats()
+
+    def set_response_cache(self, response_cache):
+        """
+        Successful GET responses of reference data endpoints are served from the cache until their TTL expires.
+        :param response_cache: webull.core.cache.response_cache.ResponseCache, True for one with the default
+        reference data TTLs, None or False disables caching.
+        """
+        if response_cache is True:
+            response_cache = ResponseCache()
+        self._response_cache = response_cache or None
+
+    def get_response_cache(self):
+        return self._response_cache
+
+    def enable_reference_cache(self, path, validity_seconds=DEFAULT_VALIDITY_SECONDS):
+        """
+        Keeps reference data responses in a SQLite file as well, so that a restarted process starts warm:
+        responses within their TTL are served from the file, older ones within the validity window are
+        served stale and refetched in the background.
+        :param path: SQLite file path.
+        :param validity_seconds: Max age of a response loaded from the file.
+        :return: webull.core.cache.response_cache.ResponseCache
+        """
+        if self._response_cache is None:
+            self._response_cache = ResponseCache()
+        self._response_cache.set_store(SqliteResponseStore(path, validity_seconds), self._json_backend)
+        return self._response_cache
+
+    def get_response_cache_stats(self):
+        if self._response_cache is None:
+            return {}
+        return self._response_cache.get_stats()
+
+    def invalidate_response_cache(self, path=None):
+        """
+        :param path: Request path whose cached responses are dropped, None drops all of them.
+        :return: Number of responses dropped.
+        """
+        if self._response_cache is None:
+            return 0
+        return self._response_cache.invalidate(path)
+
+    def _get_response_cache_key(self, request):
+        if self._response_cache is None or not isinstance(request, BaseRequest):
+            return None
+        return self._response_cache.get_key(request, request.get_endpoint() or self._region_id)
+
+    def _refresh_cached_response(self, response_cache, cache_key, request):
+        status, headers, body, exception, response = self._implementation_of_do_action(request)
+        if exception:
+            raise exception
+        response_cache.put(cache_key, response)
+
+    def _get_single_flight_key(self, request):
+        if self._single_flight is None or not isinstance(request, BaseRequest):
+            return None
+        return get_request_key(request, request.get_endpoint() or self._region_id)
+
+    def close(self):
+        """
+        Closes all pooled connections, the client can still be used afterwards.
+        """
+        self._session_pool.close()
+        if self._hedger is not None:
+            self._hedger.close()
+
     @staticmethod
     def user_agent_header():
         base = '%s (%s %s;%s)' \
@@ -236,28 +442,50 @@ class ApiClient:
         return self._port
     
     def _compose_ua(self, request):
-        ua_base = self.user_agent_header()
-        extra_ua = self.handle_extra_agent(request)
-        default_ua = self.default_user_agent() 
+        if not request.has_user_agent():
+            return self._get_static_headers()['User-Agent']
+        return self._build_ua(request)
+
+    def _build_ua(self, request=None):
+        ua_base, default_ua = _get_platform_user_agent()
+        extra_ua = self.client_user_agent() if request is None else self.handle_extra_agent(request)
         ua = self.merge_user_agent(default_ua, extra_ua)
         for k, v in ua.items():
             ua_base += ' %s/%s' % (k, v) 
         return ua_base
+
+    def _get_static_headers(self):
+        """
+        Headers that are the same for every request of the client without its own user agent.
+        The client source environment variable is read when the block is built.
+        """
+        static_headers = self._static_headers
+        if static_headers is None:
+            static_headers = {
+                'User-Agent': self._build_ua(),
+                hd.CLIENT_SOURCE: self._get_client_source(),
+            }
+            self._static_headers = static_headers
+        return static_headers
     
-    def _make_http_response(self, endpoint, request, read_timeout, connect_timeout, specific_signer=None):
+    def _make_http_response(self, endpoint, request, read_timeout, connect_timeout, specific_signer=None,
+                            session=None):
         body_params = request.get_body_params()
         body = None
         if body_params is not None:
-            body = common.json_dumps_compact(body_params)
+            # serialized once, the same bytes are hashed by the signer and sent
+            body = self._json_backend.dumps_compact(body_params)
             request.set_content(body)
         method = request.get_method()
         signer = self._signer if specific_signer is None else specific_signer
         request.set_endpoint(endpoint)
         headers = signer.sign(request) 
-        headers['User-Agent'] = self._compose_ua(request)
+        has_user_agent = request.has_user_agent()
+        headers.update(self._get_static_headers())
+        if has_user_agent:
+            headers['User-Agent'] = self._build_ua(request)
         if self.get_token():
             headers['x-access-token'] = self.get_token()
-        headers[hd.CLIENT_SOURCE] = self._get_client_source()
 
         protocol = request.get_protocol_type()
         url = request.get_url()
@@ -271,7 +499,8 @@ class ApiClient:
             self._port,
             read_timeout=read_timeout,
             connect_timeout=connect_timeout,
-            verify=self.get_verify())
+            verify=self.get_verify(),
+            session=session)
         response.set_content(body, "utf-8")
         return response
 
@@ -285,6 +514,10 @@ class ApiClient:
         return DEFAULT_CLIENT_SOURCE
     
     def _implementation_of_do_action(self, request, signer=None):
+        endpoint = self._prepare_action(request)
+        return self._handle_retry_and_timeout(endpoint, request, signer)
+
+    def _prepare_action(self, request):
         if not isinstance(request, BaseRequest):
             raise ClientException(error_code.SDK_INVALID_REQUEST)
         request.add_header('Accept-Encoding', 'gzip')
@@ -293,26 +526,51 @@ class ApiClient:
             request.add_header(WB_USER_ID, self._user_id)
 
         if request.endpoint:
-            endpoint = request.endpoint
-        else:
-            endpoint = self._resolve_endpoint(request)
-        return self._handle_retry_and_timeout(endpoint, request, signer)
+            return request.endpoint
+        return self._resolve_endpoint(request)
 
     def _handle_retry_and_timeout(self, endpoint, request, signer):
         retry_policy_context = RetryPolicyContext(request, None, 0, None)
         request_read_timeout = self._get_request_read_timeout(request)
         request_connect_timeout = self._get_request_connect_timeout(request)
+        deadline = self._get_request_deadline(request)
+        circuit_breaker = self._get_circuit_breaker(endpoint, request)
         retries = 0
         while True:
-           status, headers, body, exception, response = \
-           self._handle_single_request(endpoint, request, request_read_timeout, request_connect_timeout, signer)
-           retry_policy_context = RetryPolicyContext(request, exception, retries, status)
+           # checked first, a call failing fast takes no rate limit token
+           if circuit_breaker is not None and not circuit_breaker.allow():
+               status, headers, body, exception, response = self._circuit_open(endpoint, request)
+               break
+           try:
+               attempt_timeouts = None
+               if self._rate_limiter.acquire(request, deadline) is not None:
+                   attempt_timeouts = self._get_attempt_timeouts(deadline, request_read_timeout,
+                                                                 request_connect_timeout)
+               if attempt_timeouts is None:
+                   status, headers, body, exception, response = self._deadline_exceeded(request, retries)
+               else:
+                   status, headers, body, exception, response = \
+                   self._send_attempt(endpoint, request, attempt_timeouts[0], attempt_timeouts[1], signer)
+           except BaseException:
+               if circuit_breaker is not None:
+                   circuit_breaker.on_cancel()
+               raise
+           if attempt_timeouts is None:
+               if circuit_breaker is not None:
+                   circuit_breaker.on_cancel()
+               break
+           self._record_attempt(circuit_breaker, exception, status)
+           retry_policy_context = RetryPolicyContext(request, exception, retries, status, deadline)
            retryable = self._retry_policy.should_retry(retry_policy_context)
            if retryable & RetryCondition.NO_RETRY:
                break
            logger.debug("Retry needed. Request:%s Retries:%d", request.get_action_name(), retries)
            retry_policy_context.retryable = retryable
            time_to_sleep = self._retry_policy.compute_delay_before_next_retry(retry_policy_context)
+           if not retry_policy_context.has_time_for_retry(time_to_sleep / 1000.0):
+               logger.debug("Retry skipped, the deadline is too close. Request:%s Retries:%d",
+                            request.get_action_name(), retries)
+               break
            time.sleep(time_to_sleep / 1000.0)
            retries += 1
 
@@ -320,17 +578,33 @@ class ApiClient:
             raise exception
         return status, headers, body, exception, response
     
+    def _send_attempt(self, endpoint, request, read_timeout, connect_timeout, signer):
+        hedger = self._hedger
+        if hedger is None or not hedger.accepts(request):
+            return self._handle_single_request(endpoint, request, read_timeout, connect_timeout, signer)
+        return hedger.send(
+            request,
+            lambda attempt_request: self._handle_single_request(endpoint, attempt_request, read_timeout,
+                                                                connect_timeout, signer),
+            self._rate_limiter)
+
     def _handle_single_request(self, endpoint, request, read_timeout, connect_timeout, signer):
-        http_response = self._make_http_response(endpoint, request, read_timeout, connect_timeout, signer)
+        session = self._session_pool.acquire(endpoint)
         try:
+            http_response = self._make_http_response(endpoint, request, read_timeout, connect_timeout, signer,
+                                                      session)
             status, headers, body, response = http_response.get_response_object()
+            response = ApiResponse.wrap(response, self._json_backend)
         except IOError as e:
             exception = ClientException(error_code.SDK_HTTP_ERROR, compat.ensure_string('%s' % e))
             msg = "HttpError occurred. Host:%s SDK-Version:%s Request:%s ClientException:%s" % (
                          endpoint, webull.core.__version__, json.dumps(vars(request), default=str, indent=2), exception)
             logger.error(compat.ensure_string(msg))
             return None, None, None, exception, None
-        exception = self._get_server_exception(request, status, headers, body, endpoint, request.string_to_sign)
+        finally:
+            self._session_pool.release(endpoint, session)
+        exception = self._get_server_exception(request, status, headers, body, endpoint, request.string_to_sign,
+                                               response)
         return status, headers, body, exception, response
     
     @staticmethod
@@ -343,11 +617,15 @@ class ApiClient:
             error_msg_to_return = body_obj.get('message')
         return error_code_to_return, error_msg_to_return
     
-    def _get_server_exception(self, request, http_status, headers, response_body, endpoint, string_to_sign):
+    def _get_server_exception(self, request, http_status, headers, response_body, endpoint, string_to_sign,
+                              api_response=None):
         request_id = headers.get(hd.REQUEST_ID)
         body_obj = None
         try:
-            if response_body:
+            if api_response is not None:
+                # parsed once, the caller's response.json() gets the same object
+                body_obj = api_response.get_body_object()
+            elif response_body:
                 response_content = response_body.decode('utf-8')
                 if response_content:
                     body_obj = json.loads(response_body.decode('utf-8'))
@@ -377,6 +655,60 @@ class ApiClient:
             return self._connect_timeout
         return DEFAULT_CONNECTION_TIMEOUT
     
+    def _get_request_total_timeout(self, request):
+        if request._request_total_timeout:
+            return request._request_total_timeout
+        return self._total_timeout
+
+    def _get_request_deadline(self, request):
+        total_timeout = self._get_request_total_timeout(request)
+        if not total_timeout:
+            return None
+        return time.monotonic() + total_timeout
+
+    @staticmethod
+    def _get_attempt_timeouts(deadline, read_timeout, connect_timeout):
+        """
+        Timeouts of the next attempt shrunk to the time left before the deadline, None when it has passed.
+        """
+        if deadline is None:
+            return read_timeout, connect_timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        return min(read_timeout, remaining), min(connect_timeout, remaining)
+
+    def _get_circuit_breaker(self, endpoint, request):
+        if self._circuit_breakers is None:
+            return None
+        return self._circuit_breakers.get(endpoint, request.get_action_name())
+
+    def _record_attempt(self, circuit_breaker, exception, status):
+        if circuit_breaker is None and self._retry_budget is None:
+            return
+        failed = is_failure(exception, status)
+        for tracker in (circuit_breaker, self._retry_budget):
+            if tracker is None:
+                continue
+            if failed:
+                tracker.on_failure()
+            else:
+                tracker.on_success()
+
+    @staticmethod
+    def _circuit_open(endpoint, request):
+        exception = ClientException(error_code.SDK_CIRCUIT_OPEN,
+                                    "Circuit open, request not sent. Host:%s Request:%s" % (
+                                        endpoint, request.get_action_name()))
+        return None, None, None, exception, None
+
+    @staticmethod
+    def _deadline_exceeded(request, retries):
+        exception = ClientException(error_code.SDK_DEADLINE_EXCEEDED,
+                                    "Total timeout exceeded after %d retries. Request:%s" % (
+                                        retries, request.get_action_name()))
+        return None, None, None, exception, None
+
     def _resolve_endpoint(self, request):
         resolve_request = ResolveEndpointRequest(
             self._region_id
@@ -422,9 +754,24 @@ class ApiClient:
         self._file_logger_set = True
 
     def get_response(self, api_request):
-        status, headers, body, exception, response = self._implementation_of_do_action(api_request)
+        response_cache = self._response_cache
+        cache_key = self._get_response_cache_key(api_request)
+        if cache_key is not None:
+            response = response_cache.get(
+                cache_key, lambda: self._refresh_cached_response(response_cache, cache_key, api_request))
+            if response is not None:
+                return response
+        single_flight = self._single_flight
+        key = self._get_single_flight_key(api_request)
+        if key is not None:
+            status, headers, body, exception, response = single_flight.do(
+                key, lambda: self._implementation_of_do_action(api_request))
+        else:
+            status, headers, body, exception, response = self._implementation_of_do_action(api_request)
         if exception:
             logger.error("get_response exception. %s", json.dumps(vars(exception), default=str, indent=2))
             raise exception
         logger.debug('Response received, status:%s, headers:%s, body:%s' % (status, headers, body))
+        if cache_key is not None:
+            response_cache.put(cache_key, response)
         return response
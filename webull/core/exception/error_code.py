@@ -20,4 +20,6 @@ SDK_NOT_SUPPORT = 'SDK.NotSupport'
 SDK_INVALID_REQUEST = 'SDK.InvalidRequest'
 SDK_ENDPOINT_RESOLVING_ERROR = 'SDK.EndpointResolvingError'
 SDK_HTTP_ERROR = 'SDK.HttpError'
+SDK_DEADLINE_EXCEEDED = 'SDK.DeadlineExceeded'
+SDK_CIRCUIT_OPEN = 'SDK.CircuitOpen'
 SDK_UNKNOWN_SERVER_ERROR = 'SDK.UnknownServerError'
\ No newline at end of file
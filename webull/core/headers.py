@@ -49,6 +49,7 @@ NONCE = "x-signature-nonce"
 TIMESTAMP = "x-timestamp"
 VERSION = "x-version"
 WB_USER_ID = "wb-user-id"
+CATEGORY = "category"
 
 ACCESS_TOKEN = "x-access-token"
 
@@ -0,0 +1,81 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import json
+
+from requests import Response
+from requests.exceptions import JSONDecodeError
+from requests.structures import CaseInsensitiveDict
+
+_UNPARSED = object()
+
+
+class ApiResponse(Response):
+    """
+    requests.Response returned by ApiClient.get_response, whose JSON body is parsed at most
+    once: the client reads it to detect server errors, and json() returns the same object
+    afterwards, so the caller should copy it before changing it.
+
+    The body is parsed by the JSON backend of the client, the raw bytes stay available
+    with get_raw_bytes().
+    """
+
+    @classmethod
+    def wrap(cls, response, json_backend):
+        api_response = cls.__new__(cls)
+        api_response.__dict__.update(response.__dict__)
+        api_response._json_backend = json_backend
+        api_response._parsed_body = _UNPARSED
+        return api_response
+
+    @classmethod
+    def from_content(cls, status_code, headers, content, json_backend, url=None):
+        """Rebuilds a response kept outside of the process, such as in the on-disk reference cache."""
+        response = Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(headers or {})
+        response._content = content
+        response._content_consumed = True
+        response.encoding = 'utf-8'
+        response.url = url
+        return cls.wrap(response, json_backend)
+
+    def copy(self):
+        """Response of the same status, headers and body, whose body is parsed again."""
+        return ApiResponse.from_content(self.status_code, self.headers, self.content, self._json_backend, self.url)
+
+    def get_raw_bytes(self):
+        return self.content
+
+    def json(self, **kwargs):
+        try:
+            if kwargs:
+                # custom decoding arguments are not cached
+                return json.loads(self.content, **kwargs)
+            parsed_body = self._parsed_body
+            if parsed_body is _UNPARSED:
+                parsed_body = self._json_backend.loads(self.content)
+                self._parsed_body = parsed_body
+            return parsed_body
+        except json.JSONDecodeError as e:
+            # the error type of requests.Response.json
+            raise JSONDecodeError(e.msg, e.doc, e.pos)
+
+    def get_body_object(self):
+        """Parsed body, None when the body is empty."""
+        if not self.content:
+            return None
+        return self.json()
@@ -0,0 +1,248 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import collections
+import copy
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+from webull.core.http import method_type
+from webull.core.utils import validation
+
+DEFAULT_HEDGE_PATHS = (
+    "/openapi/market-data/stock/snapshot",
+    "/openapi/market-data/stock/quotes",
+    "/openapi/market-data/futures/snapshot",
+    "/openapi/market-data/crypto/snapshot",
+    "/openapi/market-data/option/snapshot",
+    "/openapi/market-data/event/snapshot",
+)
+DEFAULT_PERCENTILE = 95
+DEFAULT_MIN_DELAY_MS = 5
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_WINDOW_SIZE = 500
+DEFAULT_RECOMPUTE_EVERY = 20
+DEFAULT_MAX_WORKERS = 32
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyWindow:
+    """
+    Latencies of the last window_size answered attempts of one request path, in seconds.
+    A percentile is computed again only after recompute_every new latencies, not on each call.
+    """
+
+    def __init__(self, window_size=DEFAULT_WINDOW_SIZE, recompute_every=DEFAULT_RECOMPUTE_EVERY):
+        self._samples = collections.deque(maxlen=window_size)
+        self._recompute_every = recompute_every
+        self._recorded = 0
+        self._percentiles = {}
+        self._lock = threading.Lock()
+
+    def record(self, latency):
+        with self._lock:
+            self._samples.append(latency)
+            self._recorded += 1
+
+    def get_size(self):
+        return len(self._samples)
+
+    def get_percentile(self, percentile):
+        with self._lock:
+            cached = self._percentiles.get(percentile)
+            if cached is not None and self._recorded - cached[0] < self._recompute_every:
+                return cached[1]
+            samples = sorted(self._samples)
+            recorded = self._recorded
+        if not samples:
+            return None
+        value = samples[min(len(samples) - 1, int(len(samples) * percentile / 100.0))]
+        with self._lock:
+            self._percentiles[percentile] = (recorded, value)
+        return value
+
+
+class Hedger:
+    """
+    Sends a second copy of an idempotent GET when the first one has not answered after the given percentile
+    of the latencies recently observed on its path, and returns whichever copy answers first.
+    The other copy cannot be interrupted once on the wire, it completes in the background and is discarded.
+    A hedge takes a permit from the rate limiter only if one is available right away, otherwise it is not sent.
+
+    :param percentile: Latency percentile after which the hedge is sent.
+    :param min_delay_ms: Lower bound of the hedge delay.
+    :param paths: Request paths eligible for hedging, defaults to DEFAULT_HEDGE_PATHS.
+    :param min_samples: Latencies observed on a path before its requests are hedged.
+    :param window_size: Latencies kept per path.
+    :param recompute_every: New latencies of a path after which its hedge delay is computed again.
+    :param max_workers: Threads running the hedged attempts.
+    """
+
+    def __init__(self, percentile=DEFAULT_PERCENTILE, min_delay_ms=DEFAULT_MIN_DELAY_MS, paths=None,
+                 min_samples=DEFAULT_MIN_SAMPLES, window_size=DEFAULT_WINDOW_SIZE, max_workers=DEFAULT_MAX_WORKERS,
+                 timer=time.monotonic, recompute_every=DEFAULT_RECOMPUTE_EVERY):
+        if not isinstance(percentile, (int, float)) or not 0 < percentile < 100:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER, "percentile should be between 0 and 100.")
+        if not isinstance(min_delay_ms, (int, float)) or min_delay_ms < 0:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER, "min_delay_ms should not be negative.")
+        validation.assert_integer_positive(min_samples, "min_samples")
+        validation.assert_integer_positive(window_size, "window_size")
+        validation.assert_integer_positive(max_workers, "max_workers")
+        validation.assert_integer_positive(recompute_every, "recompute_every")
+        self._percentile = percentile
+        self._min_delay = min_delay_ms / 1000.0
+        self._paths = frozenset(DEFAULT_HEDGE_PATHS if paths is None else paths)
+        self._min_samples = min_samples
+        self._window_size = window_size
+        self._recompute_every = recompute_every
+        self._max_workers = max_workers
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._windows = {}
+        self._executor = None
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._rate_limited = 0
+
+    def get_percentile(self):
+        return self._percentile
+
+    def get_paths(self):
+        return self._paths
+
+    def accepts(self, request):
+        return request.get_method() == method_type.GET and not request.get_body_params() \
+            and request.get_action_name() in self._paths
+
+    def get_hedge_delay(self, path):
+        """Seconds to wait for the first copy before hedging, None until enough latencies are observed."""
+        window = self._windows.get(path)
+        if window is None or window.get_size() < self._min_samples:
+            return None
+        return max(window.get_percentile(self._percentile), self._min_delay)
+
+    def send(self, request, attempt, rate_limiter):
+        """
+        :param request: The request, copied for the hedge so that both copies are signed on their own.
+        :param attempt: Callable taking a request and sending it once, returning
+        (status, headers, body, exception, response).
+        :param rate_limiter: webull.core.ratelimit.rate_limiter.RateLimiter the hedge takes its permit from.
+        """
+        path = request.get_action_name()
+        with self._lock:
+            self._requests += 1
+        delay = self.get_hedge_delay(path)
+        if delay is None:
+            return self._timed(path, attempt, request)
+        executor = self._get_executor()
+        primary = executor.submit(self._timed, path, attempt, request)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+        if not rate_limiter.try_acquire(request):
+            with self._lock:
+                self._rate_limited += 1
+            return primary.result()
+        with self._lock:
+            self._hedged += 1
+        logger.debug("Hedging request. Request:%s Delay:%.3fs", path, delay)
+        hedge = executor.submit(self._timed, path, attempt, self._copy_request(request))
+        pending = {primary, hedge}
+        result = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if not self._is_transport_error(result):
+                    self._finish(future is hedge, pending)
+                    return result
+        return result
+
+    def get_stats(self):
+        """
+        requests: hedgeable requests sent, hedged: hedges sent, hedge_wins: hedges that answered first,
+        rate_limited: hedges not sent for lack of a rate limiter permit, hedge_delay_ms: current delay per path.
+        """
+        with self._lock:
+            stats = {
+                'requests': self._requests,
+                'hedged': self._hedged,
+                'hedge_wins': self._hedge_wins,
+                'rate_limited': self._rate_limited,
+                'hedge_ratio': float(self._hedged) / self._requests if self._requests else 0.0,
+            }
+            paths = list(self._windows)
+        delays = {}
+        for path in paths:
+            delay = self.get_hedge_delay(path)
+            delays[path] = delay * 1000.0 if delay is not None else None
+        stats['hedge_delay_ms'] = delays
+        return stats
+
+    def close(self):
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _finish(self, hedge_won, pending):
+        for future in pending:
+            future.cancel()
+        if hedge_won:
+            with self._lock:
+                self._hedge_wins += 1
+
+    def _timed(self, path, attempt, request):
+        start = self._timer()
+        result = attempt(request)
+        if not self._is_transport_error(result):
+            self._get_window(path).record(self._timer() - start)
+        return result
+
+    def _get_window(self, path):
+        window = self._windows.get(path)
+        if window is None:
+            with self._lock:
+                window = self._windows.setdefault(path, LatencyWindow(self._window_size, self._recompute_every))
+        return window
+
+    def _get_executor(self):
+        executor = self._executor
+        if executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                        thread_name_prefix="Thread-Hedger")
+                executor = self._executor
+        return executor
+
+    @staticmethod
+    def _is_transport_error(result):
+        return isinstance(result[3], ClientException)
+
+    @staticmethod
+    def _copy_request(request):
+        hedge_request = copy.copy(request)
+        hedge_request.set_headers(dict(request.get_headers()))
+        hedge_request.set_query_params(dict(request.get_query_params() or {}))
+        return hedge_request
@@ -72,7 +72,8 @@ class Response(HttpRequest):
         cert_file=None,
         read_timeout=None,
         connect_timeout=None,
-        verify=None):
+        verify=None,
+        session=None):
         HttpRequest.__init__(
             self,
             host=host,
@@ -89,6 +90,7 @@ class Response(HttpRequest):
         self.__read_timeout = read_timeout
         self.__connect_timeout = connect_timeout
         self.__verify = verify
+        self.__session = session
         self.set_body(content)
 
     def set_ssl_enable(self, enable):
@@ -123,44 +125,49 @@ class Response(HttpRequest):
         return os.environ.get('WEBULL_API_CA_BUNDLE', True)
 
     def get_response_object(self):
+        if self.__session is not None:
+            return self._send(self.__session)
         with Session() as s:
-            current_protocol = 'https://' if self.get_ssl_enabled() else 'http://'
-            host = self.get_host()
-            if host.startswith('https://') or\
-                    not host.startswith('https://') and current_protocol == 'https://':
-                port = ':%s' % self.__port if self.__port != 80 and self.__port != 443 else ''
-            else:
-                port = ':%s' % self.__port if self.__port != 80 else ''
-
-            if host.startswith('http://') or host.startswith('https://'):
-                url = host + port + self.get_url()
-            else:
-                url = current_protocol + host + port + self.get_url()
-
-            req = Request(method=self.get_method(), url=url,
-                          data=self.get_body(),
-                          headers=self.get_headers(),
-                          )
-            prepped = s.prepare_request(req)
-
-            proxy_https = os.environ.get('HTTPS_PROXY') or os.environ.get(
-                'https_proxy')
-            proxy_http = os.environ.get(
-                'HTTP_PROXY') or os.environ.get('http_proxy')
-
-            proxies = {
-                "http": proxy_http,
-                "https": proxy_https,
-            }
-
-            response = s.send(prepped, proxies=proxies,
-                              timeout=(self.__connect_timeout, self.__read_timeout),
-                              allow_redirects=False, verify=self.get_verify_value(), cert=None)
-
-            http_debug = os.environ.get(ENV_DEBUG)
-
-            if http_debug is not None and http_debug.lower() == DEBUG_VAL:
-                # http debug information
-                self.do_http_debug(prepped, response)
-
-            return response.status_code, response.headers, response.content, response
\ No newline at end of file
+            return self._send(s)
+
+    def _send(self, s):
+        current_protocol = 'https://' if self.get_ssl_enabled() else 'http://'
+        host = self.get_host()
+        if host.startswith('https://') or\
+                not host.startswith('https://') and current_protocol == 'https://':
+            port = ':%s' % self.__port if self.__port != 80 and self.__port != 443 else ''
+        else:
+            port = ':%s' % self.__port if self.__port != 80 else ''
+
+        if host.startswith('http://') or host.startswith('https://'):
+            url = host + port + self.get_url()
+        else:
+            url = current_protocol + host + port + self.get_url()
+
+        req = Request(method=self.get_method(), url=url,
+                      data=self.get_body(),
+                      headers=self.get_headers(),
+                      )
+        prepped = s.prepare_request(req)
+
+        proxy_https = os.environ.get('HTTPS_PROXY') or os.environ.get(
+            'https_proxy')
+        proxy_http = os.environ.get(
+            'HTTP_PROXY') or os.environ.get('http_proxy')
+
+        proxies = {
+            "http": proxy_http,
+            "https": proxy_https,
+        }
+
+        response = s.send(prepped, proxies=proxies,
+                          timeout=(self.__connect_timeout, self.__read_timeout),
+                          allow_redirects=False, verify=self.get_verify_value(), cert=None)
+
+        http_debug = os.environ.get(ENV_DEBUG)
+
+        if http_debug is not None and http_debug.lower() == DEBUG_VAL:
+            # http debug information
+            self.do_http_debug(prepped, response)
+
+        return response.status_code, response.headers, response.content, response
\ No newline at end of file
@@ -0,0 +1,207 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import logging
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from webull.core.utils import validation
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_POOL_IDLE_SECONDS = 60
+DEFAULT_POOL_MAX_AGE_SECONDS = 600
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledSession:
+    def __init__(self, pool_size, created_at):
+        self.session = Session()
+        # every call is signed independently, never replay server cookies on a shared session
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.adapter = adapter
+        self.created_at = created_at
+        self.last_used_at = created_at
+        self.in_flight = 0
+
+    def connection_counters(self):
+        """Returns (requests, new_connections) as counted by the underlying urllib3 pools"""
+        requests_num = 0
+        connections_num = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_num += getattr(pool, 'num_requests', 0)
+            connections_num += getattr(pool, 'num_connections', 0)
+        return requests_num, connections_num
+
+    def close(self):
+        self.session.close()
+
+
+class SessionPool:
+    """
+    Keeps one keep-alive requests.Session per endpoint host so that consecutive
+    calls reuse TCP connections and TLS sessions instead of reconnecting.
+
+    :param pool_size: Max number of pooled connections kept per host.
+    :param idle_seconds: A host session unused for longer than this is closed and recreated.
+    :param max_age_seconds: A host session older than this is recycled, so DNS changes are picked up.
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, idle_seconds=DEFAULT_POOL_IDLE_SECONDS,
+                 max_age_seconds=DEFAULT_POOL_MAX_AGE_SECONDS, timer=time.monotonic):
+        validation.assert_integer_positive(pool_size, "pool_size")
+        validation.assert_integer_positive(idle_seconds, "idle_seconds")
+        validation.assert_integer_positive(max_age_seconds, "max_age_seconds")
+        self._pool_size = pool_size
+        self._idle_seconds = idle_seconds
+        self._max_age_seconds = max_age_seconds
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._retired = {}
+        # sessions closed while serving requests, by id, closed when their last request is released
+        self._closing = {}
+        self._sessions_created = 0
+        self._sessions_evicted = 0
+
+    def get_pool_size(self):
+        return self._pool_size
+
+    def get_idle_seconds(self):
+        return self._idle_seconds
+
+    def get_max_age_seconds(self):
+        return self._max_age_seconds
+
+    def acquire(self, host):
+        """Returns the session for host, creating or recycling it when needed."""
+        now = self._timer()
+        with self._lock:
+            pooled = self._sessions.get(host)
+            if pooled is not None and pooled.in_flight == 0 and self._is_expired(pooled, now):
+                self._evict(host, pooled)
+                pooled = None
+            if pooled is None:
+                pooled = _PooledSession(self._pool_size, now)
+                self._sessions[host] = pooled
+                self._sessions_created += 1
+            pooled.last_used_at = now
+            pooled.in_flight += 1
+            return pooled.session
+
+    def release(self, host, session):
+        with self._lock:
+            pooled = self._sessions.get(host)
+            if pooled is not None and pooled.session is session:
+                pooled.in_flight -= 1
+                pooled.last_used_at = self._timer()
+                return
+            pooled = self._closing.get(id(session))
+            if pooled is not None and pooled.session is session:
+                pooled.in_flight -= 1
+                if pooled.in_flight == 0:
+                    del self._closing[id(session)]
+                    self._retire(host, pooled)
+
+    def evict_idle(self):
+        """Closes all host sessions that are idle or too old, returns the number evicted."""
+        now = self._timer()
+        evicted = 0
+        with self._lock:
+            for host, pooled in list(self._sessions.items()):
+                if pooled.in_flight == 0 and self._is_expired(pooled, now):
+                    self._evict(host, pooled)
+                    evicted += 1
+        return evicted
+
+    def close(self):
+        """
+        Closes all host sessions. A session serving requests is closed when the last of them is
+        released, new requests get a new session.
+        """
+        with self._lock:
+            for host, pooled in list(self._sessions.items()):
+                if pooled.in_flight == 0:
+                    self._evict(host, pooled)
+                    continue
+                del self._sessions[host]
+                self._closing[id(pooled.session)] = pooled
+                logger.debug("Pooled session closed after its in-flight requests. Host:%s", host)
+
+    def get_stats(self):
+        """
+        Pool statistics, total and per host.
+        A pool hit is a request that was sent on an already opened connection.
+        """
+        with self._lock:
+            per_host = {}
+            for host, counters in self._retired.items():
+                per_host[host] = list(counters)
+            for host, pooled in self._sessions.items():
+                requests_num, connections_num = pooled.connection_counters()
+                counters = per_host.setdefault(host, [0, 0])
+                counters[0] += requests_num
+                counters[1] += connections_num
+            hosts = {}
+            total_requests = 0
+            total_connections = 0
+            for host, (requests_num, connections_num) in per_host.items():
+                hosts[host] = self._format_stats(requests_num, connections_num)
+                total_requests += requests_num
+                total_connections += connections_num
+            stats = self._format_stats(total_requests, total_connections)
+            stats['sessions_created'] = self._sessions_created
+            stats['sessions_evicted'] = self._sessions_evicted
+            stats['hosts'] = hosts
+            return stats
+
+    @staticmethod
+    def _format_stats(requests_num, connections_num):
+        hits = max(requests_num - connections_num, 0)
+        return {
+            'requests': requests_num,
+            'new_connections': connections_num,
+            'pool_hits': hits,
+            'hit_ratio': float(hits) / requests_num if requests_num else 0.0,
+        }
+
+    def _is_expired(self, pooled, now):
+        return now - pooled.last_used_at > self._idle_seconds or \
+            now - pooled.created_at > self._max_age_seconds
+
+    def _evict(self, host, pooled):
+        del self._sessions[host]
+        self._retire(host, pooled)
+        logger.debug("Evicted pooled session. Host:%s", host)
+
+    def _retire(self, host, pooled):
+        requests_num, connections_num = pooled.connection_counters()
+        counters = self._retired.setdefault(host, [0, 0])
+        counters[0] += requests_num
+        counters[1] += connections_num
+        self._sessions_evicted += 1
+        pooled.close()
@@ -0,0 +1,141 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import asyncio
+import threading
+
+import webull.core.headers as hd
+from webull.core.http import method_type
+
+# headers written by the client when the request is sent, a previous send leaves them on the request
+_SENT_HEADERS = frozenset(name.lower() for name in (
+    hd.REQUEST_ID, hd.CLIENT_SOURCE, hd.APP_KEY, hd.SIGNATURE, hd.SIGN_ALGORITHM, hd.SIGN_VERSION, hd.NONCE,
+    hd.TIMESTAMP, hd.WB_USER_ID, hd.ACCESS_TOKEN, hd.NATIVE_HOST, hd.NATIVE_CONTENT_TYPE, hd.NATIVE_CONTENT_LENGTH,
+    'Accept-Encoding'))
+
+
+def get_request_key(request, endpoint=None):
+    """
+    Coalescing key of an idempotent request, None when the request must always be sent on its own.
+    GET requests without a body are keyed by endpoint, path, version, sorted query params and the
+    headers set on the request, such as category or a per-request User-Agent.
+    """
+    if request.get_method() != method_type.GET or request.get_body_params():
+        return None
+    queries = request.get_query_params() or {}
+    headers = tuple(sorted((k.lower(), str(v)) for k, v in (request.get_headers() or {}).items()
+                           if k.lower() not in _SENT_HEADERS))
+    return (endpoint or request.get_endpoint(), request.get_action_name(), request.get_version(),
+            tuple(sorted((k, str(v)) for k, v in queries.items())), headers,
+            tuple(sorted(request.request_user_agent().items())))
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Shares one execution between concurrent callers of the same key: the first caller runs the call,
+    callers arriving while it is in flight wait for it and get the same result or exception.
+    Nothing is kept once the call completes, a later caller runs it again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._tasks = {}
+        self._calls_num = 0
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key, fn):
+        """
+        :param key: Hashable key identifying the call.
+        :param fn: Callable without arguments.
+        :return: Result of fn, shared by all callers of key in flight at the same time.
+        """
+        with self._lock:
+            self._calls_num += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+                leader = True
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key, coroutine_fn):
+        """
+        Same as do for coroutines, calls are shared between the callers running on the same event loop.
+        :param coroutine_fn: Callable without arguments returning an awaitable.
+        """
+        key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            self._calls_num += 1
+            task = self._tasks.get(key)
+            if task is not None:
+                self._coalesced += 1
+            else:
+                task = asyncio.ensure_future(coroutine_fn())
+                self._tasks[key] = task
+                self._executed += 1
+                task.add_done_callback(lambda t: self._remove_task(key, t))
+        # a cancelled caller must not cancel the call shared with the others
+        return await asyncio.shield(task)
+
+    def _remove_task(self, key, task):
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+
+    def get_stats(self):
+        """
+        calls: calls made through the single flight, executed: calls actually run,
+        coalesced: calls served by a call already in flight, in_flight: calls running now.
+        """
+        with self._lock:
+            return {
+                'calls': self._calls_num,
+                'executed': self._executed,
+                'coalesced': self._coalesced,
+                'coalesced_ratio': float(self._coalesced) / self._calls_num if self._calls_num else 0.0,
+                'in_flight': len(self._calls) + len(self._tasks),
+            }
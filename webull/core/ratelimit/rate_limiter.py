@@ -0,0 +1,255 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import asyncio
+import logging
+import threading
+import time
+
+import webull.core.headers as hd
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter(object):
+    def reserve(self, request):
+        """Reserve a permit for the request, returns the seconds to wait before sending it."""
+        return 0
+
+    def cancel(self, request, delay):
+        """Gives back the permit of a reservation that will not be used, delay is what reserve returned."""
+        pass
+
+    def try_acquire(self, request):
+        """Takes a permit only when one is available right away, returns whether it was taken."""
+        return True
+
+    def acquire(self, request, deadline=None):
+        """
+        Blocks until the request may be sent, returns the seconds waited.
+        :param deadline: time.monotonic() value the request has to be sent before, when the wait would
+        pass it the permit is given back at once and None is returned.
+        """
+        delay = self._reserve_before(request, deadline)
+        if delay is not None and delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, request, deadline=None):
+        """Same as acquire without blocking the event loop."""
+        delay = self._reserve_before(request, deadline)
+        if delay is not None and delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def _reserve_before(self, request, deadline):
+        delay = self.reserve(request)
+        if deadline is not None and delay > 0 and time.monotonic() + delay >= deadline:
+            self.cancel(request, delay)
+            return None
+        return delay
+
+    def get_stats(self):
+        return {}
+
+
+class NoRateLimiter(RateLimiter):
+    pass
+
+
+class TokenBucket:
+    """
+    Token bucket holding up to capacity tokens, refilled at rate tokens per second.
+    A reservation always succeeds, when the bucket is empty it returns how long the caller has to wait
+    for its token, so callers are served in the order they reserved.
+    """
+
+    def __init__(self, rate, capacity=None, timer=time.monotonic):
+        if not isinstance(rate, (int, float)) or rate <= 0:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER, "rate should be a positive number.")
+        if capacity is None:
+            capacity = max(rate, 1)
+        if not isinstance(capacity, (int, float)) or capacity < 1:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER, "capacity should be a number not less than 1.")
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._timer = timer
+        self._tokens = self.capacity
+        self._updated_at = timer()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        with self._lock:
+            now = self._timer()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self.rate
+
+    def try_reserve(self):
+        """Takes a token only when the bucket has one, never goes into debt."""
+        with self._lock:
+            now = self._timer()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def cancel(self):
+        """Gives back a reserved token, the callers that reserved after it keep their turn."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+
+class _BucketStats:
+    def __init__(self):
+        self.acquired = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.cancelled = 0
+
+    def record(self, wait):
+        self.acquired += 1
+        if wait > 0:
+            self.delayed += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def cancel(self, wait):
+        self.acquired -= 1
+        self.cancelled += 1
+        if wait > 0:
+            self.delayed -= 1
+            self.total_wait -= wait
+
+    def to_dict(self):
+        return {
+            'acquired': self.acquired,
+            'delayed': self.delayed,
+            'total_wait_seconds': self.total_wait,
+            'avg_wait_seconds': self.total_wait / self.acquired if self.acquired else 0.0,
+            'max_wait_seconds': self.max_wait,
+            'cancelled': self.cancelled,
+        }
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """
+    Shapes outgoing requests with one token bucket per request path, or per request path and category
+    header (the header OrderOperation.add_custom_headers and add_custom_headers_from_order set for the
+    frequency limit rules).
+
+    :param rules: Dict of key -> rate or (rate, capacity), rate in requests per second.
+    A key is a request path, e.g. "/openapi/market-data/stock/snapshot",
+    or a (request path, category) tuple, e.g. ("/openapi/trade/order/place", "HK_STOCK").
+    :param default_rate: Rate of the paths without rule, None means they are not limited.
+    :param default_capacity: Burst capacity of the paths without rule.
+    """
+
+    def __init__(self, rules=None, default_rate=None, default_capacity=None, timer=time.monotonic):
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._rules = {}
+        self._buckets = {}
+        self._stats = {}
+        self._default_rate = default_rate
+        self._default_capacity = default_capacity
+        if default_rate is not None:
+            TokenBucket(default_rate, default_capacity, timer)
+        for key, rule in (rules or {}).items():
+            self.set_rule(key, rule)
+
+    def set_rule(self, key, rule):
+        rate, capacity = rule if isinstance(rule, (tuple, list)) else (rule, None)
+        # validate eagerly, buckets are created on first use
+        TokenBucket(rate, capacity, self._timer)
+        with self._lock:
+            self._rules[key] = (rate, capacity)
+            self._buckets.pop(key, None)
+
+    def reserve(self, request):
+        key, bucket = self._get_bucket(request)
+        if bucket is None:
+            return 0
+        wait = bucket.reserve()
+        with self._lock:
+            self._stats.setdefault(key, _BucketStats()).record(wait)
+        if wait > 0:
+            logger.debug("Rate limited, key:%s wait:%.3fs", key, wait)
+        return wait
+
+    def cancel(self, request, delay):
+        key, bucket = self._get_bucket(request)
+        if bucket is None:
+            return
+        bucket.cancel()
+        with self._lock:
+            self._stats.setdefault(key, _BucketStats()).cancel(delay)
+        logger.debug("Rate limit reservation cancelled, key:%s wait:%.3fs", key, delay)
+
+    def try_acquire(self, request):
+        key, bucket = self._get_bucket(request)
+        if bucket is None:
+            return True
+        acquired = bucket.try_reserve()
+        if acquired:
+            with self._lock:
+                self._stats.setdefault(key, _BucketStats()).record(0)
+        return acquired
+
+    def get_stats(self):
+        """
+        Per bucket key: acquired permits, delayed permits and their queue wait times, and the reservations
+        given back because their wait would have passed the request deadline.
+        """
+        with self._lock:
+            return {self._format_key(key): stats.to_dict() for key, stats in self._stats.items()}
+
+    @staticmethod
+    def _format_key(key):
+        if isinstance(key, tuple):
+            return "%s|%s" % key
+        return key
+
+    def _get_bucket(self, request):
+        path = request.get_action_name()
+        category = request.get_headers().get(hd.CATEGORY)
+        if category is not None and (path, category) in self._rules:
+            key = (path, category)
+            rate, capacity = self._rules[key]
+        elif path in self._rules:
+            key = path
+            rate, capacity = self._rules[key]
+        elif self._default_rate is not None:
+            key = path if category is None else (path, category)
+            rate, capacity = self._default_rate, self._default_capacity
+        else:
+            return None, None
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, capacity, self._timer)
+            return key, bucket
+
+
+NO_RATE_LIMITER = NoRateLimiter()
@@ -98,6 +98,7 @@ class BaseRequest:
         self.string_to_sign = ''
         self._request_connect_timeout = None
         self._request_read_timeout = None
+        self._request_total_timeout = None
         self.endpoint = None
 
     def add_query_param(self, k, v):
@@ -196,6 +197,9 @@ class BaseRequest:
     def append_user_agent(self, key, value):
         self._extra_user_agent.update({key: value})
 
+    def has_user_agent(self):
+        return hd.NATIVE_USER_AGENT in self._header or bool(self._extra_user_agent)
+
     def request_user_agent(self):
         request_user_agent = {}
         if hd.NATIVE_USER_AGENT in self.get_headers():
@@ -211,7 +215,7 @@ class BaseRequest:
         self.add_header(hd.NATIVE_CONTENT_TYPE, content_type)
 
     @abc.abstractmethod
-    def get_signed_header(self, host, app_key, app_secret):
+    def get_signed_header(self, host, app_key, app_secret, signing_engine=None):
         pass
 
     def get_connect_timeout(self):
@@ -226,6 +230,16 @@ class BaseRequest:
     def set_read_timeout(self, read_timeout):
         self._request_read_timeout = read_timeout
 
+    def get_total_timeout(self):
+        return self._request_total_timeout
+
+    def set_total_timeout(self, total_timeout):
+        """
+        Seconds the request may take over all its attempts and the backoff between them.
+        :param total_timeout: Overrides the total timeout of the client for this request.
+        """
+        self._request_total_timeout = total_timeout
+
     def set_endpoint(self, endpoint):
         self.endpoint = endpoint
 
@@ -257,8 +271,14 @@ class ApiRequest(BaseRequest):
         self._signer_spec = signer_spec
         self.set_body_params(body_params)
 
-    def get_signed_header(self, host, app_key, app_secret):
-        sc.calc_signature(self._header, host, self._action_name, self._params, self._body_params, app_key, app_secret, self._signer_spec)
+    def get_signed_header(self, host, app_key, app_secret, signing_engine=None):
+        # the body bytes serialized by the client for the wire, hashed as they are
+        body_content = self._content if self._body_params is not None else None
+        if signing_engine is not None:
+            signing_engine.sign(self._header, host, self._action_name, self._params, self._body_params, body_content)
+            return self._header
+        sc.calc_signature(self._header, host, self._action_name, self._params, self._body_params, app_key, app_secret, self._signer_spec,
+                          body_content)
         return self._header
 
     def get_url(self):
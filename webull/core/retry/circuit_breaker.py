@@ -0,0 +1,228 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import logging
+import threading
+import time
+
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException, ServerException
+from webull.core.retry.retry_condition import RetryCondition
+from webull.core.utils import validation
+
+STATE_CLOSED = "CLOSED"
+STATE_OPEN = "OPEN"
+STATE_HALF_OPEN = "HALF_OPEN"
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_OPEN_SECONDS = 30
+DEFAULT_HALF_OPEN_MAX_CALLS = 1
+
+DEFAULT_MAX_TOKENS = 100
+DEFAULT_TOKEN_RATIO = 0.1
+
+logger = logging.getLogger(__name__)
+
+
+def is_failure(exception, http_status_code):
+    """
+    Whether an attempt counts against the backend: transport errors and 5xx responses.
+    Client errors such as 4xx are the caller's and leave the breaker and the budget unchanged.
+    """
+    if isinstance(exception, ClientException):
+        return exception.get_error_code() == error_code.SDK_HTTP_ERROR
+    if isinstance(exception, ServerException):
+        status = exception.http_status if exception.http_status is not None else http_status_code
+        return status is not None and status >= 500
+    return http_status_code is not None and http_status_code >= 500
+
+
+class CircuitBreaker:
+    """
+    Circuit of one host and request path.
+    CLOSED: calls pass, failure_threshold consecutive failures open it.
+    OPEN: calls fail fast for open_seconds, then the circuit is HALF_OPEN.
+    HALF_OPEN: up to half_open_max_calls trial calls pass, a success closes it and a failure opens it again.
+    """
+
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, open_seconds=DEFAULT_OPEN_SECONDS,
+                 half_open_max_calls=DEFAULT_HALF_OPEN_MAX_CALLS, timer=time.monotonic):
+        validation.assert_integer_positive(failure_threshold, "failure_threshold")
+        validation.assert_integer_positive(half_open_max_calls, "half_open_max_calls")
+        if not isinstance(open_seconds, (int, float)) or open_seconds <= 0:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER, "open_seconds should be a positive number.")
+        self._failure_threshold = failure_threshold
+        self._open_seconds = open_seconds
+        self._half_open_max_calls = half_open_max_calls
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._half_open_calls = 0
+        self._rejected = 0
+        self._opened = 0
+
+    def allow(self):
+        """Returns True when a call may be sent now, False when it has to fail fast."""
+        with self._lock:
+            if self._state == STATE_OPEN:
+                if self._timer() - self._opened_at < self._open_seconds:
+                    self._rejected += 1
+                    return False
+                self._state = STATE_HALF_OPEN
+                self._half_open_calls = 0
+            if self._state == STATE_HALF_OPEN:
+                if self._half_open_calls >= self._half_open_max_calls:
+                    self._rejected += 1
+                    return False
+                self._half_open_calls += 1
+            return True
+
+    def on_success(self):
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state != STATE_CLOSED:
+                self._state = STATE_CLOSED
+                self._half_open_calls = 0
+
+    def on_failure(self):
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == STATE_HALF_OPEN or \
+                    (self._state == STATE_CLOSED and self._consecutive_failures >= self._failure_threshold):
+                self._state = STATE_OPEN
+                self._opened_at = self._timer()
+                self._opened += 1
+
+    def on_cancel(self):
+        """A call allowed by allow() ended without an outcome, its half-open slot is given back."""
+        with self._lock:
+            if self._state == STATE_HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def get_state(self):
+        with self._lock:
+            if self._state == STATE_OPEN and self._timer() - self._opened_at >= self._open_seconds:
+                return STATE_HALF_OPEN
+            return self._state
+
+    def get_stats(self):
+        state = self.get_state()
+        with self._lock:
+            return {
+                'state': state,
+                'consecutive_failures': self._consecutive_failures,
+                'opened': self._opened,
+                'rejected': self._rejected,
+            }
+
+
+class CircuitBreakers:
+    """
+    Creates and keeps one CircuitBreaker per host and request path, all with the same settings.
+    """
+
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, open_seconds=DEFAULT_OPEN_SECONDS,
+                 half_open_max_calls=DEFAULT_HALF_OPEN_MAX_CALLS, timer=time.monotonic):
+        # validates the settings once
+        CircuitBreaker(failure_threshold, open_seconds, half_open_max_calls, timer)
+        self._failure_threshold = failure_threshold
+        self._open_seconds = open_seconds
+        self._half_open_max_calls = half_open_max_calls
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._breakers = {}
+
+    def get(self, host, path):
+        key = (host, path)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = CircuitBreaker(self._failure_threshold, self._open_seconds,
+                                             self._half_open_max_calls, self._timer)
+                    self._breakers[key] = breaker
+        return breaker
+
+    def get_states(self):
+        """Dict of 'host path' to the state of its circuit."""
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return dict(('%s %s' % key, breaker.get_state()) for key, breaker in breakers)
+
+    def get_stats(self):
+        with self._lock:
+            breakers = list(self._breakers.items())
+        return dict(('%s %s' % key, breaker.get_stats()) for key, breaker in breakers)
+
+
+class RetryBudget:
+    """
+    Token based retry budget shared by all requests of a client.
+    The bucket starts full with max_tokens, a failed attempt takes one token and a successful one gives
+    back token_ratio. Retries are only allowed while more than half of the tokens are left, so when most
+    attempts fail the client stops retrying until successes refill the bucket.
+    """
+
+    def __init__(self, max_tokens=DEFAULT_MAX_TOKENS, token_ratio=DEFAULT_TOKEN_RATIO):
+        validation.assert_integer_positive(max_tokens, "max_tokens")
+        if not isinstance(token_ratio, (int, float)) or token_ratio <= 0:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER, "token_ratio should be a positive number.")
+        self._max_tokens = float(max_tokens)
+        self._token_ratio = float(token_ratio)
+        self._lock = threading.Lock()
+        self._tokens = self._max_tokens
+        self._rejected = 0
+
+    def on_success(self):
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._token_ratio)
+
+    def on_failure(self):
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+
+    def can_retry(self):
+        with self._lock:
+            if self._tokens > self._max_tokens / 2:
+                return True
+            self._rejected += 1
+            return False
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'tokens': self._tokens,
+                'max_tokens': self._max_tokens,
+                'rejected': self._rejected,
+            }
+
+
+class RetryBudgetCondition(RetryCondition):
+    """Retries when retry_condition does and the retry budget is not exhausted."""
+
+    def __init__(self, retry_condition, retry_budget):
+        self.retry_condition = retry_condition
+        self.retry_budget = retry_budget
+
+    def should_retry(self, retry_policy_context):
+        retryable = self.retry_condition.should_retry(retry_policy_context)
+        if retryable & RetryCondition.NO_RETRY or self.retry_budget.can_retry():
+            return retryable
+        logger.debug("Retry budget exhausted. Retries:%d", retry_policy_context.retries_attempted)
+        return RetryCondition.NO_RETRY
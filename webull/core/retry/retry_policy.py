@@ -42,6 +42,7 @@ which was part of Alibaba Group.
 from webull.core.retry.retry_condition import RetryCondition, NoRetryCondition, \
     DefaultConfigRetryCondition
 from webull.core.retry.backoff_strategy import BackoffStrategy, NoDelayStrategy, DefaultMixedBackoffStrategy
+from webull.core.retry.circuit_breaker import RetryBudgetCondition
 
 
 class RetryPolicy(RetryCondition, BackoffStrategy):
@@ -61,3 +62,8 @@ NO_RETRY_POLICY = RetryPolicy(NoRetryCondition(), NoDelayStrategy())
 
 def get_default_retry_policy(max_retry_times=None):
     return RetryPolicy(DefaultConfigRetryCondition(max_retry_times), DefaultMixedBackoffStrategy())
+
+
+def with_retry_budget(retry_policy, retry_budget):
+    """Same retry policy whose retries are also limited by retry_budget."""
+    return RetryPolicy(RetryBudgetCondition(retry_policy.retry_condition, retry_budget), retry_policy.backoff_strategy)
@@ -39,13 +39,32 @@ https://github.com/aliyun/aliyun-openapi-python-sdk/blob/master/aliyun-python-sd
 which was part of Alibaba Group.
 """
 
+import time
+
 from webull.core.retry.retry_condition import RetryCondition
 
+# a retry is only sent when at least this many seconds are left for it once the backoff is over
+MIN_ATTEMPT_SECONDS = 0.1
+
 class RetryPolicyContext:
     
-    def __init__(self, original_request, exception, retries_attempted, http_status_code):
+    def __init__(self, original_request, exception, retries_attempted, http_status_code, deadline=None):
+        """
+        :param deadline: time.monotonic() value the request has to complete by, None when unbounded.
+        """
         self.original_request = original_request
         self.exception = exception
         self.retries_attempted = retries_attempted
         self.http_status_code = http_status_code
-        self.retryable = RetryCondition.BLANK_STATUS
\ No newline at end of file
+        self.retryable = RetryCondition.BLANK_STATUS
+        self.deadline = deadline
+
+    def get_remaining_seconds(self):
+        """Seconds left before the deadline, None when unbounded."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def has_time_for_retry(self, delay_seconds, min_attempt_seconds=MIN_ATTEMPT_SECONDS):
+        remaining = self.get_remaining_seconds()
+        return remaining is None or remaining - delay_seconds >= min_attempt_seconds
\ No newline at end of file
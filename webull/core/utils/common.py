@@ -13,6 +13,7 @@
 # limitations under the License.
 
 # coding=utf-8
+import asyncio
 import base64
 import hashlib
 import socket
@@ -58,6 +59,10 @@ def md5_hex(content):
     content_bytes = ensure_bytes(content)
     return hashlib.md5(content_bytes).hexdigest()
 
+def is_async_client(api_client):
+    """Whether the get_response of api_client is a coroutine, as the one of AsyncApiClient."""
+    return asyncio.iscoroutinefunction(getattr(api_client, "get_response", None))
+
 def sha256_hex(content):
     content_bytes = ensure_bytes(content)
     return hashlib.sha256(content_bytes).hexdigest()
@@ -0,0 +1,122 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+JSON backends of the request pipeline, encode the request bodies and parse the responses.
+
+json is the standard library and the reference encoding: compact separators, non-ASCII
+characters kept, UTF-8 bytes. orjson is optional and only used when installed and selected.
+Its output is byte-identical to the reference for the payloads it is used on: a payload
+orjson refuses (non-str keys, ints over 64 bits, ...) or whose output contains a float
+exponent or null, where the two encoders may differ, is encoded by the standard library.
+So are the payloads holding a type orjson encodes and json does not, or encodes its own way
+(datetime, dataclass, Enum, UUID, subclasses of the builtin types), the standard library then
+encodes them as it would without orjson, or raises the same TypeError.
+"""
+
+import json
+import re
+import uuid
+from enum import Enum
+
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+from webull.core.utils import common
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKEND_STDLIB = "json"
+JSON_BACKEND_ORJSON = "orjson"
+
+# 1e+16 / 1e16, NaN / null: outputs the two encoders may write differently
+_MAY_DIFFER = re.compile(rb'\d[eE]|null')
+
+if orjson is not None:
+    # datetime, dataclass and builtin subclass values go to _refuse
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | \
+        orjson.OPT_PASSTHROUGH_SUBCLASS
+
+
+def _refuse(value):
+    raise TypeError("Type is not JSON serializable: %s" % type(value).__name__)
+
+
+def _has_orjson_only_value(content):
+    """Whether content holds an Enum or UUID, which orjson encodes without calling default."""
+    pending = [content]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, dict):
+            pending.extend(value.values())
+            pending.extend(value.keys())
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+        elif isinstance(value, (Enum, uuid.UUID)):
+            return True
+    return False
+
+
+class JsonBackend:
+    name = JSON_BACKEND_STDLIB
+
+    def dumps_compact(self, content):
+        """Canonical body bytes: compact separators, non-ASCII kept, UTF-8."""
+        return common.json_dumps_compact(content).encode('utf-8')
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonBackend(JsonBackend):
+    name = JSON_BACKEND_ORJSON
+
+    def dumps_compact(self, content):
+        if _has_orjson_only_value(content):
+            return JsonBackend.dumps_compact(self, content)
+        try:
+            data = orjson.dumps(content, default=_refuse, option=_ORJSON_OPTIONS)
+        except TypeError:
+            return JsonBackend.dumps_compact(self, content)
+        if _MAY_DIFFER.search(data):
+            return JsonBackend.dumps_compact(self, content)
+        return data
+
+    def loads(self, data):
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # ints over 64 bits, or invalid JSON that json reports the usual way
+            return JsonBackend.loads(self, data)
+
+
+DEFAULT_JSON_BACKEND = JsonBackend()
+
+
+def get_json_backend(name=None):
+    """
+    :param name: json (default when None) or orjson.
+    """
+    if name is None or name == JSON_BACKEND_STDLIB:
+        return DEFAULT_JSON_BACKEND
+    if name == JSON_BACKEND_ORJSON:
+        if orjson is None:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER,
+                                  "json_backend orjson is selected but orjson is not installed.")
+        return OrjsonBackend()
+    raise ClientException(error_code.SDK_INVALID_PARAMETER, "json_backend should be json or orjson.")
@@ -0,0 +1,135 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+Streams the records of cursor-paged endpoints page by page, the next page being fetched in the
+background while the caller processes the current one. At most two pages are held at a time.
+The pages are fetched with blocking calls, an AsyncApiClient is rejected.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+from webull.core.utils.common import is_async_client
+
+logger = logging.getLogger(__name__)
+
+# keys holding the records when a page is an object rather than a list
+RECORDS_KEYS = ("items", "data", "list", "orders", "holdings", "positions", "instruments")
+
+
+def get_page_records(body):
+    """Records of a page body: the body itself when it is a list, else its records list."""
+    if body is None:
+        return []
+    if isinstance(body, list):
+        return body
+    if isinstance(body, dict):
+        for key in RECORDS_KEYS:
+            records = body.get(key)
+            if isinstance(records, list):
+                return records
+        lists = [value for value in body.values() if isinstance(value, list)]
+        if len(lists) == 1:
+            return lists[0]
+    return []
+
+
+def cursor_from_last_record(cursor_fields):
+    """
+    Builds the get_next_cursor function of iter_pages for endpoints whose cursor is taken from the last record.
+    Pagination stops on an empty page or a body with has_next false. A page shorter than the requested
+    size is not the last one, the server may cap the page size.
+
+    :param cursor_fields: Dict of request parameter to record field, e.g. {'last_instrument_id': 'instrument_id'}.
+    """
+
+    def get_next_cursor(body, records):
+        if not records:
+            return None
+        has_next = body.get("has_next") if isinstance(body, dict) else None
+        if has_next is False:
+            return None
+        last = records[-1]
+        if not isinstance(last, dict):
+            return None
+        cursor = dict((param, last.get(field)) for param, field in cursor_fields.items()
+                      if last.get(field) is not None)
+        return cursor or None
+
+    return get_next_cursor
+
+
+def iter_pages(fetch_page, get_next_cursor, prefetch=True, api_client=None):
+    """
+    :param fetch_page: Callable taking the cursor, a dict of request parameters or None for the first page,
+    and returning the response of that page.
+    :param get_next_cursor: Callable taking the page body and its records, returning the cursor of the next
+    page or None after the last one.
+    :param prefetch: Fetch the next page while the current one is being processed.
+    :param api_client: Client fetch_page sends its requests with, checked up front.
+    :return: Generator of the records list of each page.
+    """
+    if is_async_client(api_client):
+        raise ClientException(error_code.SDK_INVALID_PARAMETER,
+                              "Pagination needs a blocking ApiClient, fetch the pages of an AsyncApiClient "
+                              "one by one or use its blocking_client().")
+    return _iter_pages(fetch_page, get_next_cursor, prefetch)
+
+
+def _iter_pages(fetch_page, get_next_cursor, prefetch):
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Thread-Page-Prefetch") if prefetch else None
+    future = None
+    previous_cursor = None
+    try:
+        body = fetch_page(None).json()
+        while True:
+            records = get_page_records(body)
+            cursor = get_next_cursor(body, records)
+            if cursor is not None and cursor == previous_cursor:
+                logger.warning("Pagination stopped, cursor returned twice. Cursor:%s", cursor)
+                cursor = None
+            if cursor is not None:
+                previous_cursor = cursor
+                if executor is not None:
+                    future = executor.submit(_fetch_body, fetch_page, cursor)
+            yield records
+            if cursor is None:
+                return
+            body = future.result() if future is not None else _fetch_body(fetch_page, cursor)
+            future = None
+    finally:
+        if future is not None:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def iter_records(fetch_page, get_next_cursor, prefetch=True, api_client=None):
+    """Same as iter_pages, yielding the records one by one."""
+    return _iter_records(iter_pages(fetch_page, get_next_cursor, prefetch, api_client))
+
+
+def _iter_records(pages):
+    for records in pages:
+        for record in records:
+            yield record
+
+
+def _fetch_body(fetch_page, cursor):
+    return fetch_page(cursor).json()
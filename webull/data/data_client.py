@@ -18,6 +18,7 @@ import logging
 import sys
 
 from webull.core.http.initializer.client_initializer import ClientInitializer
+from webull.data.quotes.bar_backfill import BarBackfill
 from webull.data.quotes.crypto_market_data import CryptoMarketData
 from webull.data.quotes.event_market_data import EventMarketData
 from webull.data.quotes.futures_market_data import FuturesMarketData
@@ -30,9 +31,16 @@ from webull.data.quotes.watchlist import Watchlist
 
 
 class DataClient:
-    def __init__(self, api_client):
+    def __init__(self, api_client, reference_cache_path=None):
+        """
+        :param api_client: webull.core.client.ApiClient
+        :param reference_cache_path: SQLite file keeping reference data responses across restarts,
+        see ApiClient.enable_reference_cache.
+        """
         self._init_logger(api_client)
-        ClientInitializer.initializer(api_client)
+        if reference_cache_path:
+            api_client.enable_reference_cache(reference_cache_path)
+        ClientInitializer.initializer(self._get_blocking_client(api_client))
         self.instrument = Instrument(api_client)
         self.market_data = MarketData(api_client)
         self.crypto_market_data = CryptoMarketData(api_client)
@@ -42,6 +50,13 @@ class DataClient:
         self.fundamentals = Fundamentals(api_client)
         self.screener = Screener(api_client)
         self.watchlist = Watchlist(api_client)
+        self.bar_backfill = self._new_bar_backfill(api_client)
+
+    def _get_blocking_client(self, api_client):
+        return api_client
+
+    def _new_bar_backfill(self, api_client):
+        return BarBackfill(api_client)
 
     def _init_logger(self, api_client):
         # No logger configured, using default console and local file logging.
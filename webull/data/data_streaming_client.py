@@ -19,6 +19,7 @@ from webull.data.quotes.market_streaming_data import MarketDataStreaming
 from webull.data.quotes.subscribe.event_depth_decoder import EventDepthDecoder
 from webull.data.quotes.subscribe.event_snapshot_decoder import EventSnapshotDecoder
 from webull.data.quotes.subscribe.event_tick_decoder import EventTickDecoder
+from webull.data.quotes.subscribe.numeric_mode import NUMERIC_MODE_DECIMAL
 from webull.data.quotes.subscribe.payload_type import PAYLOAD_TYPE_QUOTE, PAYLOAD_TYPE_SHAPSHOT, PAYLOAD_TYPE_TICK, \
     PAYLOAD_TYPE_EVENT_SHAPSHOT, PAYLOAD_TYPE_EVENT_DEPTH, PAYLOAD_TYPE_EVENT_TICK
 from webull.data.quotes.subscribe.quote_decoder import QuoteDecoder
@@ -28,7 +29,14 @@ from webull.data.quotes.subscribe.tick_decoder import TickDecoder
 
 class DataStreamingClient(QuotesClient):
     def __init__(self, app_key, app_secret, region_id, session_id, http_host=None,  mqtt_host=None, mqtt_port=1883, tls_enable=True, transport="tcp",
-                 retry_policy=None):
+                 retry_policy=None, lazy_result=False, numeric_mode=NUMERIC_MODE_DECIMAL):
+        """
+        :param lazy_result: When True the pushed messages are decoded into lazy results, which keep the
+        protobuf message and only convert a field when it is read. When False (default) every field is
+        converted up front, as before.
+        :param numeric_mode: How prices, sizes and volumes of the pushed messages are converted,
+        one of decimal (default), float or raw_str, see webull.data.quotes.subscribe.numeric_mode.
+        """
         super().__init__(app_key, app_secret, region_id, session_id,
                          http_host=http_host,
                          mqtt_host=mqtt_host,
@@ -39,13 +47,14 @@ class DataStreamingClient(QuotesClient):
         self._connect_success = None
         self.on_quotes_subscribe = None
         self._on_subscribe_success = None
+        self._numeric_mode = numeric_mode
         # default decoder
-        self.register_payload_decoder(PAYLOAD_TYPE_QUOTE, QuoteDecoder())
-        self.register_payload_decoder(PAYLOAD_TYPE_SHAPSHOT, SnapshotDecoder())
-        self.register_payload_decoder(PAYLOAD_TYPE_TICK, TickDecoder())
-        self.register_payload_decoder(PAYLOAD_TYPE_EVENT_DEPTH, EventDepthDecoder())
-        self.register_payload_decoder(PAYLOAD_TYPE_EVENT_SHAPSHOT, EventSnapshotDecoder())
-        self.register_payload_decoder(PAYLOAD_TYPE_EVENT_TICK, EventTickDecoder())
+        self.register_payload_decoder(PAYLOAD_TYPE_QUOTE, QuoteDecoder(lazy=lazy_result, numeric_mode=numeric_mode))
+        self.register_payload_decoder(PAYLOAD_TYPE_SHAPSHOT, SnapshotDecoder(lazy=lazy_result, numeric_mode=numeric_mode))
+        self.register_payload_decoder(PAYLOAD_TYPE_TICK, TickDecoder(lazy=lazy_result, numeric_mode=numeric_mode))
+        self.register_payload_decoder(PAYLOAD_TYPE_EVENT_DEPTH, EventDepthDecoder(lazy=lazy_result, numeric_mode=numeric_mode))
+        self.register_payload_decoder(PAYLOAD_TYPE_EVENT_SHAPSHOT, EventSnapshotDecoder(lazy=lazy_result, numeric_mode=numeric_mode))
+        self.register_payload_decoder(PAYLOAD_TYPE_EVENT_TICK, EventTickDecoder(lazy=lazy_result, numeric_mode=numeric_mode))
 
     @property
     def on_connect_success(self):
@@ -89,6 +98,9 @@ class DataStreamingClient(QuotesClient):
     def get_subscribe_success(self):
         return self._subscribe_success
 
+    def get_numeric_mode(self):
+        return self._numeric_mode
+
     def get_session_id(self):
         return self.quotes_session_id
 
@@ -0,0 +1,71 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from webull.core.utils.common import is_async_client
+
+logger = logging.getLogger(__name__)
+
+
+def split_symbols(symbols, chunk_size):
+    """Splits symbols (list or comma separated string) into chunks, duplicates are removed, order is kept."""
+    if symbols is None:
+        return []
+    if isinstance(symbols, str):
+        symbols = [symbol.strip() for symbol in symbols.split(",")]
+    unique = list(dict.fromkeys(symbol for symbol in symbols if symbol))
+    return [unique[i:i + chunk_size] for i in range(0, len(unique), chunk_size)]
+
+
+def fan_out(chunks, fetch, max_workers):
+    """
+    Calls fetch(chunk) for every chunk on at most max_workers threads.
+    Returns a list of (chunk, response, exception) in the order of chunks.
+    """
+    if not chunks:
+        return []
+    if len(chunks) == 1 or max_workers == 1:
+        return [_call(fetch, chunk) for chunk in chunks]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks)),
+                            thread_name_prefix="Thread-Fan-Out") as executor:
+        futures = [executor.submit(_call, fetch, chunk) for chunk in chunks]
+        return [future.result() for future in futures]
+
+
+async def fan_out_async(chunks, fetch, max_workers):
+    """Same as fan_out, fetch(chunk) returns an awaitable, at most max_workers are awaited at once."""
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def _bounded(chunk):
+        async with semaphore:
+            try:
+                return chunk, await fetch(chunk), None
+            except Exception as e:
+                logger.warning("fan out chunk failed. chunk:%s exception:%s", chunk, e)
+                return chunk, None, e
+
+    return list(await asyncio.gather(*[_bounded(chunk) for chunk in chunks]))
+
+
+def _call(fetch, chunk):
+    try:
+        return chunk, fetch(chunk), None
+    except Exception as e:
+        logger.warning("fan out chunk failed. chunk:%s exception:%s", chunk, e)
+        return chunk, None, e
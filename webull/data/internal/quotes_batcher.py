@@ -0,0 +1,137 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import logging
+import threading
+import time
+
+from webull.core.utils import validation
+from webull.data.quotes.subscribe.payload_type import PAYLOAD_TYPE_QUOTE, PAYLOAD_TYPE_SHAPSHOT, PAYLOAD_TYPE_TICK
+from webull.data.quotes.subscribe.quote_decoder import QuoteDecoder
+from webull.data.quotes.subscribe.quotes_batch import PB_MESSAGES, QuotesBatch
+from webull.data.quotes.subscribe.snapshot_decoder import SnapshotDecoder
+from webull.data.quotes.subscribe.tick_decoder import TickDecoder
+
+DEFAULT_BATCH_MAX_MESSAGES = 1000
+DEFAULT_BATCH_MAX_DELAY_MS = 50
+
+logger = logging.getLogger(__name__)
+
+# decoders of the payload types whose batch is built from the same protobuf messages
+_BATCHED_DECODERS = {
+    PAYLOAD_TYPE_SHAPSHOT: SnapshotDecoder,
+    PAYLOAD_TYPE_TICK: TickDecoder,
+    PAYLOAD_TYPE_QUOTE: QuoteDecoder,
+}
+
+
+class QuotesBatcher:
+    """
+    Buffers the parsed protobuf messages of the snapshot, tick and quote topics and hands
+    them to on_batch(payload_type, QuotesBatch) once a window is complete: max_messages
+    messages of one payload type, or max_delay_ms since the first message of the window.
+
+    A daemon thread flushes windows that expired while no new message arrived. Batches
+    are delivered one at a time and, per payload type, in arrival order.
+
+    The messages are parsed here, not by the payload decoders. A payload type with a custom
+    decoder registered by register_payload_decoder is not batched, its messages still go
+    through that decoder to on_quotes_message.
+    """
+
+    def __init__(self, on_batch, max_messages=DEFAULT_BATCH_MAX_MESSAGES, max_delay_ms=DEFAULT_BATCH_MAX_DELAY_MS,
+                 timer=time.monotonic):
+        validation.assert_integer_positive(max_messages, "max_messages")
+        validation.assert_integer_positive(max_delay_ms, "max_delay_ms")
+        self._on_batch = on_batch
+        self._max_messages = max_messages
+        self._max_delay = max_delay_ms / 1000.0
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._deliver_lock = threading.Lock()
+        self._buffers = {}
+        self._window_starts = {}
+        self._stopped = threading.Event()
+        self._flusher = None
+
+    def get_max_messages(self):
+        return self._max_messages
+
+    def get_max_delay_ms(self):
+        return int(self._max_delay * 1000)
+
+    @staticmethod
+    def accepts(payload_type, decoder=None):
+        """
+        :param decoder: Payload decoder registered for payload_type, None when there is none.
+        """
+        if payload_type not in PB_MESSAGES:
+            return False
+        return decoder is None or type(decoder) is _BATCHED_DECODERS[payload_type]
+
+    def offer(self, payload_type, payload):
+        pb_message = PB_MESSAGES[payload_type]()
+        pb_message.ParseFromString(payload)
+        now = self._timer()
+        with self._lock:
+            buffer = self._buffers.get(payload_type)
+            if buffer is None:
+                buffer = self._buffers[payload_type] = []
+                self._window_starts[payload_type] = now
+            buffer.append(pb_message)
+            complete = len(buffer) >= self._max_messages or \
+                now - self._window_starts[payload_type] >= self._max_delay
+        if complete:
+            self._flush([payload_type])
+
+    def flush(self, expired_only=False):
+        """Delivers the buffered messages, only the expired windows when expired_only is True."""
+        now = self._timer()
+        with self._lock:
+            payload_types = [payload_type for payload_type, start in self._window_starts.items()
+                             if not expired_only or now - start >= self._max_delay]
+        if payload_types:
+            self._flush(payload_types)
+
+    def start(self):
+        if self._flusher is not None:
+            return
+        self._flusher = threading.Thread(target=self._flush_forever, name="Thread-Quotes-Batcher", daemon=True)
+        self._flusher.start()
+
+    def stop(self):
+        self._stopped.set()
+        flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+        self.flush()
+
+    def _flush_forever(self):
+        while not self._stopped.wait(self._max_delay):
+            try:
+                self.flush(expired_only=True)
+            except Exception as e:
+                logger.error("Caught exception in flushing quotes batch: %s", e)
+
+    def _flush(self, payload_types):
+        # taking the buffers under the deliver lock keeps the batches of a payload type in order
+        with self._deliver_lock:
+            for payload_type in payload_types:
+                with self._lock:
+                    pb_messages = self._buffers.pop(payload_type, None)
+                    self._window_starts.pop(payload_type, None)
+                if pb_messages:
+                    self._on_batch(payload_type, QuotesBatch.from_pb_messages(payload_type, pb_messages))
@@ -34,7 +34,11 @@ from webull.core.retry.retry_condition import RetryCondition
 from webull.data.common.connect_ack import ConnectAck
 from webull.data.internal.default_retry_policy import DefaultQuotesRetryPolicy, QuotesRetryPolicyContext
 from webull.data.internal.exceptions import ConnectException, LoopException
+from webull.data.internal.quotes_batcher import QuotesBatcher, DEFAULT_BATCH_MAX_MESSAGES, DEFAULT_BATCH_MAX_DELAY_MS
+from webull.data.internal.quotes_conflater import QuotesConflater, DEFAULT_CONFLATION_TOPICS
 from webull.data.internal.quotes_decoder import QuotesDecoder
+from webull.data.internal.quotes_dispatcher import QuotesDispatcher, DEFAULT_DISPATCH_WORKERS, \
+    DEFAULT_DISPATCH_QUEUE_SIZE, OVERFLOW_BLOCK
 
 DEFAULT_REGION_ID = "us"
 
@@ -71,6 +75,11 @@ class QuotesClient(mqttc.Client):
         self._mqtt_port = mqtt_port
         self._token_dir = None
         self._quotes_decoder = QuotesDecoder()
+        self._quotes_batcher = None
+        self._on_quotes_batch = None
+        self._quotes_batch_dropped = False
+        self._quotes_dispatcher = None
+        self._quotes_conflater = None
 
         api_client = ApiClient(app_key, app_secret, region_id)
         if http_host:
@@ -78,6 +87,11 @@ class QuotesClient(mqttc.Client):
         self._api_client = api_client
 
         def _quotes_message(client, userdata, message):
+            quotes_batcher = client._quotes_batcher
+            if quotes_batcher is not None and \
+                    quotes_batcher.accepts(message.topic, client._quotes_decoder.get_payload_decoder(message.topic)):
+                quotes_batcher.offer(message.topic, message.payload)
+                return
             decoded = client._quotes_decoder.decode(message)
             if decoded:
                 client._easy_log(
@@ -85,7 +99,14 @@ class QuotesClient(mqttc.Client):
                 _on_quotes_message = client._on_quotes_message
                 no_callback_topic = ['echo','notice']
                 if _on_quotes_message and decoded[0] not in no_callback_topic:
-                    _on_quotes_message(client, decoded[0], decoded[1])
+                    quotes_conflater = client._quotes_conflater
+                    quotes_dispatcher = client._quotes_dispatcher
+                    if quotes_conflater is not None and quotes_conflater.accepts(decoded[0]):
+                        quotes_conflater.offer(decoded[0], decoded[1])
+                    elif quotes_dispatcher is not None:
+                        quotes_dispatcher.dispatch(decoded[0], decoded[1])
+                    else:
+                        _on_quotes_message(client, decoded[0], decoded[1])
             else:
                 client._easy_log(
                     LOG_ERR, 'unexpected decoding for message topic: %s', message.topic)
@@ -160,6 +181,127 @@ class QuotesClient(mqttc.Client):
         with self._callback_mutex:
             self._on_quotes_message = func
     
+    @property
+    def on_quotes_batch(self):
+        return self._on_quotes_batch
+
+    @on_quotes_batch.setter
+    def on_quotes_batch(self, func):
+        with self._callback_mutex:
+            self._on_quotes_batch = func
+
+    def enable_batching(self, max_messages=DEFAULT_BATCH_MAX_MESSAGES, max_delay_ms=DEFAULT_BATCH_MAX_DELAY_MS):
+        """
+        Snapshot, tick and quote messages are no longer passed one by one to on_quotes_message,
+        they are collected and delivered as a columnar QuotesBatch to
+        on_quotes_batch(client, payload_type, quotes_batch), see
+        webull.data.quotes.subscribe.quotes_batch. Other topics still go to on_quotes_message,
+        and so do the payload types with a custom decoder registered by register_payload_decoder.
+        Set on_quotes_batch first, the batches delivered while it is not set are dropped and logged once.
+
+        :param max_messages: A batch is delivered when it holds this many messages of one payload type.
+        :param max_delay_ms: or when its first message was received this many milliseconds ago.
+        """
+        quotes_batcher = QuotesBatcher(self._deliver_quotes_batch, max_messages, max_delay_ms)
+        quotes_batcher.start()
+        with self._callback_mutex:
+            previous, self._quotes_batcher = self._quotes_batcher, quotes_batcher
+        if previous is not None:
+            previous.stop()
+
+    def disable_batching(self):
+        """Delivers the pending batches and goes back to one on_quotes_message call per message."""
+        with self._callback_mutex:
+            previous, self._quotes_batcher = self._quotes_batcher, None
+        if previous is not None:
+            previous.stop()
+
+    def enable_dispatcher(self, workers=DEFAULT_DISPATCH_WORKERS, queue_size=DEFAULT_DISPATCH_QUEUE_SIZE,
+                          overflow_policy=OVERFLOW_BLOCK):
+        """
+        on_quotes_message is no longer called on the MQTT network thread. Decoded messages are
+        queued and delivered by worker threads, the messages of one symbol in order by the same
+        worker, so a slow callback does not stall the socket reads.
+        See webull.data.internal.quotes_dispatcher for the overflow policies.
+
+        :param workers: Number of worker threads calling on_quotes_message.
+        :param queue_size: Max number of queued messages.
+        :param overflow_policy: block, drop_oldest or conflate.
+        """
+        quotes_dispatcher = QuotesDispatcher(self._deliver_quotes_message, workers, queue_size, overflow_policy)
+        quotes_dispatcher.start()
+        with self._callback_mutex:
+            previous, self._quotes_dispatcher = self._quotes_dispatcher, quotes_dispatcher
+        if previous is not None:
+            previous.stop()
+
+    def disable_dispatcher(self, drain=True):
+        """Stops the workers and goes back to calling on_quotes_message on the network thread."""
+        with self._callback_mutex:
+            previous, self._quotes_dispatcher = self._quotes_dispatcher, None
+        if previous is not None:
+            previous.stop(drain)
+
+    def get_dispatcher_stats(self):
+        """Queue depth, counters and lag of the dispatcher, None when it is not enabled."""
+        quotes_dispatcher = self._quotes_dispatcher
+        if quotes_dispatcher is None:
+            return None
+        return quotes_dispatcher.get_stats()
+
+    def enable_conflation(self, cadence_ms=None, topics=DEFAULT_CONFLATION_TOPICS):
+        """
+        Only the newest message per topic and symbol is passed to on_quotes_message, intermediate
+        updates received meanwhile are dropped. Meant for strategies that only need the latest state.
+
+        :param cadence_ms: Deliver the latest messages every cadence_ms milliseconds. When None
+        (default) they are delivered as soon as the previous on_quotes_message call returned.
+        :param topics: Conflated topics, snapshot and quote by default. Ticks are never
+        conflated unless listed here.
+        """
+        quotes_conflater = QuotesConflater(self._deliver_quotes_message, cadence_ms, topics)
+        quotes_conflater.start()
+        with self._callback_mutex:
+            previous, self._quotes_conflater = self._quotes_conflater, quotes_conflater
+        if previous is not None:
+            previous.stop()
+
+    def disable_conflation(self):
+        """Delivers the kept messages and goes back to one on_quotes_message call per message."""
+        with self._callback_mutex:
+            previous, self._quotes_conflater = self._quotes_conflater, None
+        if previous is not None:
+            previous.stop()
+
+    def get_conflation_stats(self):
+        """Received, delivered, coalesced and pending counts, None when conflation is not enabled."""
+        quotes_conflater = self._quotes_conflater
+        if quotes_conflater is None:
+            return None
+        return quotes_conflater.get_stats()
+
+    def _deliver_quotes_message(self, topic, result):
+        _on_quotes_message = self._on_quotes_message
+        if _on_quotes_message is None:
+            return
+        try:
+            _on_quotes_message(self, topic, result)
+        except Exception as e:
+            self._easy_log(LOG_ERR, 'Caught exception in on_quotes_message: %s', e)
+
+    def _deliver_quotes_batch(self, payload_type, quotes_batch):
+        _on_quotes_batch = self._on_quotes_batch
+        if _on_quotes_batch is None:
+            if not self._quotes_batch_dropped:
+                self._quotes_batch_dropped = True
+                self._easy_log(LOG_ERR, 'Batching is enabled but on_quotes_batch is not set, '
+                                        'quotes batches are dropped, payload type: %s', payload_type)
+            return
+        try:
+            _on_quotes_batch(self, payload_type, quotes_batch)
+        except Exception as e:
+            self._easy_log(LOG_ERR, 'Caught exception in on_quotes_batch: %s', e)
+
     def set_token_dir(self, token_dir):
         self._token_dir = token_dir
         if token_dir:
@@ -0,0 +1,119 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import logging
+import threading
+import time
+
+from webull.core.utils import validation
+from webull.data.internal.quotes_dispatcher import get_symbol
+from webull.data.quotes.subscribe.payload_type import PAYLOAD_TYPE_QUOTE, PAYLOAD_TYPE_SHAPSHOT
+
+DEFAULT_CONFLATION_TOPICS = (PAYLOAD_TYPE_SHAPSHOT, PAYLOAD_TYPE_QUOTE)
+
+logger = logging.getLogger(__name__)
+
+
+class QuotesConflater:
+    """
+    Keeps only the newest decoded message per (topic, symbol) and delivers the kept messages
+    from its own thread, so the CPU spent on a burst is bounded by the number of symbols,
+    not by the number of messages.
+
+    :param deliver: deliver(topic, result), called on the conflater thread.
+    :param cadence_ms: The kept messages are delivered every cadence_ms milliseconds. When None
+    they are delivered as soon as the previous delivery returned, that is when the consumer is idle.
+    :param topics: Topics that are conflated, only the latest state matters for them.
+    """
+
+    def __init__(self, deliver, cadence_ms=None, topics=DEFAULT_CONFLATION_TOPICS, timer=time.monotonic):
+        if cadence_ms is not None:
+            validation.assert_integer_positive(cadence_ms, "cadence_ms")
+        self._deliver = deliver
+        self._cadence = cadence_ms / 1000.0 if cadence_ms is not None else None
+        self._topics = frozenset(topics)
+        self._timer = timer
+        self._condition = threading.Condition(threading.Lock())
+        self._pending = {}
+        self._stopped = False
+        self._thread = None
+        self._received = 0
+        self._coalesced = 0
+        self._delivered = 0
+        self._coalesced_by_topic = {}
+
+    def accepts(self, topic):
+        return topic in self._topics
+
+    def offer(self, topic, result):
+        key = (topic, get_symbol(result))
+        with self._condition:
+            if self._stopped:
+                return
+            self._received += 1
+            if key in self._pending:
+                self._coalesced += 1
+                self._coalesced_by_topic[topic] = self._coalesced_by_topic.get(topic, 0) + 1
+            self._pending[key] = result
+            self._condition.notify()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._work, name="Thread-Quotes-Conflater", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Delivers the kept messages and stops the conflater thread."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def get_stats(self):
+        """received = delivered + coalesced + pending"""
+        with self._condition:
+            return {
+                'received': self._received,
+                'delivered': self._delivered,
+                'coalesced': self._coalesced,
+                'coalesced_by_topic': dict(self._coalesced_by_topic),
+                'pending': len(self._pending),
+            }
+
+    def _work(self):
+        next_delivery = self._timer() + (self._cadence or 0)
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if self._cadence is not None and not self._stopped:
+                    wait_seconds = next_delivery - self._timer()
+                    if wait_seconds > 0:
+                        # messages arriving meanwhile are coalesced into the pending ones
+                        self._condition.wait_for(lambda: self._stopped, wait_seconds)
+                pending, self._pending = self._pending, {}
+                stopped = self._stopped
+            next_delivery = self._timer() + (self._cadence or 0)
+            for (topic, _), result in pending.items():
+                try:
+                    self._deliver(topic, result)
+                except Exception as e:
+                    logger.error("Caught exception in delivering conflated quotes message: %s", e)
+            with self._condition:
+                self._delivered += len(pending)
+            if stopped:
+                return
@@ -24,6 +24,9 @@ class QuotesDecoder:
     def register_payload_decoder(self, payload_type, decoder):
         self._payload_decoders[payload_type] = decoder
 
+    def get_payload_decoder(self, payload_type):
+        return self._payload_decoders.get(payload_type)
+
     def decode(self, message):
         quotes_topic = message.topic
         if quotes_topic:
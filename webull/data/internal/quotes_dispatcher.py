@@ -0,0 +1,216 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+import logging
+import threading
+import time
+from collections import deque
+
+import webull.core.exception.error_code as error_code
+from webull.core.exception.exceptions import ClientException
+from webull.core.utils import validation
+
+OVERFLOW_BLOCK = 'block'
+OVERFLOW_DROP_OLDEST = 'drop_oldest'
+OVERFLOW_CONFLATE = 'conflate'
+
+DEFAULT_DISPATCH_WORKERS = 4
+DEFAULT_DISPATCH_QUEUE_SIZE = 10000
+
+logger = logging.getLogger(__name__)
+
+
+def get_symbol(result):
+    """Symbol of a decoded result, None when the result carries no basic part."""
+    basic = getattr(result, 'basic', None)
+    return getattr(basic, 'symbol', None)
+
+
+class _Entry:
+    __slots__ = ('key', 'topic', 'result', 'enqueued_at')
+
+    def __init__(self, key, topic, result, enqueued_at):
+        self.key = key
+        self.topic = topic
+        self.result = result
+        self.enqueued_at = enqueued_at
+
+
+class _Partition:
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.entries = deque()
+        # newest queued entry per (topic, symbol), used by the conflate policy
+        self.latest = {}
+        self.condition = threading.Condition(threading.Lock())
+        self.thread = None
+
+
+class QuotesDispatcher:
+    """
+    Moves the user callback off the MQTT network thread.
+
+    Decoded messages are put in bounded queues drained by worker threads. A message goes to
+    the queue of hash(symbol) % workers, so the messages of one symbol are delivered in order
+    by a single worker. When a queue is full the overflow policy applies:
+
+    - block: the network thread waits for room, nothing is lost.
+    - drop_oldest: the oldest queued message is dropped.
+    - conflate: a queued message of the same topic and symbol is replaced by the new one,
+      the oldest queued message is dropped when there is none.
+
+    :param deliver: deliver(topic, result), called on the worker threads.
+    :param workers: Number of worker threads.
+    :param queue_size: Max number of queued messages, split evenly between the workers.
+    :param overflow_policy: OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST or OVERFLOW_CONFLATE.
+    """
+
+    def __init__(self, deliver, workers=DEFAULT_DISPATCH_WORKERS, queue_size=DEFAULT_DISPATCH_QUEUE_SIZE,
+                 overflow_policy=OVERFLOW_BLOCK, timer=time.monotonic):
+        validation.assert_integer_positive(workers, "workers")
+        validation.assert_integer_positive(queue_size, "queue_size")
+        if overflow_policy not in (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_CONFLATE):
+            raise ClientException(error_code.SDK_INVALID_PARAMETER,
+                                  "overflow_policy should be one of block, drop_oldest, conflate.")
+        self._deliver = deliver
+        self._overflow_policy = overflow_policy
+        self._timer = timer
+        capacity = max(queue_size // workers, 1)
+        self._partitions = [_Partition(capacity) for _ in range(workers)]
+        self._stopped = False
+        self._stats_lock = threading.Lock()
+        self._enqueued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._conflated = 0
+        self._blocked = 0
+        self._max_depth = 0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+        self._total_lag = 0.0
+
+    def get_overflow_policy(self):
+        return self._overflow_policy
+
+    def get_workers(self):
+        return len(self._partitions)
+
+    def start(self):
+        for index, partition in enumerate(self._partitions):
+            if partition.thread is None:
+                partition.thread = threading.Thread(target=self._work, args=(partition,),
+                                                    name="Thread-Quotes-Dispatcher-%d" % index, daemon=True)
+                partition.thread.start()
+
+    def stop(self, drain=True):
+        """Stops the workers, the queued messages are delivered first when drain is True."""
+        for partition in self._partitions:
+            with partition.condition:
+                self._stopped = True
+                if not drain:
+                    self._count('_dropped', len(partition.entries))
+                    partition.entries.clear()
+                    partition.latest.clear()
+                partition.condition.notify_all()
+        for partition in self._partitions:
+            if partition.thread is not None and partition.thread is not threading.current_thread():
+                partition.thread.join()
+
+    def dispatch(self, topic, result):
+        symbol = get_symbol(result)
+        key = (topic, symbol)
+        partition = self._partitions[hash(symbol if symbol is not None else topic) % len(self._partitions)]
+        entry = _Entry(key, topic, result, self._timer())
+        with partition.condition:
+            if self._stopped:
+                return False
+            entries = partition.entries
+            if len(entries) >= partition.capacity:
+                if self._overflow_policy == OVERFLOW_BLOCK:
+                    self._count('_blocked')
+                    while len(entries) >= partition.capacity and not self._stopped:
+                        partition.condition.wait()
+                    if self._stopped:
+                        return False
+                elif self._overflow_policy == OVERFLOW_CONFLATE and key in partition.latest:
+                    queued = partition.latest[key]
+                    queued.result = result
+                    self._count('_conflated')
+                    return True
+                else:
+                    dropped = entries.popleft()
+                    if partition.latest.get(dropped.key) is dropped:
+                        del partition.latest[dropped.key]
+                    self._count('_dropped')
+            entries.append(entry)
+            partition.latest[key] = entry
+            depth = len(entries)
+            partition.condition.notify_all()
+        self._count('_enqueued', depth=depth)
+        return True
+
+    def get_queue_depth(self):
+        return sum(len(partition.entries) for partition in self._partitions)
+
+    def get_stats(self):
+        """
+        Queue depth (now, per worker and the max seen by a worker), message counters, and lag:
+        the milliseconds a message waited in the queue before its callback started.
+        """
+        with self._stats_lock:
+            delivered = self._delivered
+            return {
+                'queue_depth': self.get_queue_depth(),
+                'worker_queue_depths': [len(partition.entries) for partition in self._partitions],
+                'max_queue_depth': self._max_depth,
+                'enqueued': self._enqueued,
+                'delivered': delivered,
+                'dropped': self._dropped,
+                'conflated': self._conflated,
+                'blocked': self._blocked,
+                'last_lag_ms': self._last_lag * 1000,
+                'max_lag_ms': self._max_lag * 1000,
+                'avg_lag_ms': self._total_lag * 1000 / delivered if delivered else 0.0,
+            }
+
+    def _count(self, name, value=1, depth=None):
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + value)
+            if depth is not None and depth > self._max_depth:
+                self._max_depth = depth
+
+    def _work(self, partition):
+        while True:
+            with partition.condition:
+                while not partition.entries and not self._stopped:
+                    partition.condition.wait()
+                if not partition.entries:
+                    return
+                entry = partition.entries.popleft()
+                if partition.latest.get(entry.key) is entry:
+                    del partition.latest[entry.key]
+                partition.condition.notify_all()
+            lag = self._timer() - entry.enqueued_at
+            with self._stats_lock:
+                self._delivered += 1
+                self._last_lag = lag
+                self._total_lag += lag
+                if lag > self._max_lag:
+                    self._max_lag = lag
+            try:
+                self._deliver(entry.topic, entry.result)
+            except Exception as e:
+                logger.error("Caught exception in dispatching quotes message: %s", e)
@@ -0,0 +1,365 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+Backfill of historical bars over any date range.
+
+A bars request returns at most MAX_BAR_COUNT bars, so the range is split into windows
+holding at most that many bars of the timespan. The windows of all symbols are fetched
+concurrently, every request goes through the rate limiter of the ApiClient, and the bars
+of a symbol are stitched, deduplicated by time and sorted once all its windows are in.
+Each symbol is yielded as soon as it is complete, as a HistoryBars of array.array columns.
+
+The crypto, futures and option bars endpoints take no time range, only the latest
+MAX_BAR_COUNT bars can be fetched for them; they are cut to the requested range.
+"""
+
+import logging
+import math
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+from webull.core.utils import validation
+from webull.data.internal.fan_out import split_symbols, is_async_client
+from webull.data.quotes.bulk_result import ChunkError
+from webull.data.quotes.crypto_market_data import CryptoMarketData
+from webull.data.quotes.futures_market_data import FuturesMarketData
+from webull.data.quotes.market_data import MarketData
+from webull.data.quotes.option_market_data import OptionMarketData
+
+MAX_BAR_COUNT = 1200
+DEFAULT_BACKFILL_WORKERS = 4
+BATCH_MAX_SYMBOLS = 20
+
+TIMESPAN_SECONDS = {
+    "S5": 5,
+    "S15": 15,
+    "M1": 60,
+    "M5": 5 * 60,
+    "M15": 15 * 60,
+    "M30": 30 * 60,
+    "M60": 60 * 60,
+    "M120": 120 * 60,
+    "M240": 240 * 60,
+    "D": 24 * 3600,
+    "W": 7 * 24 * 3600,
+    # a window of months or years must not hold more than MAX_BAR_COUNT bars, count their shortest length
+    "M": 28 * 24 * 3600,
+    "Y": 365 * 24 * 3600,
+}
+
+COLUMNS = ('time', 'open', 'high', 'low', 'close', 'volume')
+_PRICE_COLUMNS = COLUMNS[1:]
+_RECORDS_KEYS = ('result', 'bars', 'data', 'items')
+
+logger = logging.getLogger(__name__)
+
+
+def to_millis(value):
+    """Epoch milliseconds of a datetime (naive means UTC), an ISO 8601 string or a number of milliseconds."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1000)
+    if isinstance(value, (int, float)):
+        return int(value)
+    text = str(value).strip()
+    if text.isdigit():
+        return int(text)
+    text = text.replace('Z', '+00:00')
+    if len(text) > 5 and text[-5] in '+-' and text[-4:].isdigit():
+        text = text[:-2] + ':' + text[-2:]
+    return to_millis(datetime.fromisoformat(text))
+
+
+def split_windows(start_ms, end_ms, timespan, count=MAX_BAR_COUNT):
+    """
+    Splits [start_ms, end_ms] into consecutive windows holding at most count bars of timespan.
+    :return: List of (start_ms, end_ms), both bounds included.
+    """
+    if start_ms > end_ms:
+        raise ClientException(error_code.SDK_INVALID_PARAMETER, "start should not be after end.")
+    width = _get_timespan_millis(timespan) * count
+    windows = []
+    window_start = start_ms
+    while window_start <= end_ms:
+        window_end = min(window_start + width - 1, end_ms)
+        windows.append((window_start, window_end))
+        window_start = window_end + 1
+    return windows
+
+
+def _get_timespan_millis(timespan):
+    seconds = TIMESPAN_SECONDS.get(timespan)
+    if seconds is None:
+        raise ClientException(error_code.SDK_INVALID_PARAMETER, "timespan %s is not supported." % timespan)
+    return seconds * 1000
+
+
+def _to_float(value):
+    if value is None or value == '':
+        return math.nan
+    return float(value)
+
+
+def _get_rows(body):
+    if isinstance(body, list):
+        return body
+    if isinstance(body, dict):
+        for key in _RECORDS_KEYS:
+            rows = body.get(key)
+            if isinstance(rows, list):
+                return rows
+    return []
+
+
+def _get_rows_by_symbol(body, symbols):
+    """Bars of each symbol of a multi-symbol response, a list of {symbol, result: [...]} objects."""
+    rows_by_symbol = {}
+    items = body if isinstance(body, list) else _get_rows(body)
+    if len(symbols) == 1 and items and isinstance(items[0], dict) and 'symbol' not in items[0]:
+        return {symbols[0]: items}
+    for item in items:
+        if isinstance(item, dict) and item.get('symbol') is not None:
+            rows_by_symbol.setdefault(item['symbol'], []).extend(_get_rows(item))
+    return rows_by_symbol
+
+
+def _is_truncated(rows, first_bar_limit):
+    """A full page of bars whose earliest bar comes after the first bar of the window."""
+    if len(rows) < MAX_BAR_COUNT:
+        return False
+    times = [to_millis(row.get('time', row.get('timestamp'))) for row in rows if isinstance(row, dict)]
+    times = [time_ms for time_ms in times if time_ms is not None]
+    return bool(times) and min(times) > first_bar_limit
+
+
+class HistoryBars:
+    """
+    Bars of one symbol as columns: time in epoch milliseconds (array('q')), open, high, low, close
+    and volume (array('d'), NaN when missing), sorted by time without duplicates.
+    errors lists the windows that could not be fetched, their bars are missing.
+    """
+
+    def __init__(self, symbol, timespan, rows=None, errors=None):
+        self.symbol = symbol
+        self.timespan = timespan
+        self.errors = errors or []
+        self._columns = dict((name, array('q' if name == 'time' else 'd')) for name in COLUMNS)
+        if rows:
+            for time_ms, row in rows:
+                self._append(time_ms, row)
+
+    @classmethod
+    def stitch(cls, symbol, timespan, windows_rows, start_ms, end_ms, errors=None):
+        """
+        :param windows_rows: Iterable of bar rows lists, the later one wins when two bars have the same time.
+        """
+        by_time = {}
+        for rows in windows_rows:
+            for row in rows:
+                if not isinstance(row, dict):
+                    continue
+                time_ms = to_millis(row.get('time', row.get('timestamp')))
+                if time_ms is None or time_ms < start_ms or time_ms > end_ms:
+                    continue
+                by_time[time_ms] = row
+        return cls(symbol, timespan, sorted(by_time.items(), key=lambda item: item[0]), errors)
+
+    def _append(self, time_ms, row):
+        columns = self._columns
+        columns['time'].append(time_ms)
+        for name in _PRICE_COLUMNS:
+            columns[name].append(_to_float(row.get(name)))
+
+    def get_symbol(self):
+        return self.symbol
+
+    def get_timespan(self):
+        return self.timespan
+
+    def get_errors(self):
+        return self.errors
+
+    def has_errors(self):
+        return len(self.errors) > 0
+
+    def get_size(self):
+        return len(self._columns['time'])
+
+    def get_columns(self):
+        return self._columns
+
+    def get_column(self, name):
+        column = self._columns.get(name)
+        if column is None:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER, "Unknown column %s." % name)
+        return column
+
+    def to_records(self):
+        columns = [self._columns[name] for name in COLUMNS]
+        return [dict(zip(COLUMNS, values)) for values in zip(*columns)]
+
+    def __len__(self):
+        return self.get_size()
+
+    def __repr__(self):
+        return "symbol:%s,timespan:%s,size:%s,errors:%s" % (self.symbol, self.timespan, self.get_size(),
+                                                            self.errors)
+
+    def __str__(self):
+        return self.__repr__()
+
+
+class BarBackfill:
+    """
+    Fetches historical bars of many symbols over any date range, see the module documentation.
+
+    :param api_client: ApiClient, set a rate limiter on it (set_rate_limiter) to shape the requests.
+    :param max_workers: Max number of window requests in flight.
+    """
+
+    def __init__(self, api_client, max_workers=DEFAULT_BACKFILL_WORKERS):
+        if is_async_client(api_client):
+            raise ClientException(error_code.SDK_NOT_SUPPORT, "BarBackfill needs a blocking ApiClient.")
+        validation.assert_integer_positive(max_workers, "max_workers")
+        self._max_workers = max_workers
+        self._market_data = MarketData(api_client)
+        self._crypto_market_data = CryptoMarketData(api_client)
+        self._futures_market_data = FuturesMarketData(api_client)
+        self._option_market_data = OptionMarketData(api_client)
+
+    def backfill(self, symbols, category, timespan, start, end, trading_sessions=None):
+        """
+        Bars of each symbol between start and end, one get_history_bar request per symbol and window.
+
+        :param symbols: List of securities codes or a comma separated string.
+        :param category: Security type, enumeration.
+        :param timespan: K-line time granularity, name of a Timespan.
+        :param start: Range start, datetime (naive means UTC), ISO 8601 string or epoch milliseconds.
+        :param end: Range end, included.
+        :param trading_sessions: Specify trading session, see get_history_bar.
+        :return: Generator of HistoryBars, one per symbol in completion order.
+        """
+
+        def fetch(chunk, window):
+            response = self._market_data.get_history_bar(chunk[0], category, timespan, str(MAX_BAR_COUNT),
+                                                         trading_sessions=trading_sessions, start_time=window[0],
+                                                         end_time=window[1])
+            return {chunk[0]: _get_rows(response.json())}
+
+        return self._backfill_windows(split_symbols(symbols, 1), timespan, start, end, fetch)
+
+    def backfill_batch(self, symbols, category, timespan, start, end, trading_sessions=None,
+                       chunk_size=BATCH_MAX_SYMBOLS):
+        """
+        Same as backfill with get_batch_history_bar requests of up to chunk_size symbols per window.
+        """
+        validation.assert_integer_positive(chunk_size, "chunk_size")
+
+        def fetch(chunk, window):
+            response = self._market_data.get_batch_history_bar(chunk, category, timespan, str(MAX_BAR_COUNT),
+                                                               trading_sessions=trading_sessions,
+                                                               start_time=window[0], end_time=window[1])
+            return _get_rows_by_symbol(response.json(), chunk)
+
+        return self._backfill_windows(split_symbols(symbols, chunk_size), timespan, start, end, fetch)
+
+    def backfill_crypto(self, symbols, category, timespan, start, end, chunk_size=BATCH_MAX_SYMBOLS):
+        """Latest MAX_BAR_COUNT crypto bars cut to [start, end], see get_crypto_history_bar."""
+        return self._backfill_latest(symbols, timespan, start, end, chunk_size,
+                                     lambda chunk: self._crypto_market_data.get_crypto_history_bar(
+                                         chunk, category, timespan, str(MAX_BAR_COUNT)))
+
+    def backfill_futures(self, symbols, category, timespan, start, end, chunk_size=BATCH_MAX_SYMBOLS):
+        """Latest MAX_BAR_COUNT futures bars cut to [start, end], see get_futures_history_bars."""
+        return self._backfill_latest(symbols, timespan, start, end, chunk_size,
+                                     lambda chunk: self._futures_market_data.get_futures_history_bars(
+                                         chunk, category, timespan, str(MAX_BAR_COUNT)))
+
+    def backfill_option(self, symbols, category, timespan, start, end, chunk_size=BATCH_MAX_SYMBOLS):
+        """Latest MAX_BAR_COUNT option bars cut to [start, end], see get_option_history_bars."""
+        return self._backfill_latest(symbols, timespan, start, end, chunk_size,
+                                     lambda chunk: self._option_market_data.get_option_history_bars(
+                                         chunk, category, timespan, str(MAX_BAR_COUNT)))
+
+    def _backfill_windows(self, chunks, timespan, start, end, fetch):
+        start_ms, end_ms = to_millis(start), to_millis(end)
+        windows = split_windows(start_ms, end_ms, timespan)
+        tasks = [(chunk, window) for chunk in chunks for window in windows]
+        return self._run(chunks, tasks, timespan, start_ms, end_ms,
+                         lambda chunk, window: self._fetch_window(fetch, chunk, window, timespan))
+
+    def _backfill_latest(self, symbols, timespan, start, end, chunk_size, fetch):
+        validation.assert_integer_positive(chunk_size, "chunk_size")
+        start_ms, end_ms = to_millis(start), to_millis(end)
+        _get_timespan_millis(timespan)
+        chunks = split_symbols(symbols, chunk_size)
+        tasks = [(chunk, None) for chunk in chunks]
+        return self._run(chunks, tasks, timespan, start_ms, end_ms,
+                         lambda chunk, window: _get_rows_by_symbol(fetch(chunk).json(), chunk))
+
+    def _fetch_window(self, fetch, chunk, window, timespan):
+        rows_by_symbol = fetch(chunk, window)
+        timespan_millis = _get_timespan_millis(timespan)
+        truncated = [symbol for symbol, rows in rows_by_symbol.items()
+                     if _is_truncated(rows, window[0] + timespan_millis)]
+        if not truncated or window[1] - window[0] < 2 * timespan_millis:
+            return rows_by_symbol
+        # the server returned only the latest bars of the window, fetch it again in two halves
+        middle = window[0] + (window[1] - window[0]) // 2
+        logger.debug("Bars window truncated, splitting it. symbols:%s window:%s", truncated, window)
+        for half in ((window[0], middle), (middle + 1, window[1])):
+            for symbol, rows in self._fetch_window(fetch, chunk, half, timespan).items():
+                rows_by_symbol.setdefault(symbol, []).extend(rows)
+        return rows_by_symbol
+
+    def _run(self, chunks, tasks, timespan, start_ms, end_ms, fetch):
+        pending = {}
+        for chunk, _ in tasks:
+            for symbol in chunk:
+                pending[symbol] = pending.get(symbol, 0) + 1
+        rows = dict((symbol, []) for symbol in pending)
+        errors = dict((symbol, []) for symbol in pending)
+        executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="Thread-Bar-Backfill")
+        futures = {}
+        try:
+            futures = dict((executor.submit(fetch, chunk, window), (chunk, window)) for chunk, window in tasks)
+            for future in as_completed(futures):
+                chunk, window = futures[future]
+                try:
+                    rows_by_symbol = future.result()
+                except Exception as e:
+                    logger.warning("Bars window failed. symbols:%s window:%s exception:%s", chunk, window, e)
+                    rows_by_symbol = {}
+                    for symbol in chunk:
+                        errors[symbol].append(ChunkError([symbol], e))
+                for symbol in chunk:
+                    rows[symbol].append(rows_by_symbol.get(symbol, []))
+                    pending[symbol] -= 1
+                    if pending[symbol] == 0:
+                        yield HistoryBars.stitch(symbol, timespan, rows.pop(symbol), start_ms, end_ms,
+                                                 errors.pop(symbol))
+        finally:
+            # the caller stopped early, drop the windows not started yet
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
@@ -0,0 +1,426 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+Local on-disk store of historical bars.
+
+The bars of a (symbol, category, timespan, trading sessions) key live in their own directory,
+one file per column of fixed width little endian values:
+
+    time.q                  int64 time deltas, the first one from the epoch, in milliseconds
+    open.d high.d low.d     float64 prices, NaN when missing
+    close.d volume.d
+    meta.json               number of bars, last bar time and generation, written last
+
+An append writes after the stored bars and then the meta. Older bars are merged by writing
+every column again in the files of the next generation (close.1.d, ...), the meta replace
+that points to them is the single commit point and the previous generation is removed after
+it, so a merge that does not complete leaves the stored bars as they were.
+
+Reads map the column files with mmap, the price columns are memoryview slices of the maps
+and are never copied. Times are decoded once per key and kept in memory, an append extends
+a copy of them. A top-up fetches only the bars from the last stored one on, the last bar
+is fetched again because it may have been stored before it closed.
+"""
+
+import bisect
+import itertools
+import json
+import logging
+import mmap
+import os
+import sys
+import threading
+import time
+from array import array
+from urllib.parse import quote
+
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+from webull.data.quotes.bar_backfill import BarBackfill, HistoryBars, COLUMNS, TIMESPAN_SECONDS, \
+    DEFAULT_BACKFILL_WORKERS, to_millis
+from webull.data.quotes.bulk_result import BulkResult, ChunkError
+
+DEFAULT_SESSION = 'default'
+
+_META_FILE = 'meta.json'
+_PRICE_COLUMNS = COLUMNS[1:]
+_ITEM_SIZE = 8
+
+logger = logging.getLogger(__name__)
+
+
+def _column_file(name, generation=0):
+    extension = '.q' if name == 'time' else '.d'
+    return name + extension if generation == 0 else '%s.%d%s' % (name, generation, extension)
+
+
+def _get_generation(file_name):
+    """Generation of a column file name, None for the other files."""
+    parts = file_name.split('.')
+    if parts[0] not in COLUMNS or parts[-1] not in ('q', 'd'):
+        return None
+    if len(parts) == 2:
+        return 0
+    if len(parts) == 3 and parts[1].isdigit():
+        return int(parts[1])
+    return None
+
+
+def _to_little_endian(values):
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+class StoredBarsMeta:
+    __slots__ = ('count', 'last_time', 'generation')
+
+    def __init__(self, count=0, last_time=None, generation=0):
+        self.count = count
+        self.last_time = last_time
+        self.generation = generation
+
+
+class BarSeries:
+    """
+    Stored bars of one key. get_column returns memoryview slices of the memory maps of the
+    store ('d' format), get_times a memoryview of the decoded times ('q' format).
+    The maps stay valid as long as a view of them is referenced, even after the store is updated.
+    """
+
+    def __init__(self, key, times, columns):
+        self.key = key
+        self._times = times
+        self._columns = columns
+
+    def get_key(self):
+        return self.key
+
+    def get_size(self):
+        return len(self._times)
+
+    def get_times(self):
+        return self._times
+
+    def get_column(self, name):
+        if name == 'time':
+            return self._times
+        column = self._columns.get(name)
+        if column is None:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER, "Unknown column %s." % name)
+        return column
+
+    def get_first_time(self):
+        return self._times[0] if len(self._times) else None
+
+    def get_last_time(self):
+        return self._times[-1] if len(self._times) else None
+
+    def slice(self, start=None, end=None):
+        """Bars between start and end (both included, datetime, ISO 8601 string or epoch milliseconds), no copy."""
+        low = 0 if start is None else bisect.bisect_left(self._times, to_millis(start))
+        high = len(self._times) if end is None else bisect.bisect_right(self._times, to_millis(end))
+        high = max(low, high)
+        return BarSeries(self.key, self._times[low:high],
+                         dict((name, column[low:high]) for name, column in self._columns.items()))
+
+    def to_records(self):
+        columns = [self.get_column(name) for name in COLUMNS]
+        return [dict(zip(COLUMNS, values)) for values in zip(*columns)]
+
+    def __len__(self):
+        return self.get_size()
+
+    def __repr__(self):
+        return "key:%s,size:%s,last_time:%s" % (self.key, self.get_size(), self.get_last_time())
+
+    def __str__(self):
+        return self.__repr__()
+
+
+class BarStore:
+    """
+    Columnar bar store under the root directory, filled through the MarketData bar endpoints.
+
+        bar_store = BarStore("/data/bars", api_client)
+        bar_store.fill(["AAPL", "MSFT"], Category.US_STOCK.name, Timespan.M1.name, "2024-01-02T00:00:00Z")
+        ...
+        bar_store.top_up(["AAPL", "MSFT"], Category.US_STOCK.name, Timespan.M1.name)
+        closes = bar_store.read("AAPL", Category.US_STOCK.name, Timespan.M1.name).get_column("close")
+
+    Only one process should write a root directory, any number of threads and processes may read it.
+
+    :param root: Store directory, created when missing.
+    :param api_client: ApiClient used by fill and top_up, the store can be read without it.
+    :param max_workers: Max number of bar requests in flight, see BarBackfill.
+    """
+
+    def __init__(self, root, api_client=None, max_workers=DEFAULT_BACKFILL_WORKERS, timer=time.time):
+        if not os.path.isdir(root):
+            os.makedirs(root)
+        self._root = root
+        self._timer = timer
+        self._lock = threading.RLock()
+        self._times = {}
+        self._bar_backfill = BarBackfill(api_client, max_workers) if api_client is not None else None
+
+    def get_root(self):
+        return self._root
+
+    @staticmethod
+    def get_key(symbol, category, timespan, trading_sessions=None):
+        if timespan not in TIMESPAN_SECONDS:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER, "timespan %s is not supported." % timespan)
+        if not trading_sessions:
+            session = DEFAULT_SESSION
+        elif isinstance(trading_sessions, (list, tuple)):
+            session = ','.join(sorted(trading_sessions))
+        else:
+            session = ','.join(sorted(trading_sessions.split(',')))
+        return symbol, category, timespan, session
+
+    def read(self, symbol, category, timespan, trading_sessions=None, start=None, end=None):
+        """
+        Stored bars of the key between start and end, both included, an empty BarSeries when nothing is stored.
+        """
+        key = self.get_key(symbol, category, timespan, trading_sessions)
+        with self._lock:
+            while True:
+                meta = self._load_meta(key)
+                try:
+                    times = self._get_times(key, meta)
+                    columns = dict((name, self._map_column(key, name, meta)) for name in _PRICE_COLUMNS)
+                    break
+                except FileNotFoundError:
+                    # another process merged the key and removed the generation read
+                    if self._load_meta(key).generation == meta.generation:
+                        raise
+        series = BarSeries(key, memoryview(times)[:meta.count], columns)
+        if start is None and end is None:
+            return series
+        return series.slice(start, end)
+
+    def get_last_time(self, symbol, category, timespan, trading_sessions=None):
+        with self._lock:
+            return self._load_meta(self.get_key(symbol, category, timespan, trading_sessions)).last_time
+
+    def write(self, bars, category, trading_sessions=None):
+        """
+        Stores a HistoryBars. Bars newer than the last stored one are appended and the last stored bar
+        is updated, bars older than it are merged by rewriting the key.
+        :return: Number of bars added.
+        """
+        key = self.get_key(bars.get_symbol(), category, bars.get_timespan(), trading_sessions)
+        times = bars.get_column('time')
+        if not len(times):
+            return 0
+        with self._lock:
+            meta = self._load_meta(key)
+            if meta.last_time is None or times[0] >= meta.last_time:
+                return self._append(key, meta, bars)
+            return self._merge(key, meta, bars)
+
+    def fill(self, symbols, category, timespan, start, end=None, trading_sessions=None):
+        """
+        Fetches and stores the bars of each symbol between start and end (now by default).
+        :return: BulkResult, data maps each symbol to its number of bars added, symbols that failed are in errors.
+        """
+        end = self._now_millis() if end is None else end
+        symbols = symbols.split(',') if isinstance(symbols, str) else list(symbols)
+        return self._fetch_and_write({to_millis(start): symbols}, category, timespan, end, trading_sessions)
+
+    def top_up(self, symbols, category, timespan, start=None, trading_sessions=None):
+        """
+        Fetches and stores the bars of each symbol from its last stored bar to now.
+        :param start: Range start of the symbols with no bar stored yet, they are skipped when None.
+        :return: BulkResult as for fill.
+        """
+        symbols = symbols.split(',') if isinstance(symbols, str) else list(symbols)
+        starts = {}
+        for symbol in symbols:
+            last_time = self.get_last_time(symbol, category, timespan, trading_sessions)
+            symbol_start = last_time if last_time is not None else start
+            if symbol_start is not None:
+                starts.setdefault(to_millis(symbol_start), []).append(symbol)
+        return self._fetch_and_write(starts, category, timespan, self._now_millis(), trading_sessions)
+
+    def delete(self, symbol, category, timespan, trading_sessions=None):
+        key = self.get_key(symbol, category, timespan, trading_sessions)
+        with self._lock:
+            self._times.pop(key, None)
+            directory = self._get_directory(key)
+            if not os.path.isdir(directory):
+                return False
+            # the meta goes first, a key without it is empty
+            meta_path = os.path.join(directory, _META_FILE)
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
+            self._remove_generations(directory)
+            return True
+
+    def _fetch_and_write(self, starts, category, timespan, end_ms, trading_sessions):
+        if self._bar_backfill is None:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER, "BarStore has no api_client to fetch bars.")
+        added = {}
+        errors = []
+        for start_ms, symbols in starts.items():
+            if start_ms > end_ms:
+                continue
+            for bars in self._bar_backfill.backfill(symbols, category, timespan, start_ms, end_ms,
+                                                    trading_sessions=trading_sessions):
+                if bars.has_errors():
+                    # storing around a missing window would leave a gap that no top-up fills
+                    errors.append(ChunkError([bars.get_symbol()], bars.get_errors()[0].get_exception()))
+                    continue
+                added[bars.get_symbol()] = self.write(bars, category, trading_sessions)
+        return BulkResult(added, errors)
+
+    def _append(self, key, meta, bars):
+        directory = self._get_directory(key)
+        added = self._write_columns(directory, meta, bars, meta.generation)
+        times = bars.get_column('time')
+        cached_times = self._times.get(key)
+        if cached_times is not None and len(cached_times) == meta.count:
+            # readers hold views of the cached times, extend a copy
+            self._times[key] = cached_times + array('q', times[len(times) - added:])
+        self._save_meta(key, StoredBarsMeta(meta.count + added, times[-1], meta.generation))
+        return added
+
+    def _merge(self, key, meta, bars):
+        stored = self.read(*key).to_records()
+        merged = HistoryBars.stitch(bars.get_symbol(), bars.get_timespan(), [stored, bars.to_records()],
+                                    -sys.maxsize, sys.maxsize)
+        # the merged bars go to new files, readers keep the maps of the previous ones
+        directory = self._get_directory(key)
+        generation = meta.generation + 1
+        # files of a merge that did not complete, or of generations not removed after their merge
+        self._remove_generations(directory, meta.generation)
+        self._write_columns(directory, StoredBarsMeta(), merged, generation, sync=True)
+        self._save_meta(key, StoredBarsMeta(len(merged), merged.get_column('time')[-1], generation))
+        self._times.pop(key, None)
+        self._remove_generations(directory, generation)
+        logger.debug("Bars merged into the store. key:%s stored:%s merged:%s", key, len(stored), len(merged))
+        return len(merged) - len(stored)
+
+    def _write_columns(self, directory, meta, bars, generation, sync=False):
+        """
+        Appends the bars after the meta.count stored ones in the files of generation,
+        returns the number of bars added.
+        :param sync: Flush the files to disk, before a meta that commits a new generation is written.
+        """
+        columns = bars.get_columns()
+        times = columns['time']
+        offset = 0
+        if meta.last_time is not None and times[0] == meta.last_time:
+            # the last stored bar may have been fetched before it closed, rewrite it in place
+            offset = 1
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        deltas = array('q', times[offset:])
+        if len(deltas):
+            for index in range(len(deltas) - 1, 0, -1):
+                deltas[index] -= deltas[index - 1]
+            deltas[0] -= meta.last_time if meta.last_time is not None else 0
+        size = meta.count * _ITEM_SIZE
+        for name in COLUMNS:
+            with self._open_column(directory, name, generation, size) as column_file:
+                if name == 'time':
+                    _to_little_endian(deltas).tofile(column_file)
+                else:
+                    values = columns[name]
+                    if offset:
+                        column_file.seek(size - _ITEM_SIZE)
+                        _to_little_endian(array('d', values[:1])).tofile(column_file)
+                    _to_little_endian(array('d', values[offset:])).tofile(column_file)
+                if sync:
+                    column_file.flush()
+                    os.fsync(column_file.fileno())
+        return len(times) - offset
+
+    @staticmethod
+    def _open_column(directory, name, generation, size):
+        path = os.path.join(directory, _column_file(name, generation))
+        column_file = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+        # drop the bytes written after the meta, by an append that did not complete
+        column_file.truncate(size)
+        column_file.seek(size)
+        return column_file
+
+    def _get_times(self, key, meta):
+        times = self._times.get(key)
+        if times is not None and len(times) == meta.count:
+            return times
+        deltas = self._map_column(key, 'time', meta)
+        times = array('q', itertools.accumulate(deltas))
+        self._times[key] = times
+        return times
+
+    def _map_column(self, key, name, meta):
+        typecode = 'q' if name == 'time' else 'd'
+        if meta.count == 0:
+            return memoryview(array(typecode))
+        path = os.path.join(self._get_directory(key), _column_file(name, meta.generation))
+        with open(path, 'rb') as column_file:
+            column_map = mmap.mmap(column_file.fileno(), meta.count * _ITEM_SIZE, access=mmap.ACCESS_READ)
+        view = memoryview(column_map).cast(typecode)
+        if sys.byteorder != 'little':
+            return memoryview(_to_little_endian(array(typecode, view)))
+        return view
+
+    def _load_meta(self, key):
+        path = os.path.join(self._get_directory(key), _META_FILE)
+        if not os.path.exists(path):
+            return StoredBarsMeta()
+        with open(path, 'r') as meta_file:
+            meta = json.load(meta_file)
+        return StoredBarsMeta(meta['count'], meta['last_time'], meta.get('generation', 0))
+
+    def _save_meta(self, key, meta):
+        path = os.path.join(self._get_directory(key), _META_FILE)
+        if meta.count == 0:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'w') as meta_file:
+            json.dump({'count': meta.count, 'last_time': meta.last_time, 'generation': meta.generation}, meta_file)
+        os.replace(temporary_path, path)
+
+    @staticmethod
+    def _remove_generations(directory, keep=None):
+        """Removes the column files of every generation but keep, readers that mapped them keep their maps."""
+        if not os.path.isdir(directory):
+            return
+        for file_name in os.listdir(directory):
+            generation = _get_generation(file_name)
+            if generation is None or generation == keep:
+                continue
+            try:
+                os.remove(os.path.join(directory, file_name))
+            except OSError as e:
+                # e.g. still mapped on Windows, removed by the next merge
+                logger.warning("Bar store file not removed. path:%s exception:%s",
+                               os.path.join(directory, file_name), e)
+
+    def _get_directory(self, key):
+        symbol, category, timespan, session = key
+        return os.path.join(self._root, quote(category, safe=''), timespan, quote(session, safe=''),
+                            quote(symbol, safe=''))
+
+    def _now_millis(self):
+        return int(self._timer() * 1000)
@@ -0,0 +1,59 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+
+class ChunkError:
+    def __init__(self, symbols, exception):
+        self.symbols = symbols
+        self.exception = exception
+
+    def get_symbols(self):
+        return self.symbols
+
+    def get_exception(self):
+        return self.exception
+
+    def __repr__(self):
+        return "symbols:%s,exception:%s" % (self.symbols, self.exception)
+
+    def __str__(self):
+        return self.__repr__()
+
+
+class BulkResult:
+    """
+    Merged result of a request fanned out in chunks.
+    Data of the chunks that failed is missing, their symbols and exceptions are listed in errors.
+    """
+
+    def __init__(self, data, errors):
+        self.data = data
+        self.errors = errors
+
+    def get_data(self):
+        return self.data
+
+    def get_errors(self):
+        return self.errors
+
+    def has_errors(self):
+        return len(self.errors) > 0
+
+    def __repr__(self):
+        return "data:%s,errors:%s" % (self.data, self.errors)
+
+    def __str__(self):
+        return self.__repr__()
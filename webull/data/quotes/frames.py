@@ -0,0 +1,225 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+NumPy and pandas adapters of the market data responses.
+
+Each kind of payload declares its columns and their dtypes. A response is converted column by
+column: the values of a column are gathered in one list and converted by a single NumPy cast,
+no object is built per row. Numbers sent as strings are parsed by the cast, a missing number
+is NaN, a missing time or integer is 0, times sent as ISO 8601 strings are converted to epoch
+milliseconds. Columns not declared are left out, pass dtypes to add or override columns.
+
+    response = data_client.market_data.get_batch_history_bar(["AAPL", "TSLA"], Category.US_STOCK.name, "M1")
+    bars = frames.to_dataframe(response)
+
+numpy must be installed, and pandas for to_dataframe: pip install webull-openapi-python-sdk[pandas].
+"""
+
+from urllib.parse import urlparse
+
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+from webull.data.quotes.bar_backfill import to_millis
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+FRAME_BARS = 'bars'
+FRAME_TICK = 'tick'
+FRAME_SNAPSHOT = 'snapshot'
+FRAME_FOOTPRINT = 'footprint'
+FRAME_FINANCIALS = 'financials'
+
+_SNAPSHOT_NUMBER_FIELDS = ['price', 'open', 'high', 'low', 'pre_close', 'volume', 'change', 'change_ratio',
+                           'ext_price', 'ext_high', 'ext_low', 'ext_volume', 'ext_change', 'ext_change_ratio',
+                           'ovn_price', 'ovn_high', 'ovn_low', 'ovn_volume', 'ovn_change', 'ovn_change_ratio']
+
+_SNAPSHOT_TIME_FIELDS = ['trade_time', 'ext_trade_time', 'ovn_trade_time']
+
+DTYPES = {
+    FRAME_BARS: [('symbol', 'U32'), ('time', 'i8'), ('open', 'f8'), ('high', 'f8'), ('low', 'f8'),
+                 ('close', 'f8'), ('volume', 'f8')],
+    FRAME_TICK: [('symbol', 'U32'), ('time', 'i8'), ('price', 'f8'), ('volume', 'f8'), ('side', 'U8'),
+                 ('trading_session', 'U16')],
+    FRAME_SNAPSHOT: [('symbol', 'U32'), ('instrument_id', 'U32')] + [(name, 'i8') for name in _SNAPSHOT_TIME_FIELDS]
+    + [(name, 'f8') for name in _SNAPSHOT_NUMBER_FIELDS],
+    FRAME_FOOTPRINT: [('symbol', 'U32'), ('time', 'i8'), ('trading_session', 'U16'), ('total', 'f8'),
+                      ('delta', 'f8'), ('buy_total', 'f8'), ('sell_total', 'f8')],
+    # the statement items depend on the statement type, pass them with dtypes
+    FRAME_FINANCIALS: [('symbol', 'U32'), ('fiscal_year', 'i4'), ('fiscal_period', 'U16'), ('report_date', 'U10'),
+                       ('currency', 'U8')],
+}
+
+ENDPOINT_FRAMES = {
+    "/openapi/market-data/stock/bars": FRAME_BARS,
+    "/openapi/market-data/stock/batch-bars": FRAME_BARS,
+    "/openapi/market-data/crypto/bars": FRAME_BARS,
+    "/openapi/market-data/futures/bars": FRAME_BARS,
+    "/openapi/market-data/option/bars": FRAME_BARS,
+    "/openapi/market-data/stock/tick": FRAME_TICK,
+    "/openapi/market-data/futures/tick": FRAME_TICK,
+    "/openapi/market-data/option/tick": FRAME_TICK,
+    "/openapi/market-data/stock/snapshot": FRAME_SNAPSHOT,
+    "/openapi/market-data/crypto/snapshot": FRAME_SNAPSHOT,
+    "/openapi/market-data/futures/snapshot": FRAME_SNAPSHOT,
+    "/openapi/market-data/option/snapshot": FRAME_SNAPSHOT,
+    "/openapi/market-data/stock/footprint": FRAME_FOOTPRINT,
+    "/openapi/market-data/futures/footprint": FRAME_FOOTPRINT,
+    "/openapi/fundamentals/financial/income": FRAME_FINANCIALS,
+    "/openapi/fundamentals/financial/balance-sheet": FRAME_FINANCIALS,
+    "/openapi/fundamentals/financial/cash-flow": FRAME_FINANCIALS,
+    "/openapi/fundamentals/financial/indicators": FRAME_FINANCIALS,
+}
+
+# lists of records nested in an item of a multi-symbol response, the item symbol is repeated on each record
+_NESTED_KEYS = ('result', 'bars', 'ticks', 'data', 'items')
+
+
+def get_frame_kind(response):
+    """Kind of payload of a response, from its request path."""
+    url = getattr(response, 'url', None)
+    kind = ENDPOINT_FRAMES.get(urlparse(url).path) if url else None
+    if kind is None:
+        raise ClientException(error_code.SDK_INVALID_PARAMETER,
+                              "No frame kind for the response of %s, pass kind." % url)
+    return kind
+
+
+def get_dtypes(kind, dtypes=None):
+    """
+    Declared columns of kind, as a list of (name, dtype).
+    :param dtypes: List of (name, dtype) or dict, replaces the dtype of a declared column or adds a column.
+    """
+    declared = DTYPES.get(kind)
+    if declared is None:
+        raise ClientException(error_code.SDK_INVALID_PARAMETER, "Unknown frame kind %s." % kind)
+    if not dtypes:
+        return declared
+    extra = dict(dtypes)
+    columns = [(name, extra.pop(name, dtype)) for name, dtype in declared]
+    columns.extend(extra.items())
+    return columns
+
+
+def to_arrays(payload, kind=None, dtypes=None):
+    """
+    Columns of a response as NumPy arrays.
+
+    :param payload: Response of a market data method or its parsed body.
+    :param kind: FRAME_BARS, FRAME_TICK, FRAME_SNAPSHOT, FRAME_FOOTPRINT or FRAME_FINANCIALS,
+    taken from the request path of the response when None.
+    :param dtypes: Extra or overridden columns, see get_dtypes.
+    :return: Dict of column name to array, in the declared order.
+    """
+    _assert_numpy("to_arrays")
+    rows, symbols = _flatten(_get_body(payload))
+    arrays = {}
+    for name, dtype in get_dtypes(kind or get_frame_kind(payload), dtypes):
+        if name == 'symbol' and symbols is not None:
+            values = symbols
+        else:
+            values = [row.get(name) for row in rows]
+        arrays[name] = _to_array(values, np.dtype(dtype))
+    return arrays
+
+
+def to_records(payload, kind=None, dtypes=None):
+    """Response as a NumPy structured array, one record per row, see to_arrays."""
+    _assert_numpy("to_records")
+    arrays = to_arrays(payload, kind, dtypes)
+    size = len(next(iter(arrays.values()))) if arrays else 0
+    records = np.empty(size, dtype=np.dtype([(name, array.dtype) for name, array in arrays.items()]))
+    for name, array in arrays.items():
+        records[name] = array
+    return records
+
+
+def to_dataframe(payload, kind=None, dtypes=None):
+    """Response as a pandas DataFrame, see to_arrays."""
+    if pd is None:
+        raise ClientException(error_code.SDK_INVALID_PARAMETER,
+                              "pandas is required by frames.to_dataframe, install pandas first.")
+    return pd.DataFrame(to_arrays(payload, kind, dtypes), copy=False)
+
+
+def _assert_numpy(name):
+    if np is None:
+        raise ClientException(error_code.SDK_INVALID_PARAMETER,
+                              "numpy is required by frames.%s, install numpy first." % name)
+
+
+def _get_body(payload):
+    if hasattr(payload, 'json'):
+        return payload.json()
+    return payload
+
+
+def _flatten(body):
+    """
+    Rows of a body, and the symbol of each row when they are nested in per-symbol items
+    ({symbol, result: [...]}), None otherwise.
+    """
+    if isinstance(body, dict):
+        for key in _NESTED_KEYS:
+            if isinstance(body.get(key), list):
+                body = body[key]
+                break
+        else:
+            return [body], None
+    if not isinstance(body, list):
+        return [], None
+    nested_key = _get_nested_key(body[0]) if body and isinstance(body[0], dict) else None
+    if nested_key is None:
+        return body, None
+    rows = []
+    symbols = []
+    for item in body:
+        item_rows = item.get(nested_key) or []
+        rows.extend(item_rows)
+        symbols.extend([item.get('symbol')] * len(item_rows))
+    return rows, symbols
+
+
+def _get_nested_key(item):
+    for key in _NESTED_KEYS:
+        if isinstance(item.get(key), list):
+            return key
+    return None
+
+
+def _to_array(values, dtype):
+    if dtype.kind in 'US':
+        return np.array(['' if value is None else value for value in values], dtype=dtype)
+    column = np.array(values, dtype=object)
+    if len(column):
+        missing = (column == '') | np.equal(column, None)
+        if missing.any():
+            column[missing] = np.nan if dtype.kind == 'f' else 0
+    try:
+        return column.astype(dtype)
+    except ValueError:
+        if dtype.kind != 'i':
+            raise
+        # times sent as date strings
+        return np.array([to_millis(value) for value in column], dtype=dtype)
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from webull.core.utils.pagination import iter_records, cursor_from_last_record
 from webull.data.common.category import Category
 from webull.data.request.get_analyst_rating_request import GetAnalystRatingRequest
 from webull.data.request.get_analyst_target_price_request import GetAnalystTargetPriceRequest
@@ -51,6 +52,24 @@ class Instrument:
         response = self.client.get_response(instruments_request)
         return response
 
+    def iter_instrument(self, symbols=None, category=Category.US_STOCK.name, status=None, page_size=1000,
+                        prefetch=True):
+        """
+        Instruments of all pages, see :func:`get_instrument`.
+        The next page is fetched while the records of the current one are consumed.
+
+        :param symbols: Securities symbol, such as: 00700,00981.
+        :param category: Security type, enumeration.
+        :param status: Tradable status.
+        :param page_size: Page size, default 1000.
+        :param prefetch: Fetch the next page in the background.
+        :return: Generator of instrument records.
+        """
+        return iter_records(
+            lambda cursor: self.get_instrument(symbols, category, status, page_size=page_size, **(cursor or {})),
+            cursor_from_last_record({'last_instrument_id': 'instrument_id'}),
+            prefetch, self.client)
+
     def get_crypto_instrument(self, symbols=None, status=None, last_instrument_id=None,
                               category=Category.US_CRYPTO.name, page_size=1000):
         """
@@ -260,4 +279,4 @@ class Instrument:
         request.set_symbol(symbol)
         request.set_category(category)
         response = self.client.get_response(request)
-        return response
\ No newline at end of file
+        return response
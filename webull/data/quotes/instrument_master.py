@@ -0,0 +1,317 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+Instrument master: the instruments of whole categories, indexed by symbol and by instrument id.
+
+The index keeps one list per field and a dict from symbol and from instrument id to the row, so
+both lookups are O(1), and a sorted symbol list per category for prefix search. An index is
+never changed once built, a refresh builds a new one and swaps it, readers need no lock.
+
+The stock and crypto lists are paged by last_instrument_id. A daily refresh resumes each of them
+after the last instrument of the previous download, so only the instruments listed since are
+fetched; refresh(full=True) downloads everything again, to pick up delisted or changed ones.
+The futures list is not paged and is always downloaded in full.
+"""
+
+import bisect
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from array import array
+
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+from webull.core.utils import validation
+from webull.core.utils.common import is_async_client
+from webull.core.utils.pagination import cursor_from_last_record, get_page_records, iter_records
+from webull.data.common.category import Category
+from webull.data.quotes.instrument import Instrument
+
+DEFAULT_CATEGORIES = (Category.US_STOCK.name, Category.US_ETF.name)
+DEFAULT_REFRESH_SECONDS = 24 * 3600
+DEFAULT_SEARCH_LIMIT = 20
+
+FIELDS = ('instrument_id', 'symbol', 'category', 'name', 'exchange_code', 'currency', 'status')
+
+_SNAPSHOT_VERSION = 1
+# fields whose few distinct values are shared between the rows
+_INTERNED_FIELDS = ('category', 'exchange_code', 'currency', 'status')
+
+logger = logging.getLogger(__name__)
+
+
+def _to_str(value):
+    return '' if value is None else str(value)
+
+
+class InstrumentIndex:
+    """
+    Immutable index of instruments.
+
+    :param columns: Dict of field to list of values, one list per field of FIELDS, all of the same length.
+    """
+
+    def __init__(self, columns=None):
+        columns = columns or dict((field, []) for field in FIELDS)
+        self._columns = columns
+        self._by_id = dict((instrument_id, row) for row, instrument_id in enumerate(columns['instrument_id']))
+        self._by_symbol = {}
+        for row, (category, symbol) in enumerate(zip(columns['category'], columns['symbol'])):
+            self._by_symbol.setdefault(category, {})[symbol] = row
+        self._sorted = {}
+        for category, rows_by_symbol in self._by_symbol.items():
+            symbols = sorted(rows_by_symbol)
+            self._sorted[category] = (symbols, array('l', (rows_by_symbol[symbol] for symbol in symbols)))
+
+    @classmethod
+    def from_records(cls, records_by_category, index=None):
+        """
+        Index of the instrument records, added to the rows of index.
+        A record replaces the row of the same instrument id.
+        :param records_by_category: Dict of category to its list of instrument records.
+        """
+        rows = dict(index._iter_rows()) if index is not None else {}
+        for category, records in records_by_category.items():
+            for record in records:
+                instrument_id = record.get('instrument_id')
+                if instrument_id is None or record.get('symbol') is None:
+                    continue
+                values = dict((field, _to_str(record.get(field))) for field in FIELDS)
+                values['category'] = _to_str(record.get('category') or category)
+                rows[values['instrument_id']] = values
+        columns = dict((field, []) for field in FIELDS)
+        for values in rows.values():
+            for field in FIELDS:
+                value = values[field]
+                columns[field].append(sys.intern(value) if field in _INTERNED_FIELDS else value)
+        return cls(columns)
+
+    def get_size(self):
+        return len(self._by_id)
+
+    def get_categories(self):
+        return list(self._by_symbol.keys())
+
+    def get_instrument_id(self, symbol, category=Category.US_STOCK.name):
+        row = self._by_symbol.get(category, {}).get(symbol)
+        return self._columns['instrument_id'][row] if row is not None else None
+
+    def get_symbol(self, instrument_id):
+        row = self._by_id.get(_to_str(instrument_id))
+        return self._columns['symbol'][row] if row is not None else None
+
+    def get_by_symbol(self, symbol, category=Category.US_STOCK.name):
+        """Record of the instrument, a dict of FIELDS, None when it is not indexed."""
+        return self._get_record(self._by_symbol.get(category, {}).get(symbol))
+
+    def get_by_instrument_id(self, instrument_id):
+        return self._get_record(self._by_id.get(_to_str(instrument_id)))
+
+    def search(self, prefix, category=None, limit=DEFAULT_SEARCH_LIMIT):
+        """
+        Records of the instruments whose symbol starts with prefix, by symbol.
+        :param category: Category searched, all of them when None.
+        """
+        validation.assert_integer_positive(limit, "limit")
+        categories = [category] if category is not None else sorted(self._sorted)
+        found = []
+        for searched in categories:
+            symbols, rows = self._sorted.get(searched, ([], []))
+            position = bisect.bisect_left(symbols, prefix)
+            end = min(position + limit, len(symbols))
+            while position < end and symbols[position].startswith(prefix):
+                found.append((symbols[position], rows[position]))
+                position += 1
+        found.sort()
+        return [self._get_record(row) for _, row in found[:limit]]
+
+    def to_snapshot(self):
+        return {'version': _SNAPSHOT_VERSION, 'fields': list(FIELDS), 'columns': self._columns}
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        if snapshot.get('version') != _SNAPSHOT_VERSION or snapshot.get('fields') != list(FIELDS):
+            return None
+        columns = dict((field, snapshot['columns'][field]) for field in FIELDS)
+        for field in _INTERNED_FIELDS:
+            columns[field] = [sys.intern(value) for value in columns[field]]
+        return cls(columns)
+
+    def _get_record(self, row):
+        if row is None:
+            return None
+        return dict((field, self._columns[field][row]) for field in FIELDS)
+
+    def _iter_rows(self):
+        columns = [self._columns[field] for field in FIELDS]
+        for values in zip(*columns):
+            yield values[0], dict(zip(FIELDS, values))
+
+    def __len__(self):
+        return self.get_size()
+
+    def __repr__(self):
+        return "size:%s,categories:%s" % (self.get_size(), self.get_categories())
+
+    def __str__(self):
+        return self.__repr__()
+
+
+class InstrumentMaster:
+    """
+    Downloads the instruments of categories and keeps them in an InstrumentIndex.
+
+        instrument_master = InstrumentMaster(api_client, path="/data/instruments.json")
+        instrument_master.load()
+        instrument_id = instrument_master.get_instrument_id("AAPL")
+
+    The downloads are blocking, an AsyncApiClient is rejected, pass its blocking_client().
+
+    :param api_client: ApiClient.
+    :param categories: Categories downloaded, US_CRYPTO and US_FUTURES use their own lists.
+    :param path: Snapshot file, the index is saved there after each refresh and loaded from there on start.
+    :param refresh_seconds: Age after which refresh_if_stale refreshes the index, daily by default.
+    :param page_size: Page size of the paged lists.
+    """
+
+    def __init__(self, api_client, categories=DEFAULT_CATEGORIES, path=None, refresh_seconds=DEFAULT_REFRESH_SECONDS,
+                 page_size=1000, timer=time.time):
+        if is_async_client(api_client):
+            raise ClientException(error_code.SDK_NOT_SUPPORT, "InstrumentMaster needs a blocking ApiClient.")
+        validation.assert_integer_positive(refresh_seconds, "refresh_seconds")
+        validation.assert_integer_positive(page_size, "page_size")
+        self._instrument = Instrument(api_client)
+        self._categories = list(categories)
+        self._path = path
+        self._refresh_seconds = refresh_seconds
+        self._page_size = page_size
+        self._timer = timer
+        self._refresh_lock = threading.Lock()
+        self._index = InstrumentIndex()
+        self._cursors = {}
+        self._refreshed_at = None
+
+    def get_index(self):
+        return self._index
+
+    def get_refreshed_at(self):
+        return self._refreshed_at
+
+    def get_instrument_id(self, symbol, category=Category.US_STOCK.name):
+        return self._index.get_instrument_id(symbol, category)
+
+    def get_symbol(self, instrument_id):
+        return self._index.get_symbol(instrument_id)
+
+    def get_by_symbol(self, symbol, category=Category.US_STOCK.name):
+        return self._index.get_by_symbol(symbol, category)
+
+    def get_by_instrument_id(self, instrument_id):
+        return self._index.get_by_instrument_id(instrument_id)
+
+    def search(self, prefix, category=None, limit=DEFAULT_SEARCH_LIMIT):
+        return self._index.search(prefix, category, limit)
+
+    def load(self):
+        """Loads the snapshot, then refreshes the index when it is missing or stale. Returns the index."""
+        if self._path is not None and self._index.get_size() == 0:
+            self._load_snapshot()
+        self.refresh_if_stale()
+        return self._index
+
+    def refresh_if_stale(self):
+        """Refreshes the index when it is older than refresh_seconds, returns True when it did."""
+        if not self._is_stale():
+            return False
+        with self._refresh_lock:
+            # another thread may have refreshed it while this one waited for the lock
+            if not self._is_stale():
+                return False
+            self._refresh(full=self._refreshed_at is None)
+            return True
+
+    def refresh(self, full=False):
+        """
+        Downloads the instruments and swaps the index.
+        :param full: Download every instrument again, else only the ones after the last downloaded.
+        """
+        with self._refresh_lock:
+            return self._refresh(full)
+
+    def _is_stale(self):
+        return self._refreshed_at is None or self._timer() - self._refreshed_at >= self._refresh_seconds
+
+    def _refresh(self, full):
+        cursors = {} if full else dict(self._cursors)
+        records_by_category = dict((category, self._download(category, cursors)) for category in self._categories)
+        index = InstrumentIndex.from_records(records_by_category, None if full else self._index)
+        self._index = index
+        self._cursors = cursors
+        self._refreshed_at = self._timer()
+        logger.info("Instrument master refreshed. full:%s size:%s", full, index.get_size())
+        if self._path is not None:
+            self._save_snapshot()
+        return index
+
+    def _download(self, category, cursors):
+        if category in (Category.US_FUTURES.name, Category.HK_FUTURES.name):
+            return get_page_records(self._instrument.get_futures_instrument(category=category).json())
+        if category == Category.US_CRYPTO.name:
+            fetch = self._instrument.get_crypto_instrument
+        else:
+            fetch = self._instrument.get_instrument
+        records = []
+        cursor = cursors.get(category)
+        first_cursor = {'last_instrument_id': cursor} if cursor is not None else None
+        for record in iter_records(
+                lambda page_cursor: fetch(category=category, page_size=self._page_size,
+                                          **(page_cursor or first_cursor or {})),
+                cursor_from_last_record({'last_instrument_id': 'instrument_id'})):
+            records.append(record)
+        if records and records[-1].get('instrument_id') is not None:
+            cursors[category] = _to_str(records[-1]['instrument_id'])
+        return records
+
+    def _load_snapshot(self):
+        if not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, 'r') as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            index = InstrumentIndex.from_snapshot(snapshot)
+        except (ValueError, KeyError) as e:
+            logger.warning("Instrument master snapshot ignored. path:%s exception:%s", self._path, e)
+            return
+        if index is None or snapshot.get('categories') != self._categories:
+            return
+        self._index = index
+        self._cursors = snapshot.get('cursors', {})
+        self._refreshed_at = snapshot.get('refreshed_at')
+
+    def _save_snapshot(self):
+        snapshot = self._index.to_snapshot()
+        snapshot.update(categories=self._categories, cursors=self._cursors, refreshed_at=self._refreshed_at)
+        directory = os.path.dirname(os.path.abspath(self._path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        temporary_path = self._path + '.tmp'
+        with open(temporary_path, 'w') as snapshot_file:
+            json.dump(snapshot, snapshot_file, separators=(',', ':'))
+        os.replace(temporary_path, self._path)
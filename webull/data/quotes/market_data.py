@@ -11,6 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from webull.core.utils import validation
+from webull.data.common.category import Category
+from webull.data.internal.fan_out import split_symbols, is_async_client, fan_out, fan_out_async
+from webull.data.quotes.bulk_result import BulkResult, ChunkError
 from webull.data.request.get_batch_historical_bars_request import BatchHistoricalBarsRequest
 from webull.data.request.get_corp_action_request import GetCorpActionRequest
 from webull.data.request.get_eod_bars_request import GetEodBarsRequest
@@ -22,6 +26,11 @@ from webull.data.request.get_quotes_request import GetQuotesRequest
 from webull.data.request.get_snapshot_request import GetSnapshotRequest
 from webull.data.request.get_tick_request import GetTickRequest
 
+SNAPSHOT_MAX_SYMBOLS = 100
+SNAPSHOT_MAX_SYMBOLS_HK_BMP = 20
+DEFAULT_BULK_WORKERS = 8
+_HK_CATEGORIES = (Category.HK_STOCK.name, Category.HK_ETF.name)
+
 
 class MarketData:
     def __init__(self, api_client):
@@ -104,6 +113,55 @@ class MarketData:
         response = self.client.get_response(snapshot_request)
         return response
 
+    def get_snapshot_bulk(self, symbols, category, extend_hour_required=None, overnight_required=None,
+                          hk_bmp=False, max_workers=DEFAULT_BULK_WORKERS):
+        """
+        Query the latest snapshots of any number of symbols.
+        The symbols are split into chunks the server accepts (100 symbols, 20 under the authority of
+        Hong Kong stock BMP), the chunks are requested concurrently and merged back.
+
+        :param symbols: List of security codes or comma separated codes, duplicates are ignored.
+        :param category: Security type, enumeration.
+        :param extend_hour_required: Whether to include pre-market and after-hours sessions, the default is not included
+        :param overnight_required: Whether to include the night session, the default is not included
+        :param hk_bmp: Whether the Hong Kong stock quotes permission is BMP
+        :param max_workers: Max number of chunks requested at the same time
+        :return: BulkResult, its data is the list of snapshots in the order of symbols, its errors the failed chunks.
+        Built on an AsyncApiClient an awaitable of the BulkResult is returned.
+        """
+        validation.assert_integer_positive(max_workers, "max_workers")
+        chunk_size = SNAPSHOT_MAX_SYMBOLS
+        if hk_bmp and category in _HK_CATEGORIES:
+            chunk_size = SNAPSHOT_MAX_SYMBOLS_HK_BMP
+        chunks = split_symbols(symbols, chunk_size)
+
+        def fetch(chunk):
+            return self.get_snapshot(chunk, category, extend_hour_required, overnight_required)
+
+        if is_async_client(self.client):
+            return self._get_snapshot_bulk_async(chunks, fetch, max_workers)
+        return self._merge_snapshot_chunks(fan_out(chunks, fetch, max_workers))
+
+    async def _get_snapshot_bulk_async(self, chunks, fetch, max_workers):
+        return self._merge_snapshot_chunks(await fan_out_async(chunks, fetch, max_workers))
+
+    @staticmethod
+    def _merge_snapshot_chunks(chunk_results):
+        order = {}
+        data = []
+        errors = []
+        for chunk, response, exception in chunk_results:
+            for symbol in chunk:
+                order[symbol] = len(order)
+            if exception is not None:
+                errors.append(ChunkError(chunk, exception))
+                continue
+            snapshots = response.json()
+            if snapshots:
+                data.extend(snapshots)
+        data.sort(key=lambda snapshot: order.get(snapshot.get('symbol'), len(order)))
+        return BulkResult(data, errors)
+
     def get_quotes(self, symbol, category, depth=None, overnight_required=None):
         """
         Query the depth quote of securities according to the stock code list.
@@ -0,0 +1,309 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+Order books maintained from the streaming depth messages.
+
+A QUOTE message carries the full depth of a symbol. OrderBook keeps each side in
+array.array buffers (price, size and cumulative size per level, best level first) and
+rewrites only the levels that changed, so a reader gets the best levels, the spread,
+the microprice or the depth of the first N levels in O(1) without any list being copied.
+"""
+
+import threading
+from array import array
+
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+from webull.data.quotes.subscribe.payload_type import PAYLOAD_TYPE_EVENT_DEPTH, PAYLOAD_TYPE_QUOTE
+
+SIDE_BID = 'bid'
+SIDE_ASK = 'ask'
+
+
+def _to_float(value):
+    return float(value) if value else 0.0
+
+
+class _BookSide:
+    __slots__ = ('prices', 'sizes', 'cumulative_sizes')
+
+    def __init__(self):
+        self.prices = array('d')
+        self.sizes = array('d')
+        self.cumulative_sizes = array('d')
+
+    def update(self, levels):
+        """Rewrites the side from levels (objects with price and size), returns the number of changed levels."""
+        prices = self.prices
+        sizes = self.sizes
+        cumulative_sizes = self.cumulative_sizes
+        length = len(prices)
+        changed = 0
+        cumulative = 0.0
+        index = 0
+        for level in levels:
+            price = _to_float(level.price)
+            size = _to_float(level.size)
+            cumulative += size
+            if index < length:
+                if prices[index] != price or sizes[index] != size:
+                    prices[index] = price
+                    sizes[index] = size
+                    changed += 1
+                cumulative_sizes[index] = cumulative
+            else:
+                prices.append(price)
+                sizes.append(size)
+                cumulative_sizes.append(cumulative)
+                changed += 1
+            index += 1
+        if index < length:
+            changed += length - index
+            del prices[index:]
+            del sizes[index:]
+            del cumulative_sizes[index:]
+        return changed
+
+    def levels(self):
+        return list(zip(self.prices, self.sizes))
+
+
+class _ImpliedAsk:
+    __slots__ = ('price', 'size')
+
+    def __init__(self, price, size):
+        self.price = price
+        self.size = size
+
+
+class OrderBookSnapshot:
+    """Copy of an OrderBook at one version, bids and asks are lists of (price, size), best level first."""
+
+    def __init__(self, symbol, timestamp, version, bids, asks):
+        self.symbol = symbol
+        self.timestamp = timestamp
+        self.version = version
+        self.bids = bids
+        self.asks = asks
+
+    def get_symbol(self):
+        return self.symbol
+
+    def get_timestamp(self):
+        return self.timestamp
+
+    def get_version(self):
+        return self.version
+
+    def get_bids(self):
+        return self.bids
+
+    def get_asks(self):
+        return self.asks
+
+    def __repr__(self):
+        return "symbol:%s,timestamp:%s,version:%s,bids:%s,asks:%s" % (
+            self.symbol, self.timestamp, self.version, self.bids, self.asks)
+
+    def __str__(self):
+        return self.__repr__()
+
+
+class OrderBook:
+    """
+    Book of one symbol. Prices and sizes are float whatever the numeric mode of the decoder.
+    update runs on the streaming thread, every other method can be called from any thread.
+    """
+
+    def __init__(self, symbol):
+        self._symbol = symbol
+        self._lock = threading.Lock()
+        self._sides = {SIDE_BID: _BookSide(), SIDE_ASK: _BookSide()}
+        self._timestamp = None
+        self._version = 0
+        self._changed_levels = 0
+
+    def update(self, bids, asks, timestamp=None):
+        """
+        Applies a full depth message.
+
+        :param bids: Bid levels, best first, objects with price and size (AskBidResult or the protobuf AskBid).
+        :param asks: Ask levels, best first.
+        :param timestamp: Timestamp of the message.
+        :return: Number of levels that changed.
+        """
+        with self._lock:
+            changed = self._sides[SIDE_BID].update(bids) + self._sides[SIDE_ASK].update(asks)
+            self._timestamp = timestamp
+            self._version += 1
+            self._changed_levels += changed
+            return changed
+
+    def get_symbol(self):
+        return self._symbol
+
+    def get_timestamp(self):
+        return self._timestamp
+
+    def get_version(self):
+        """Number of messages applied."""
+        return self._version
+
+    def get_changed_levels(self):
+        """Number of levels rewritten since the book was created."""
+        return self._changed_levels
+
+    def get_level_count(self, side):
+        return len(self._get_side(side).prices)
+
+    def get_level(self, side, index):
+        """(price, size) of the level at index, 0 is the best level, None when there is no such level."""
+        book_side = self._get_side(side)
+        with self._lock:
+            if index >= len(book_side.prices):
+                return None
+            return book_side.prices[index], book_side.sizes[index]
+
+    def get_best_bid(self):
+        return self.get_level(SIDE_BID, 0)
+
+    def get_best_ask(self):
+        return self.get_level(SIDE_ASK, 0)
+
+    def get_spread(self):
+        with self._lock:
+            bid, ask = self._top(SIDE_BID), self._top(SIDE_ASK)
+            if bid is None or ask is None:
+                return None
+            return ask[0] - bid[0]
+
+    def get_mid_price(self):
+        with self._lock:
+            bid, ask = self._top(SIDE_BID), self._top(SIDE_ASK)
+            if bid is None or ask is None:
+                return None
+            return (bid[0] + ask[0]) / 2
+
+    def get_microprice(self):
+        """Mid price weighted by the size on the opposite side of the best levels."""
+        with self._lock:
+            bid, ask = self._top(SIDE_BID), self._top(SIDE_ASK)
+            if bid is None or ask is None:
+                return None
+            total_size = bid[1] + ask[1]
+            if total_size <= 0:
+                return (bid[0] + ask[0]) / 2
+            return (bid[0] * ask[1] + ask[0] * bid[1]) / total_size
+
+    def get_depth(self, side, levels):
+        """Total size of the first levels of side."""
+        book_side = self._get_side(side)
+        if levels <= 0:
+            return 0.0
+        with self._lock:
+            count = len(book_side.cumulative_sizes)
+            if count == 0:
+                return 0.0
+            return book_side.cumulative_sizes[min(levels, count) - 1]
+
+    def snapshot(self):
+        with self._lock:
+            return OrderBookSnapshot(self._symbol, self._timestamp, self._version,
+                                     self._sides[SIDE_BID].levels(), self._sides[SIDE_ASK].levels())
+
+    def _top(self, side):
+        book_side = self._sides[side]
+        if not book_side.prices:
+            return None
+        return book_side.prices[0], book_side.sizes[0]
+
+    def _get_side(self, side):
+        book_side = self._sides.get(side)
+        if book_side is None:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER, "side should be bid or ask.")
+        return book_side
+
+    def __repr__(self):
+        return "symbol:%s,version:%s,best_bid:%s,best_ask:%s" % (
+            self._symbol, self._version, self.get_best_bid(), self.get_best_ask())
+
+    def __str__(self):
+        return self.__repr__()
+
+
+class OrderBooks:
+    """
+    Order books of all the subscribed symbols, fed from on_quotes_message:
+
+        order_books = OrderBooks()
+
+        def on_quotes_message(client, topic, quotes):
+            order_books.apply(topic, quotes)
+
+    For event contracts the bids are the YES bids and the asks are implied from the NO bids,
+    a NO bid at p is a YES ask at event_price_unit - p.
+    """
+
+    def __init__(self, event_price_unit=1):
+        self._event_price_unit = float(event_price_unit)
+        self._lock = threading.Lock()
+        self._books = {}
+
+    def apply(self, topic, result):
+        """Updates the book of the message symbol, returns the book or None when topic carries no depth."""
+        if topic == PAYLOAD_TYPE_QUOTE:
+            return self.on_quote(result)
+        if topic == PAYLOAD_TYPE_EVENT_DEPTH:
+            return self.on_event_depth(result)
+        return None
+
+    def on_quote(self, quote_result):
+        basic = quote_result.basic
+        book = self._get_or_create(basic.symbol)
+        book.update(quote_result.bids, quote_result.asks, basic.timestamp)
+        return book
+
+    def on_event_depth(self, event_depth_result):
+        basic = event_depth_result.basic
+        book = self._get_or_create(basic.symbol)
+        unit = self._event_price_unit
+        asks = [_ImpliedAsk(unit - _to_float(bid.price), bid.size) for bid in event_depth_result.no_bids]
+        book.update(event_depth_result.yes_bids, asks, basic.timestamp)
+        return book
+
+    def get(self, symbol):
+        return self._books.get(symbol)
+
+    def get_symbols(self):
+        return list(self._books.keys())
+
+    def snapshot(self, symbol):
+        book = self._books.get(symbol)
+        return book.snapshot() if book is not None else None
+
+    def remove(self, symbol):
+        with self._lock:
+            return self._books.pop(symbol, None)
+
+    def _get_or_create(self, symbol):
+        book = self._books.get(symbol)
+        if book is None:
+            with self._lock:
+                book = self._books.get(symbol)
+                if book is None:
+                    book = self._books[symbol] = OrderBook(symbol)
+        return book
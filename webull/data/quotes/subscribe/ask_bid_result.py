@@ -12,23 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from decimal import Decimal
-from webull.data.quotes.subscribe.order_result import Order
-from webull.data.quotes.subscribe.broker_result import Broker
+from webull.data.quotes.subscribe.order_result import Order, LazyOrder
+from webull.data.quotes.subscribe.broker_result import Broker, LazyBroker
+from webull.data.quotes.subscribe.numeric_mode import to_decimal
+from webull.data.quotes.subscribe.lazy_field import number_field, raw_field
 
 
-class AskBidResult:
-    def __init__(self, ask_bid):
-        self.price = Decimal(ask_bid.price) if ask_bid.price else None
-        self.size = ask_bid.size
-        self.order = []
-        if hasattr(ask_bid, 'order') and ask_bid.order:
-            for order in ask_bid.order:
-                self.order.append(Order(order))
-        self.broker = []
-        if hasattr(ask_bid, 'broker') and ask_bid.broker:
-            for broker in ask_bid.broker:
-                self.broker.append(Broker(broker))
+class BaseAskBidResult:
+    __slots__ = ()
 
     def get_price(self):
         return self.price
@@ -53,3 +44,44 @@ class AskBidResult:
 
     def __str__(self):
         return self.__repr__()
+
+
+class AskBidResult(BaseAskBidResult):
+    def __init__(self, ask_bid, to_number=to_decimal):
+        self.price = to_number(ask_bid.price)
+        self.size = ask_bid.size
+        self.order = []
+        if hasattr(ask_bid, 'order') and ask_bid.order:
+            for order in ask_bid.order:
+                self.order.append(Order(order))
+        self.broker = []
+        if hasattr(ask_bid, 'broker') and ask_bid.broker:
+            for broker in ask_bid.broker:
+                self.broker.append(Broker(broker, to_number))
+
+
+class LazyAskBidResult(BaseAskBidResult):
+    __slots__ = ('_pb', '_to_number', '_order', '_broker')
+
+    def __init__(self, ask_bid, to_number=to_decimal):
+        self._pb = ask_bid
+        self._to_number = to_number
+        self._order = None
+        self._broker = None
+
+    price = number_field('price')
+    size = raw_field('size')
+
+    @property
+    def order(self):
+        if self._order is None:
+            orders = getattr(self._pb, 'order', None)
+            self._order = [LazyOrder(order) for order in orders] if orders else []
+        return self._order
+
+    @property
+    def broker(self):
+        if self._broker is None:
+            brokers = getattr(self._pb, 'broker', None)
+            self._broker = [LazyBroker(broker, self._to_number) for broker in brokers] if brokers else []
+        return self._broker
@@ -15,13 +15,11 @@
 # coding=utf-8
 from datetime import datetime
 
+from webull.data.quotes.subscribe.lazy_field import raw_field
 
-class BasicResult:
-    def __init__(self, pb_basic):
-        self.symbol = pb_basic.symbol
-        self.instrument_id = pb_basic.instrument_id
-        self.timestamp = int(pb_basic.timestamp)
-        self.trading_session = pb_basic.trading_session
+
+class BaseBasicResult:
+    __slots__ = ()
 
     def get_symbol(self):
         return self.symbol
@@ -43,3 +41,26 @@ class BasicResult:
 
     def __str__(self):
         return self.__repr__()
+
+
+class BasicResult(BaseBasicResult):
+    def __init__(self, pb_basic):
+        self.symbol = pb_basic.symbol
+        self.instrument_id = pb_basic.instrument_id
+        self.timestamp = int(pb_basic.timestamp)
+        self.trading_session = pb_basic.trading_session
+
+
+class LazyBasicResult(BaseBasicResult):
+    __slots__ = ('_pb',)
+
+    def __init__(self, pb_basic):
+        self._pb = pb_basic
+
+    symbol = raw_field('symbol')
+    instrument_id = raw_field('instrument_id')
+    trading_session = raw_field('trading_session')
+
+    @property
+    def timestamp(self):
+        return int(self._pb.timestamp)
@@ -12,13 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from decimal import Decimal
 
+from webull.data.quotes.subscribe.numeric_mode import to_decimal
+from webull.data.quotes.subscribe.lazy_field import number_field, raw_field
 
-class Broker:
-    def __init__(self, pb_broker):
-        self.bid = Decimal(pb_broker.bid) if pb_broker.bid else None
-        self.name = pb_broker.name if pb_broker.name else None
+
+class BaseBroker:
+    __slots__ = ()
 
     def get_bid(self):
         return self.bid
@@ -31,3 +31,20 @@ class Broker:
 
     def __str__(self):
         return self.__repr__()
+
+
+class Broker(BaseBroker):
+    def __init__(self, pb_broker, to_number=to_decimal):
+        self.bid = to_number(pb_broker.bid)
+        self.name = pb_broker.name if pb_broker.name else None
+
+
+class LazyBroker(BaseBroker):
+    __slots__ = ('_pb', '_to_number')
+
+    def __init__(self, pb_broker, to_number=to_decimal):
+        self._pb = pb_broker
+        self._to_number = to_number
+
+    bid = number_field('bid')
+    name = raw_field('name', empty_as_none=True)
@@ -14,14 +14,17 @@
 # coding=utf-8
 
 from webull.data.quotes.subscribe.message_pb2 import EventQuote
-from webull.data.quotes.subscribe.event_depth_result import EventDepthResult
+from webull.data.quotes.subscribe.event_depth_result import EventDepthResult, LazyEventDepthResult
+from webull.data.quotes.subscribe.numeric_mode import NUMERIC_MODE_DECIMAL, get_number_converter
 from webull.data.internal.quotes_payload_decoder import BaseQuotesPayloadDecoder
 
 class EventDepthDecoder(BaseQuotesPayloadDecoder):
-    def __init__(self):
+    def __init__(self, lazy=False, numeric_mode=NUMERIC_MODE_DECIMAL):
         super().__init__()
+        self._to_number = get_number_converter(numeric_mode)
+        self._result_class = LazyEventDepthResult if lazy else EventDepthResult
 
     def parse(self, payload):
         eventQuote = EventQuote()
         eventQuote.ParseFromString(payload)
-        return EventDepthResult(eventQuote)
+        return self._result_class(eventQuote, self._to_number)
@@ -14,21 +14,13 @@
 
 # coding=utf-8
 
-from webull.data.quotes.subscribe.basic_result import BasicResult
-from webull.data.quotes.subscribe.ask_bid_result import AskBidResult
+from webull.data.quotes.subscribe.basic_result import BasicResult, LazyBasicResult
+from webull.data.quotes.subscribe.ask_bid_result import AskBidResult, LazyAskBidResult
+from webull.data.quotes.subscribe.numeric_mode import to_decimal
 
 
-class EventDepthResult:
-    def __init__(self, pb_event_depth):
-        self.basic = BasicResult(pb_event_depth.basic)
-        self.yes_bids = []
-        if pb_event_depth.yes_bids:
-            for bid in pb_event_depth.yes_bids:
-                self.yes_bids.append(AskBidResult(bid))
-        self.no_bids = []
-        if pb_event_depth.no_bids:
-            for bid in pb_event_depth.no_bids:
-                self.no_bids.append(AskBidResult(bid))
+class BaseEventDepthResult:
+    __slots__ = ()
 
     def get_basic(self):
         return self.basic
@@ -44,3 +36,45 @@ class EventDepthResult:
 
     def __str__(self):
         return self.__repr__()
+
+
+class EventDepthResult(BaseEventDepthResult):
+    def __init__(self, pb_event_depth, to_number=to_decimal):
+        self.basic = BasicResult(pb_event_depth.basic)
+        self.yes_bids = []
+        if pb_event_depth.yes_bids:
+            for bid in pb_event_depth.yes_bids:
+                self.yes_bids.append(AskBidResult(bid, to_number))
+        self.no_bids = []
+        if pb_event_depth.no_bids:
+            for bid in pb_event_depth.no_bids:
+                self.no_bids.append(AskBidResult(bid, to_number))
+
+
+class LazyEventDepthResult(BaseEventDepthResult):
+    __slots__ = ('_pb', '_to_number', '_basic', '_yes_bids', '_no_bids')
+
+    def __init__(self, pb_event_depth, to_number=to_decimal):
+        self._pb = pb_event_depth
+        self._to_number = to_number
+        self._basic = None
+        self._yes_bids = None
+        self._no_bids = None
+
+    @property
+    def basic(self):
+        if self._basic is None:
+            self._basic = LazyBasicResult(self._pb.basic)
+        return self._basic
+
+    @property
+    def yes_bids(self):
+        if self._yes_bids is None:
+            self._yes_bids = [LazyAskBidResult(bid, self._to_number) for bid in self._pb.yes_bids]
+        return self._yes_bids
+
+    @property
+    def no_bids(self):
+        if self._no_bids is None:
+            self._no_bids = [LazyAskBidResult(bid, self._to_number) for bid in self._pb.no_bids]
+        return self._no_bids
@@ -14,16 +14,19 @@
 # coding=utf-8
 
 from webull.data.quotes.subscribe.message_pb2 import EventSnapshot
-from webull.data.quotes.subscribe.event_snapshot_result import EventSnapshotResult
+from webull.data.quotes.subscribe.event_snapshot_result import EventSnapshotResult, LazyEventSnapshotResult
+from webull.data.quotes.subscribe.numeric_mode import NUMERIC_MODE_DECIMAL, get_number_converter
 from webull.data.internal.quotes_payload_decoder import BaseQuotesPayloadDecoder
 
 
 
 class EventSnapshotDecoder(BaseQuotesPayloadDecoder):
-    def __init__(self):
+    def __init__(self, lazy=False, numeric_mode=NUMERIC_MODE_DECIMAL):
         super().__init__()
+        self._to_number = get_number_converter(numeric_mode)
+        self._result_class = LazyEventSnapshotResult if lazy else EventSnapshotResult
 
     def parse(self, payload):
         eventSnapshot = EventSnapshot()
         eventSnapshot.ParseFromString(payload)
-        return EventSnapshotResult(eventSnapshot)
+        return self._result_class(eventSnapshot, self._to_number)
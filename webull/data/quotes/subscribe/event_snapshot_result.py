@@ -14,25 +14,13 @@
 
 # coding=utf-8
 
-from decimal import Decimal
-from webull.data.quotes.subscribe.basic_result import BasicResult
+from webull.data.quotes.subscribe.basic_result import BasicResult, LazyBasicResult
+from webull.data.quotes.subscribe.numeric_mode import to_decimal
+from webull.data.quotes.subscribe.lazy_field import number_field, int_field
 
 
-class EventSnapshotResult:
-    def __init__(self, pb_event_snapshot):
-        self.basic = BasicResult(pb_event_snapshot.basic)
-        self.price = Decimal(pb_event_snapshot.price) if pb_event_snapshot.price else None
-        self.volume = Decimal(pb_event_snapshot.volume) if pb_event_snapshot.volume else None
-        self.last_trade_time = int(pb_event_snapshot.last_trade_time) if pb_event_snapshot.last_trade_time else None
-        self.open_interest = Decimal(pb_event_snapshot.open_interest) if pb_event_snapshot.open_interest else None
-        self.yes_ask = Decimal(pb_event_snapshot.yes_ask) if pb_event_snapshot.yes_ask else None
-        self.yes_ask_size = Decimal(pb_event_snapshot.yes_ask_size) if pb_event_snapshot.yes_ask_size else None
-        self.yes_bid = Decimal(pb_event_snapshot.yes_bid) if pb_event_snapshot.yes_bid else None
-        self.yes_bid_size = Decimal(pb_event_snapshot.yes_bid_size) if pb_event_snapshot.yes_bid_size else None
-        self.no_bid = Decimal(pb_event_snapshot.no_bid) if pb_event_snapshot.no_bid else None
-        self.no_bid_size = Decimal(pb_event_snapshot.no_bid_size) if pb_event_snapshot.no_bid_size else None
-        self.no_ask = Decimal(pb_event_snapshot.no_ask) if pb_event_snapshot.no_ask else None
-        self.no_ask_size = Decimal(pb_event_snapshot.no_ask_size) if pb_event_snapshot.no_ask_size else None
+class BaseEventSnapshotResult:
+    __slots__ = ()
 
     def get_basic(self):
         return self.basic
@@ -83,3 +71,48 @@ class EventSnapshotResult:
 
     def __str__(self):
         return self.__repr__()
+
+
+class EventSnapshotResult(BaseEventSnapshotResult):
+    def __init__(self, pb_event_snapshot, to_number=to_decimal):
+        self.basic = BasicResult(pb_event_snapshot.basic)
+        self.price = to_number(pb_event_snapshot.price)
+        self.volume = to_number(pb_event_snapshot.volume)
+        self.last_trade_time = int(pb_event_snapshot.last_trade_time) if pb_event_snapshot.last_trade_time else None
+        self.open_interest = to_number(pb_event_snapshot.open_interest)
+        self.yes_ask = to_number(pb_event_snapshot.yes_ask)
+        self.yes_ask_size = to_number(pb_event_snapshot.yes_ask_size)
+        self.yes_bid = to_number(pb_event_snapshot.yes_bid)
+        self.yes_bid_size = to_number(pb_event_snapshot.yes_bid_size)
+        self.no_bid = to_number(pb_event_snapshot.no_bid)
+        self.no_bid_size = to_number(pb_event_snapshot.no_bid_size)
+        self.no_ask = to_number(pb_event_snapshot.no_ask)
+        self.no_ask_size = to_number(pb_event_snapshot.no_ask_size)
+
+
+class LazyEventSnapshotResult(BaseEventSnapshotResult):
+    __slots__ = ('_pb', '_to_number', '_basic')
+
+    def __init__(self, pb_event_snapshot, to_number=to_decimal):
+        self._pb = pb_event_snapshot
+        self._to_number = to_number
+        self._basic = None
+
+    @property
+    def basic(self):
+        if self._basic is None:
+            self._basic = LazyBasicResult(self._pb.basic)
+        return self._basic
+
+    price = number_field('price')
+    volume = number_field('volume')
+    last_trade_time = int_field('last_trade_time')
+    open_interest = number_field('open_interest')
+    yes_ask = number_field('yes_ask')
+    yes_ask_size = number_field('yes_ask_size')
+    yes_bid = number_field('yes_bid')
+    yes_bid_size = number_field('yes_bid_size')
+    no_ask = number_field('no_ask')
+    no_ask_size = number_field('no_ask_size')
+    no_bid = number_field('no_bid')
+    no_bid_size = number_field('no_bid_size')
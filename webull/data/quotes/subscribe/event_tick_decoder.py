@@ -14,17 +14,20 @@
 # coding=utf-8
 
 from webull.data.quotes.subscribe.message_pb2 import EventTick
-from webull.data.quotes.subscribe.event_tick_result import EventTickResult
+from webull.data.quotes.subscribe.event_tick_result import EventTickResult, LazyEventTickResult
 
+from webull.data.quotes.subscribe.numeric_mode import NUMERIC_MODE_DECIMAL, get_number_converter
 from webull.data.internal.quotes_payload_decoder import BaseQuotesPayloadDecoder
 
 
 
 class EventTickDecoder(BaseQuotesPayloadDecoder):
-    def __init__(self):
+    def __init__(self, lazy=False, numeric_mode=NUMERIC_MODE_DECIMAL):
         super().__init__()
+        self._to_number = get_number_converter(numeric_mode)
+        self._result_class = LazyEventTickResult if lazy else EventTickResult
 
     def parse(self, payload):
         eventTick = EventTick()
         eventTick.ParseFromString(payload)
-        return EventTickResult(eventTick)
+        return self._result_class(eventTick, self._to_number)
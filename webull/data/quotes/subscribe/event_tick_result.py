@@ -14,19 +14,13 @@
 
 # coding=utf-8
 
-from decimal import Decimal
-from webull.data.quotes.subscribe.basic_result import BasicResult
+from webull.data.quotes.subscribe.basic_result import BasicResult, LazyBasicResult
+from webull.data.quotes.subscribe.numeric_mode import to_decimal
+from webull.data.quotes.subscribe.lazy_field import number_field, raw_field
 
 
-class EventTickResult:
-    def __init__(self, pb_event_tick):
-        self.basic = BasicResult(pb_event_tick.basic)
-        self.time = pb_event_tick.time
-        self.yes_price = Decimal(pb_event_tick.yes_price) if pb_event_tick.yes_price else None
-        self.no_price = Decimal(pb_event_tick.no_price) if pb_event_tick.no_price else None
-        self.volume = pb_event_tick.volume
-        self.side = pb_event_tick.side
-        self.trade_id = pb_event_tick.trade_id
+class BaseEventTickResult:
+    __slots__ = ()
 
     def get_basic(self):
         return self.basic
@@ -54,3 +48,36 @@ class EventTickResult:
 
     def __str__(self):
         return self.__repr__()
+
+
+class EventTickResult(BaseEventTickResult):
+    def __init__(self, pb_event_tick, to_number=to_decimal):
+        self.basic = BasicResult(pb_event_tick.basic)
+        self.time = pb_event_tick.time
+        self.yes_price = to_number(pb_event_tick.yes_price)
+        self.no_price = to_number(pb_event_tick.no_price)
+        self.volume = pb_event_tick.volume
+        self.side = pb_event_tick.side
+        self.trade_id = pb_event_tick.trade_id
+
+
+class LazyEventTickResult(BaseEventTickResult):
+    __slots__ = ('_pb', '_to_number', '_basic')
+
+    def __init__(self, pb_event_tick, to_number=to_decimal):
+        self._pb = pb_event_tick
+        self._to_number = to_number
+        self._basic = None
+
+    @property
+    def basic(self):
+        if self._basic is None:
+            self._basic = LazyBasicResult(self._pb.basic)
+        return self._basic
+
+    time = raw_field('time')
+    yes_price = number_field('yes_price')
+    no_price = number_field('no_price')
+    volume = raw_field('volume')
+    side = raw_field('side')
+    trade_id = raw_field('trade_id')
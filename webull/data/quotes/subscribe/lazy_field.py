@@ -0,0 +1,43 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+Properties of the lazy results, a field of the wrapped protobuf (self._pb)
+is only converted when it is read.
+"""
+
+
+def number_field(pb_name):
+    """Converted by self._to_number, which follows the numeric mode of the decoder."""
+    def getter(self):
+        return self._to_number(getattr(self._pb, pb_name))
+    return property(getter)
+
+
+def int_field(pb_name):
+    def getter(self):
+        value = getattr(self._pb, pb_name)
+        return int(value) if value else None
+    return property(getter)
+
+
+def raw_field(pb_name, empty_as_none=False):
+    def getter(self):
+        value = getattr(self._pb, pb_name)
+        if empty_as_none and not value:
+            return None
+        return value
+    return property(getter)
@@ -0,0 +1,62 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+Numeric modes of the streaming results, select how the price, size, volume and ratio fields
+(sent as strings) are converted:
+
+- decimal: decimal.Decimal, exact, the default.
+- float: float, about ten times cheaper to build than a Decimal.
+- raw_str: the string as pushed, no conversion at all.
+
+Empty fields are None in every mode. Timestamps are always int.
+"""
+
+from decimal import Decimal
+
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+
+NUMERIC_MODE_DECIMAL = "decimal"
+NUMERIC_MODE_FLOAT = "float"
+NUMERIC_MODE_RAW_STR = "raw_str"
+
+
+def to_decimal(value):
+    return Decimal(value) if value else None
+
+
+def to_float(value):
+    return float(value) if value else None
+
+
+def to_raw_str(value):
+    return value if value else None
+
+
+_NUMBER_CONVERTERS = {
+    NUMERIC_MODE_DECIMAL: to_decimal,
+    NUMERIC_MODE_FLOAT: to_float,
+    NUMERIC_MODE_RAW_STR: to_raw_str,
+}
+
+
+def get_number_converter(numeric_mode):
+    converter = _NUMBER_CONVERTERS.get(numeric_mode)
+    if converter is None:
+        raise ClientException(error_code.SDK_INVALID_PARAMETER,
+                              "numeric_mode should be one of %s." % ", ".join(_NUMBER_CONVERTERS))
+    return converter
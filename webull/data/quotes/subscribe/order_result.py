@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-class Order:
-    def __init__(self, order):
-        self.mpid = order.mpid
-        self.size = order.size
+from webull.data.quotes.subscribe.lazy_field import raw_field
+
+
+class BaseOrder:
+    __slots__ = ()
 
     def get_mpid(self):
         return self.mpid
@@ -28,3 +29,19 @@ class Order:
 
     def __str__(self):
         return self.__repr__()
+
+
+class Order(BaseOrder):
+    def __init__(self, order):
+        self.mpid = order.mpid
+        self.size = order.size
+
+
+class LazyOrder(BaseOrder):
+    __slots__ = ('_pb',)
+
+    def __init__(self, order):
+        self._pb = order
+
+    mpid = raw_field('mpid')
+    size = raw_field('size')
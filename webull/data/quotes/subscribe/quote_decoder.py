@@ -15,14 +15,17 @@
 # coding=utf-8
 
 from webull.data.quotes.subscribe.message_pb2 import Quote
-from webull.data.quotes.subscribe.quote_result import QuoteResult
+from webull.data.quotes.subscribe.quote_result import QuoteResult, LazyQuoteResult
+from webull.data.quotes.subscribe.numeric_mode import NUMERIC_MODE_DECIMAL, get_number_converter
 from webull.data.internal.quotes_payload_decoder import BaseQuotesPayloadDecoder
 
 class QuoteDecoder(BaseQuotesPayloadDecoder):
-    def __init__(self):
+    def __init__(self, lazy=False, numeric_mode=NUMERIC_MODE_DECIMAL):
         super().__init__()
+        self._to_number = get_number_converter(numeric_mode)
+        self._result_class = LazyQuoteResult if lazy else QuoteResult
 
     def parse(self, payload):
         quote = Quote()
         quote.ParseFromString(payload)
-        return QuoteResult(quote)
+        return self._result_class(quote, self._to_number)
@@ -14,22 +14,13 @@
 
 # coding=utf-8
 
-from decimal import Decimal
-from webull.data.quotes.subscribe.basic_result import BasicResult
-from webull.data.quotes.subscribe.ask_bid_result import AskBidResult
+from webull.data.quotes.subscribe.basic_result import BasicResult, LazyBasicResult
+from webull.data.quotes.subscribe.ask_bid_result import AskBidResult, LazyAskBidResult
+from webull.data.quotes.subscribe.numeric_mode import to_decimal
 
 
-class QuoteResult:
-    def __init__(self, pb_quote):
-        self.basic = BasicResult(pb_quote.basic)
-        self.asks = []
-        if pb_quote.asks:
-            for ask in pb_quote.asks:
-                self.asks.append(AskBidResult(ask))
-        self.bids = []
-        if pb_quote.bids:
-            for bid in pb_quote.bids:
-                self.bids.append(AskBidResult(bid))
+class BaseQuoteResult:
+    __slots__ = ()
 
     def get_basic(self):
         return self.basic
@@ -45,3 +36,45 @@ class QuoteResult:
 
     def __str__(self):
         return self.__repr__()
+
+
+class QuoteResult(BaseQuoteResult):
+    def __init__(self, pb_quote, to_number=to_decimal):
+        self.basic = BasicResult(pb_quote.basic)
+        self.asks = []
+        if pb_quote.asks:
+            for ask in pb_quote.asks:
+                self.asks.append(AskBidResult(ask, to_number))
+        self.bids = []
+        if pb_quote.bids:
+            for bid in pb_quote.bids:
+                self.bids.append(AskBidResult(bid, to_number))
+
+
+class LazyQuoteResult(BaseQuoteResult):
+    __slots__ = ('_pb', '_to_number', '_basic', '_asks', '_bids')
+
+    def __init__(self, pb_quote, to_number=to_decimal):
+        self._pb = pb_quote
+        self._to_number = to_number
+        self._basic = None
+        self._asks = None
+        self._bids = None
+
+    @property
+    def basic(self):
+        if self._basic is None:
+            self._basic = LazyBasicResult(self._pb.basic)
+        return self._basic
+
+    @property
+    def asks(self):
+        if self._asks is None:
+            self._asks = [LazyAskBidResult(ask, self._to_number) for ask in self._pb.asks]
+        return self._asks
+
+    @property
+    def bids(self):
+        if self._bids is None:
+            self._bids = [LazyAskBidResult(bid, self._to_number) for bid in self._pb.bids]
+        return self._bids
@@ -0,0 +1,163 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+"""
+Columnar batches of pushed snapshot, tick and quote messages.
+
+Each column is a list with one value per message. Timestamps are int (0 when empty),
+prices, sizes and volumes are float (nan when empty), the other fields str.
+QuotesBatch.to_records builds a NumPy structured array from the columns, NumPy is only
+needed for that call.
+"""
+
+import math
+
+from webull.core.exception import error_code
+from webull.core.exception.exceptions import ClientException
+from webull.data.quotes.subscribe.message_pb2 import Quote, Snapshot, Tick
+from webull.data.quotes.subscribe.payload_type import PAYLOAD_TYPE_QUOTE, PAYLOAD_TYPE_SHAPSHOT, PAYLOAD_TYPE_TICK
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_NAN = math.nan
+
+_BASIC_COLUMNS = [
+    ('symbol', 'U32'),
+    ('instrument_id', 'U32'),
+    ('timestamp', 'i8'),
+    ('trading_session', 'U16'),
+]
+
+_SNAPSHOT_NUMBER_FIELDS = ['price', 'open', 'high', 'low', 'pre_close', 'volume', 'change', 'change_ratio',
+                           'ext_price', 'ext_high', 'ext_low', 'ext_volume', 'ext_change', 'ext_change_ratio',
+                           'ovn_price', 'ovn_high', 'ovn_low', 'ovn_volume', 'ovn_change', 'ovn_change_ratio']
+
+_SNAPSHOT_TIME_FIELDS = ['trade_time', 'ext_trade_time', 'ovn_trade_time']
+
+COLUMNS = {
+    PAYLOAD_TYPE_SHAPSHOT: _BASIC_COLUMNS + [(name, 'i8') for name in _SNAPSHOT_TIME_FIELDS]
+    + [(name, 'f8') for name in _SNAPSHOT_NUMBER_FIELDS],
+    PAYLOAD_TYPE_TICK: _BASIC_COLUMNS + [('time', 'i8'), ('price', 'f8'), ('volume', 'f8'), ('side', 'U8')],
+    # top of the book, the number of levels is kept so that an empty side can be told apart
+    PAYLOAD_TYPE_QUOTE: _BASIC_COLUMNS + [('bid_price', 'f8'), ('bid_size', 'f8'), ('bid_levels', 'i4'),
+                                          ('ask_price', 'f8'), ('ask_size', 'f8'), ('ask_levels', 'i4')],
+}
+
+PB_MESSAGES = {
+    PAYLOAD_TYPE_SHAPSHOT: Snapshot,
+    PAYLOAD_TYPE_TICK: Tick,
+    PAYLOAD_TYPE_QUOTE: Quote,
+}
+
+
+def _to_int(value):
+    return int(value) if value else 0
+
+
+def _to_float(value):
+    return float(value) if value else _NAN
+
+
+def _basic_row(pb):
+    basic = pb.basic
+    return [basic.symbol, basic.instrument_id, _to_int(basic.timestamp), basic.trading_session]
+
+
+def _snapshot_row(pb):
+    row = _basic_row(pb)
+    row.extend(_to_int(getattr(pb, name)) for name in _SNAPSHOT_TIME_FIELDS)
+    row.extend(_to_float(getattr(pb, name)) for name in _SNAPSHOT_NUMBER_FIELDS)
+    return row
+
+
+def _tick_row(pb):
+    row = _basic_row(pb)
+    row.extend([_to_int(pb.time), _to_float(pb.price), _to_float(pb.volume), pb.side])
+    return row
+
+
+def _quote_row(pb):
+    row = _basic_row(pb)
+    for levels in (pb.bids, pb.asks):
+        if levels:
+            row.extend([_to_float(levels[0].price), _to_float(levels[0].size), len(levels)])
+        else:
+            row.extend([_NAN, _NAN, 0])
+    return row
+
+
+ROW_BUILDERS = {
+    PAYLOAD_TYPE_SHAPSHOT: _snapshot_row,
+    PAYLOAD_TYPE_TICK: _tick_row,
+    PAYLOAD_TYPE_QUOTE: _quote_row,
+}
+
+
+class QuotesBatch:
+    """
+    Messages of one payload type received during a batching window, stored by column.
+
+    :param payload_type: PAYLOAD_TYPE_SHAPSHOT, PAYLOAD_TYPE_TICK or PAYLOAD_TYPE_QUOTE.
+    :param rows: One list of values per message, in the order of COLUMNS[payload_type].
+    """
+
+    def __init__(self, payload_type, rows):
+        self._payload_type = payload_type
+        self._size = len(rows)
+        names = [name for name, _ in COLUMNS[payload_type]]
+        if rows:
+            self._columns = dict(zip(names, (list(column) for column in zip(*rows))))
+        else:
+            self._columns = {name: [] for name in names}
+
+    @classmethod
+    def from_pb_messages(cls, payload_type, pb_messages):
+        row_builder = ROW_BUILDERS[payload_type]
+        return cls(payload_type, [row_builder(pb) for pb in pb_messages])
+
+    def get_payload_type(self):
+        return self._payload_type
+
+    def get_size(self):
+        return self._size
+
+    def get_columns(self):
+        return self._columns
+
+    def get_column(self, name):
+        return self._columns[name]
+
+    def to_records(self):
+        """Returns the batch as a NumPy structured array, one record per message."""
+        if np is None:
+            raise ClientException(error_code.SDK_INVALID_PARAMETER,
+                                  "numpy is required by QuotesBatch.to_records, install numpy first.")
+        records = np.empty(self._size, dtype=np.dtype(COLUMNS[self._payload_type]))
+        for name, values in self._columns.items():
+            records[name] = values
+        return records
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return "payload_type:%s, size:%s" % (self._payload_type, self._size)
+
+    def __str__(self):
+        return self.__repr__()
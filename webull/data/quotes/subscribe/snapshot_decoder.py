@@ -15,16 +15,19 @@
 # coding=utf-8
 
 from webull.data.quotes.subscribe.message_pb2 import Snapshot
-from webull.data.quotes.subscribe.snapshot_result import SnapshotResult
+from webull.data.quotes.subscribe.snapshot_result import SnapshotResult, LazySnapshotResult
+from webull.data.quotes.subscribe.numeric_mode import NUMERIC_MODE_DECIMAL, get_number_converter
 from webull.data.internal.quotes_payload_decoder import BaseQuotesPayloadDecoder
 
 
 
 class SnapshotDecoder(BaseQuotesPayloadDecoder):
-    def __init__(self):
+    def __init__(self, lazy=False, numeric_mode=NUMERIC_MODE_DECIMAL):
         super().__init__()
+        self._to_number = get_number_converter(numeric_mode)
+        self._result_class = LazySnapshotResult if lazy else SnapshotResult
 
     def parse(self, payload):
         snapshot = Snapshot()
         snapshot.ParseFromString(payload)
-        return SnapshotResult(snapshot)
+        return self._result_class(snapshot, self._to_number)
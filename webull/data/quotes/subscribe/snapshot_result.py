@@ -14,37 +14,13 @@
 
 # coding=utf-8
 
-from decimal import Decimal
-from webull.data.quotes.subscribe.basic_result import BasicResult
+from webull.data.quotes.subscribe.basic_result import BasicResult, LazyBasicResult
+from webull.data.quotes.subscribe.numeric_mode import to_decimal
+from webull.data.quotes.subscribe.lazy_field import number_field, int_field
 
 
-class SnapshotResult:
-    def __init__(self, pb_snapshot):
-        self.basic = BasicResult(pb_snapshot.basic)
-        self.last_trade_time = int(pb_snapshot.trade_time) if pb_snapshot.trade_time else None
-        self.price = Decimal(pb_snapshot.price) if pb_snapshot.price else None
-        self.open = Decimal(pb_snapshot.open) if pb_snapshot.open else None
-        self.high = Decimal(pb_snapshot.high) if pb_snapshot.high else None
-        self.low = Decimal(pb_snapshot.low) if pb_snapshot.low else None
-        self.pre_close = Decimal(pb_snapshot.pre_close) if pb_snapshot.pre_close else None
-        self.close = Decimal(pb_snapshot.open) if pb_snapshot.open else None
-        self.volume = Decimal(pb_snapshot.volume) if pb_snapshot.volume else None
-        self.change = Decimal(pb_snapshot.change) if pb_snapshot.change else None
-        self.change_ratio = Decimal(pb_snapshot.change_ratio) if pb_snapshot.change_ratio else None
-        self.ext_trade_time = int(pb_snapshot.ext_trade_time) if pb_snapshot.ext_trade_time else None
-        self.ext_price = Decimal(pb_snapshot.ext_price) if pb_snapshot.ext_price else None
-        self.ext_high = Decimal(pb_snapshot.ext_high) if pb_snapshot.ext_high else None
-        self.ext_low = Decimal(pb_snapshot.ext_low) if pb_snapshot.ext_low else None
-        self.ext_volume = Decimal(pb_snapshot.ext_volume) if pb_snapshot.ext_volume else None
-        self.ext_change = Decimal(pb_snapshot.ext_change) if pb_snapshot.ext_change else None
-        self.ext_change_ratio = Decimal(pb_snapshot.ext_change_ratio) if pb_snapshot.ext_change_ratio else None
-        self.ovn_trade_time = int(pb_snapshot.ovn_trade_time) if pb_snapshot.ovn_trade_time else None
-        self.ovn_price = Decimal(pb_snapshot.ovn_price) if pb_snapshot.ovn_price else None
-        self.ovn_high = Decimal(pb_snapshot.ovn_high) if pb_snapshot.ovn_high else None
-        self.ovn_low = Decimal(pb_snapshot.ovn_low) if pb_snapshot.ovn_low else None
-        self.ovn_volume = Decimal(pb_snapshot.ovn_volume) if pb_snapshot.ovn_volume else None
-        self.ovn_change = Decimal(pb_snapshot.ovn_change) if pb_snapshot.ovn_change else None
-        self.ovn_change_ratio = Decimal(pb_snapshot.ovn_change_ratio) if pb_snapshot.ovn_change_ratio else None
+class BaseSnapshotResult:
+    __slots__ = ()
 
     def get_basic(self):
         return self.basic
@@ -131,3 +107,73 @@ class SnapshotResult:
 
     def __str__(self):
         return self.__repr__()
+
+
+class SnapshotResult(BaseSnapshotResult):
+    def __init__(self, pb_snapshot, to_number=to_decimal):
+        self.basic = BasicResult(pb_snapshot.basic)
+        self.last_trade_time = int(pb_snapshot.trade_time) if pb_snapshot.trade_time else None
+        self.price = to_number(pb_snapshot.price)
+        self.open = to_number(pb_snapshot.open)
+        self.high = to_number(pb_snapshot.high)
+        self.low = to_number(pb_snapshot.low)
+        self.pre_close = to_number(pb_snapshot.pre_close)
+        self.close = to_number(pb_snapshot.open)
+        self.volume = to_number(pb_snapshot.volume)
+        self.change = to_number(pb_snapshot.change)
+        self.change_ratio = to_number(pb_snapshot.change_ratio)
+        self.ext_trade_time = int(pb_snapshot.ext_trade_time) if pb_snapshot.ext_trade_time else None
+        self.ext_price = to_number(pb_snapshot.ext_price)
+        self.ext_high = to_number(pb_snapshot.ext_high)
+        self.ext_low = to_number(pb_snapshot.ext_low)
+        self.ext_volume = to_number(pb_snapshot.ext_volume)
+        self.ext_change = to_number(pb_snapshot.ext_change)
+        self.ext_change_ratio = to_number(pb_snapshot.ext_change_ratio)
+        self.ovn_trade_time = int(pb_snapshot.ovn_trade_time) if pb_snapshot.ovn_trade_time else None
+        self.ovn_price = to_number(pb_snapshot.ovn_price)
+        self.ovn_high = to_number(pb_snapshot.ovn_high)
+        self.ovn_low = to_number(pb_snapshot.ovn_low)
+        self.ovn_volume = to_number(pb_snapshot.ovn_volume)
+        self.ovn_change = to_number(pb_snapshot.ovn_change)
+        self.ovn_change_ratio = to_number(pb_snapshot.ovn_change_ratio)
+
+
+class LazySnapshotResult(BaseSnapshotResult):
+    __slots__ = ('_pb', '_to_number', '_basic')
+
+    def __init__(self, pb_snapshot, to_number=to_decimal):
+        self._pb = pb_snapshot
+        self._to_number = to_number
+        self._basic = None
+
+    @property
+    def basic(self):
+        if self._basic is None:
+            self._basic = LazyBasicResult(self._pb.basic)
+        return self._basic
+
+    last_trade_time = int_field('trade_time')
+    price = number_field('price')
+    open = number_field('open')
+    high = number_field('high')
+    low = number_field('low')
+    pre_close = number_field('pre_close')
+    # same as SnapshotResult, close is read from the open field
+    close = number_field('open')
+    volume = number_field('volume')
+    change = number_field('change')
+    change_ratio = number_field('change_ratio')
+    ext_trade_time = int_field('ext_trade_time')
+    ext_price = number_field('ext_price')
+    ext_high = number_field('ext_high')
+    ext_low = number_field('ext_low')
+    ext_volume = number_field('ext_volume')
+    ext_change = number_field('ext_change')
+    ext_change_ratio = number_field('ext_change_ratio')
+    ovn_trade_time = int_field('ovn_trade_time')
+    ovn_price = number_field('ovn_price')
+    ovn_high = number_field('ovn_high')
+    ovn_low = number_field('ovn_low')
+    ovn_volume = number_field('ovn_volume')
+    ovn_change = number_field('ovn_change')
+    ovn_change_ratio = number_field('ovn_change_ratio')
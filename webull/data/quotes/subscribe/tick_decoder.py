@@ -15,15 +15,18 @@
 # coding=utf-8
 
 from webull.data.quotes.subscribe.message_pb2 import Tick
-from webull.data.quotes.subscribe.tick_result import TickResult
+from webull.data.quotes.subscribe.tick_result import TickResult, LazyTickResult
+from webull.data.quotes.subscribe.numeric_mode import NUMERIC_MODE_DECIMAL, get_number_converter
 from webull.data.internal.quotes_payload_decoder import BaseQuotesPayloadDecoder
 
 
 class TickDecoder(BaseQuotesPayloadDecoder):
-    def __init__(self):
+    def __init__(self, lazy=False, numeric_mode=NUMERIC_MODE_DECIMAL):
         super().__init__()
+        self._to_number = get_number_converter(numeric_mode)
+        self._result_class = LazyTickResult if lazy else TickResult
 
     def parse(self, payload):
         tick = Tick()
         tick.ParseFromString(payload)
-        return TickResult(tick)
+        return self._result_class(tick, self._to_number)
@@ -12,17 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from decimal import Decimal
-from webull.data.quotes.subscribe.basic_result import BasicResult
+from webull.data.quotes.subscribe.basic_result import BasicResult, LazyBasicResult
+from webull.data.quotes.subscribe.numeric_mode import to_decimal
+from webull.data.quotes.subscribe.lazy_field import number_field, raw_field
 
 
-class TickResult:
-    def __init__(self, pb_tick):
-        self.basic = BasicResult(pb_tick.basic)
-        self.time = pb_tick.time
-        self.price = Decimal(pb_tick.price) if pb_tick.price else None
-        self.volume = pb_tick.volume if pb_tick.volume else None
-        self.side = pb_tick.side if pb_tick.side else None
+class BaseTickResult:
+    __slots__ = ()
 
     def get_basic(self):
         return self.basic
@@ -45,3 +41,32 @@ class TickResult:
 
     def __str__(self):
         return self.__repr__()
+
+
+class TickResult(BaseTickResult):
+    def __init__(self, pb_tick, to_number=to_decimal):
+        self.basic = BasicResult(pb_tick.basic)
+        self.time = pb_tick.time
+        self.price = to_number(pb_tick.price)
+        self.volume = pb_tick.volume if pb_tick.volume else None
+        self.side = pb_tick.side if pb_tick.side else None
+
+
+class LazyTickResult(BaseTickResult):
+    __slots__ = ('_pb', '_to_number', '_basic')
+
+    def __init__(self, pb_tick, to_number=to_decimal):
+        self._pb = pb_tick
+        self._to_number = to_number
+        self._basic = None
+
+    @property
+    def basic(self):
+        if self._basic is None:
+            self._basic = LazyBasicResult(self._pb.basic)
+        return self._basic
+
+    time = raw_field('time')
+    price = number_field('price')
+    volume = raw_field('volume', empty_as_none=True)
+    side = raw_field('side', empty_as_none=True)
@@ -0,0 +1,27 @@
+# Copyright 2022 Webull
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# 	http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# coding=utf-8
+
+from webull.trade.trade_client import TradeClient
+
+
+class AsyncTradeClient(TradeClient):
+    """
+    TradeClient built on an AsyncApiClient, every facade method returns an awaitable, e.g.
+    response = await trade_client.order_v3.place_order(account_id, new_orders)
+    """
+
+    def _get_blocking_client(self, async_api_client):
+        return async_api_client.blocking_client()
@@ -15,6 +15,7 @@
 # coding=utf-8
 
 from json.tool import main
+from webull.core.utils.pagination import iter_records, cursor_from_last_record
 from webull.trade.common.currency import Currency
 from webull.trade.request.get_account_balance_request import AccountBalanceRequest
 from webull.trade.request.get_account_positions_request import AccountPositionsRequest
@@ -69,6 +70,21 @@ class Account:
         response = self.client.get_response(account_positions_request)
         return response
 
+    def iter_account_position(self, account_id, page_size=10, prefetch=True):
+        """
+        Positions of all pages, see :func:`get_account_position`.
+        The next page is fetched while the records of the current one are consumed.
+
+        :param account_id: Account ID
+        :param page_size: Number of entries per page, default value is 10 and the maximum value is 100.
+        :param prefetch: Fetch the next page in the background.
+        :return: Generator of position records.
+        """
+        return iter_records(
+            lambda cursor: self.get_account_position(account_id, page_size, **(cursor or {})),
+            cursor_from_last_record({'last_instrument_id': 'instrument_id'}),
+            prefetch, self.client)
+
     def get_app_subscriptions(self, subscription_id=None):
         """
         Paginate to query the account list and return account information.
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from webull.core.utils.pagination import iter_records, cursor_from_last_record
 from webull.trade.request.get_trade_instrument_detail_request import TradeInstrumentDetailRequest
 from webull.trade.request.get_trade_security_detail_request import TradeSecurityDetailRequest
 from webull.trade.request.get_tradeable_instruments_request import TradeableInstrumentRequest
@@ -70,3 +71,19 @@ class TradeInstrument:
         tradeable_instruments_request.set_page_size(page_size)
         response = self.client.get_response(tradeable_instruments_request)
         return response
+
+    def iter_tradeable_instruments(self, page_size=10, prefetch=True):
+        """
+        Only for Webull JP
+
+        Tradable instruments of all pages, see :func:`get_tradeable_instruments`.
+        The next page is fetched while the records of the current one are consumed.
+
+        :param page_size: Number of entries per page, default value is 10 and the maximum value is 100.
+        :param prefetch: Fetch the next page in the background.
+        :return: Generator of instrument records.
+        """
+        return iter_records(
+            lambda cursor: self.get_tradeable_instruments(page_size=page_size, **(cursor or {})),
+            cursor_from_last_record({'last_instrument_id': 'instrument_id'}),
+            prefetch, self.client)
@@ -13,6 +13,7 @@
 # limitations under the License.
 # coding=utf-8
 
+from webull.core.utils.pagination import iter_records, cursor_from_last_record
 from webull.trade.request.v2.get_account_balance_request import AccountBalanceRequest
 from webull.trade.request.v2.get_account_list_request import GetAccountListRequest
 from webull.trade.request.v2.get_account_position_details_request import AccountPositionDetailsRequest
@@ -64,3 +65,20 @@ class AccountV2:
         account_position_details_request.set_last_id(last_id)
         response = self.client.get_response(account_position_details_request)
         return response
+
+    def iter_account_position_details(self, account_id, instrument_id, page_size=None, prefetch=True):
+        """
+        Position details of all pages, see :func:`get_account_position_details`.
+        The next page is fetched while the records of the current one are consumed.
+
+        :param account_id: Account ID
+        :param instrument_id: Instrument ID
+        :param page_size: Number of records per query, 10 by default.
+        :param prefetch: Fetch the next page in the background.
+        :return: Generator of position detail records.
+        """
+        return iter_records(
+            lambda cursor: self.get_account_position_details(account_id, instrument_id, page_size,
+                                                             **(cursor or {})),
+            cursor_from_last_record({'last_id': 'id'}),
+            prefetch, self.client)
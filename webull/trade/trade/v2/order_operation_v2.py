@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # coding=utf-8
+from webull.core.utils.pagination import iter_records, cursor_from_last_record
 from webull.trade.request.v2.cancel_option_request import CancelOptionRequest
 from webull.trade.request.v2.cancel_order_request import CancelOrderRequest
 from webull.trade.request.v2.get_order_detail_request import OrderDetailRequest
@@ -189,6 +190,37 @@ class OrderOperationV2:
         response = self.client.get_response(order_open_request)
         return response
 
+    def iter_order_history(self, account_id, page_size=None, start_date=None, end_date=None, prefetch=True):
+        """
+        Historical orders of all pages, see :func:`get_order_history`.
+        The next page is fetched while the records of the current one are consumed.
+
+        :param account_id: Account ID
+        :param page_size: Number of records per query, 10 by default.
+        :param start_date: Start date (if empty, the default is the last 7 days), in the format of yyyy-MM-dd.
+        :param end_date: End date (if empty, the default is the last 7 days), in the format of yyyy-MM-dd.
+        :param prefetch: Fetch the next page in the background.
+        :return: Generator of order records.
+        """
+        return iter_records(
+            lambda cursor: self.get_order_history(account_id, page_size, start_date, end_date, **(cursor or {})),
+            cursor_from_last_record({'last_client_order_id': 'client_order_id', 'last_order_id': 'order_id'}),
+            prefetch, self.client)
+
+    def iter_order_open(self, account_id, page_size=None, prefetch=True):
+        """
+        Pending orders of all pages, see :func:`get_order_open`.
+
+        :param account_id: Account ID
+        :param page_size: Number of records per query, 10 by default.
+        :param prefetch: Fetch the next page in the background.
+        :return: Generator of order records.
+        """
+        return iter_records(
+            lambda cursor: self.get_order_open(account_id, page_size, **(cursor or {})),
+            cursor_from_last_record({'last_client_order_id': 'client_order_id', 'last_order_id': 'order_id'}),
+            prefetch, self.client)
+
     def query_order_detail(self, account_id, client_order_id):
         """
         Deprecated. Use :func:`get_order_detail` instead.
@@ -250,4 +282,4 @@ class OrderOperationV2:
         cancel_option_request.set_client_order_id(client_order_id)
         cancel_option_request.set_account_id(account_id)
         response = self.client.get_response(cancel_option_request)
-        return response
\ No newline at end of file
+        return response
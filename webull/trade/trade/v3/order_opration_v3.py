@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # coding=utf-8
+from webull.core.utils.pagination import iter_records, cursor_from_last_record
 from webull.trade.request.v3.preview_order_request import PreviewOrderRequest
 from webull.trade.request.v3.place_order_request import PlaceOrderRequest
 from webull.trade.request.v3.batch_place_order_request import BatchPlaceOrderRequest
@@ -125,6 +126,23 @@ class OrderOperationV3:
         response = self.client.get_response(order_history_request)
         return response
 
+    def iter_order_history(self, account_id, page_size=None, start_date=None, end_date=None, prefetch=True):
+        """
+        Historical orders of all pages, see :func:`get_order_history`.
+        The next page is fetched while the records of the current one are consumed.
+
+        :param account_id: Account ID
+        :param page_size: Number of records per query, 10 by default.
+        :param start_date: Start date (if empty, the default is the last 7 days), in the format of yyyy-MM-dd.
+        :param end_date: End date (if empty, the default is the last 7 days), in the format of yyyy-MM-dd.
+        :param prefetch: Fetch the next page in the background.
+        :return: Generator of order records.
+        """
+        return iter_records(
+            lambda cursor: self.get_order_history(account_id, page_size, start_date, end_date, **(cursor or {})),
+            cursor_from_last_record({'last_client_order_id': 'client_order_id'}),
+            prefetch, self.client)
+
     def get_order_open(self, account_id, page_size=None, last_client_order_id=None):
         """
         This interface is currently supported only for Webull HK, Webull US, Webull JP, Webull SG, Webull TH, Webull AU, Webull MY, Webull UK, Webull BR, Webull MX, Webull ZA, Webull EU.
@@ -25,9 +25,16 @@ from webull.trade.trade.v3.order_opration_v3 import OrderOperationV3
 
 
 class TradeClient:
-    def __init__(self, api_client):
+    def __init__(self, api_client, reference_cache_path=None):
+        """
+        :param api_client: webull.core.client.ApiClient
+        :param reference_cache_path: SQLite file keeping reference data responses across restarts,
+        see ApiClient.enable_reference_cache.
+        """
         self._init_logger(api_client)
-        ClientInitializer.initializer(api_client)
+        if reference_cache_path:
+            api_client.enable_reference_cache(reference_cache_path)
+        ClientInitializer.initializer(self._get_blocking_client(api_client))
         self.account = Account(api_client)
         self.account_v2 = AccountV2(api_client)
         self.order = OrderOperation(api_client)
@@ -36,6 +43,9 @@ class TradeClient:
         self.trade_instrument = TradeInstrument(api_client)
         self.trade_calendar = TradeCalendar(api_client)
 
+    def _get_blocking_client(self, api_client):
+        return api_client
+
     def _init_logger(self, api_client):
         # No logger configured, using default console and local file logging.
         if not getattr(api_client, '_stream_logger_set', False) and not getattr(api_client, '_file_logger_set', False):